@@ -9,12 +9,93 @@ import sys
 import subprocess
 import os
 import time
-import json
+import argparse
+import importlib.util
+import shlex
+import tempfile
+import threading
 from datetime import datetime
-from PyQt5.QtWidgets import *
-from PyQt5.QtCore import *
-from PyQt5.QtGui import *
-import qdarkstyle
+
+class StartupProfile:
+    """Açılış adımlarının süresi (--startup-profile)"""
+    
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.last = self.start
+        self.steps = []
+        
+    def mark(self, step):
+        now = time.perf_counter()
+        self.steps.append((step, now - self.last))
+        self.last = now
+        
+    def report(self):
+        lines = ["⏱️ Açılış profili (adım / başlangıçtan itibaren):"]
+        elapsed = 0.0
+        for step, spent in self.steps:
+            elapsed += spent
+            lines.append(f"   {step:<26} {spent * 1000:8.1f} ms {elapsed * 1000:8.1f} ms")
+        return "\n".join(lines)
+
+STARTUP = StartupProfile()
+
+from PyQt5.QtWidgets import (
+    QApplication, QCheckBox, QComboBox, QDialog, QHBoxLayout, QLabel,
+    QMainWindow, QPlainTextEdit, QPushButton, QTableView, QVBoxLayout, QWidget,
+)
+from PyQt5.QtCore import (
+    QAbstractTableModel, QModelIndex, QObject, QRunnable, QSortFilterProxyModel,
+    QThreadPool, QTimer, Qt, pyqtSignal,
+)
+from PyQt5.QtGui import QColor
+STARTUP.mark("PyQt5 import")
+
+from checker_buildcache import NextCacheStore
+from checker_cache import ResultCache, cache_dir
+from checker_history import TIMEOUT_FACTOR, History
+from checker_runner import CommandCancelled, OutputLog, run_streaming
+from checker_daemon import DaemonUnavailable, ensure_daemon, is_running, run_daemon_check
+from checker_lint import fixes_sources, lint_args, plan_lint
+from checker_toolchain import resolve_toolchain
+from checker_trace import Tracer
+from checker_watch import LINT_INPUTS, TYPECHECK_INPUTS, FileWatcher, is_affected
+STARTUP.mark("checker modülleri import")
+
+# Log panelinde tutulacak en fazla satır ve tam çıktı penceresinde gösterilecek boyut
+LOG_MAX_BLOCKS = 5000
+LOG_VIEW_BYTES = 8 * 1024 * 1024
+
+def load_dark_stylesheet(project_root):
+    """qdarkstyle temasını önbellekten oku; yoksa bir kez derleyip kaydet
+
+    Kayıtlı kopyada simgeler Qt kaynakları yerine paket dizinindeki
+    dosyalara yönlenir, böylece sonraki açılışlarda qdarkstyle hiç
+    import edilmez. Paket güncellenince (mtime değişir) yeniden derlenir.
+    """
+    spec = importlib.util.find_spec("qdarkstyle")
+    if spec is None or not spec.submodule_search_locations:
+        return ""
+    package_dir = list(spec.submodule_search_locations)[0]
+    path = os.path.join(cache_dir(project_root, "theme"),
+                        f"qdarkstyle-{int(os.stat(spec.origin).st_mtime)}.qss")
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        pass
+
+    import qdarkstyle
+    stylesheet = qdarkstyle.load_stylesheet_pyqt5().replace(
+        ":/qss_icons/", package_dir.replace(os.sep, "/") + "/")
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(stylesheet)
+        os.replace(tmp_path, path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return stylesheet
 
 class Colors:
     """Renk paleti"""
@@ -47,32 +128,216 @@ class GlassmorphismWidget(QWidget):
 class TestResult:
     """Test sonuçları için sınıf"""
     
-    def __init__(self, name, status, duration, output="", error=""):
+    def __init__(self, name, status, duration, output="", error="", cached=False, log_path=None):
         self.name = name
         self.status = status  # "success", "error", "warning"
         self.duration = duration
         self.output = output
         self.error = error
+        self.cached = cached  # Sonuç önbellekten mi geldi
+        self.log_path = log_path  # Tam çıktının diske yazıldığı dosya
         self.timestamp = datetime.now()
 
+class LogSink(QObject):
+    """Log satırlarını biriktirip zamanlayıcıyla toplu halde yazar
+    
+    Her satır için ayrı widget güncellemesi yerine interval_ms'de bir
+    tek appendPlainText yapılır. Kullanıcı yukarı kaydırdıysa görünüm
+    en alta çekilmez.
+    """
+    
+    def __init__(self, view, interval_ms=100, parent=None):
+        super().__init__(parent)
+        self.view = view
+        self.pending = []
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self.flush)
+        
+    def write(self, text):
+        self.write_lines([text])
+        
+    def write_lines(self, lines):
+        self.pending.extend(lines)
+        # Blok sınırı zaten atacağı satırları widget'a hiç yazma
+        limit = self.view.maximumBlockCount()
+        if limit and len(self.pending) > 2 * limit:
+            del self.pending[:-limit]
+        if not self.timer.isActive():
+            self.timer.start()
+            
+    def flush(self):
+        if not self.pending:
+            return
+        text = "\n".join(self.pending)
+        self.pending = []
+        scrollbar = self.view.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 4
+        self.view.appendPlainText(text)
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+            
+    def clear(self):
+        self.pending = []
+        self.view.clear()
+
+class ResultTableModel(QAbstractTableModel):
+    """Sonuç tablosu modeli: satır başına sadece görünen alanlar saklanır
+    
+    Yeni sonuç sadece rowsInserted yayar; max_rows aşılınca en eski
+    satırlar parça parça atılır.
+    """
+    
+    COLUMNS = ["Test", "Durum", "Süre", "Zaman", "Detay"]
+    STATUS_TEXT = {"success": "✅ Başarılı", "error": "❌ Hata", "warning": "⚠️ Uyarı"}
+    # Satır: (test adı, durum, süre, zaman, detay, tam çıktı dosyası)
+    NAME, STATUS, DURATION, TIMESTAMP, DETAIL, LOG_PATH = range(6)
+    
+    def __init__(self, max_rows=2000, parent=None):
+        super().__init__(parent)
+        self.max_rows = max_rows
+        self.rows = []
+        self.status_colors = {
+            "success": QColor(Colors.SUCCESS),
+            "error": QColor(Colors.ERROR),
+            "warning": QColor(Colors.WARNING),
+        }
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+        
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section]
+        return None
+        
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self.rows[index.row()]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == self.STATUS:
+                return self.STATUS_TEXT.get(row[self.STATUS], "⚠️ Uyarı")
+            if column == self.DURATION:
+                return f"{row[self.DURATION]:.2f}s"
+            if column == self.TIMESTAMP:
+                return row[self.TIMESTAMP].strftime("%H:%M:%S")
+            return row[column]
+        if role == Qt.UserRole:
+            # Sıralama anahtarı: süre ve zaman sayı olarak karşılaştırılsın
+            if column == self.TIMESTAMP:
+                return row[self.TIMESTAMP].timestamp()
+            return row[column]
+        if role == Qt.ToolTipRole and row[self.LOG_PATH]:
+            return "Tam çıktı için çift tıklayın"
+        if role == Qt.BackgroundRole and column == self.STATUS:
+            return self.status_colors.get(row[self.STATUS], self.status_colors["warning"])
+        return None
+        
+    def add_result(self, result):
+        """Sonucu sona ekle (tam çıktı tabloda tutulmaz)"""
+        
+        detail = result.output[:50] + "..." if len(result.output) > 50 else result.output
+        position = len(self.rows)
+        self.beginInsertRows(QModelIndex(), position, position)
+        self.rows.append((result.name, result.status, result.duration, result.timestamp, detail,
+                          result.log_path))
+        self.endInsertRows()
+        
+        # Her eklemede kaydırmamak için sınır %10 aşılınca topluca buda
+        excess = len(self.rows) - self.max_rows
+        if excess > 0 and excess >= max(1, self.max_rows // 10):
+            self.beginRemoveRows(QModelIndex(), 0, excess - 1)
+            del self.rows[:excess]
+            self.endRemoveRows()
+            
+    def log_path(self, row):
+        return self.rows[row][self.LOG_PATH]
+        
+    def clear(self):
+        self.beginResetModel()
+        self.rows = []
+        self.endResetModel()
+
+class ResultFilterProxy(QSortFilterProxyModel):
+    """Sonuçları duruma ve test adına göre süz"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.status_filter = None  # None = hepsi
+        self.test_filter = None
+        self.setSortRole(Qt.UserRole)
+        
+    def set_filters(self, status=None, test=None):
+        self.status_filter = status
+        self.test_filter = test
+        self.invalidateFilter()
+        
+    def filterAcceptsRow(self, source_row, source_parent):
+        row = self.sourceModel().rows[source_row]
+        if self.status_filter and row[ResultTableModel.STATUS] != self.status_filter:
+            return False
+        if self.test_filter and row[ResultTableModel.NAME] != self.test_filter:
+            return False
+        return True
+
 class AkilhaneCheckerGUI(QMainWindow):
     """Ana GUI sınıfı"""
     
-    def __init__(self):
+    # Sonuç ve log panelleri ilk çizimden sonra kurulunca
+    panels_ready = pyqtSignal()
+    
+    def __init__(self, trace_dir=None, timeout_factor=TIMEOUT_FACTOR):
         super().__init__()
         self.setWindowTitle("🧠 AkılHane Checker - GUI Version")
         self.setGeometry(100, 100, 1200, 800)
         
         # Dark mode varsayılan
         self.dark_mode = True
-        self.test_results = []
+        self.dark_stylesheet = None  # İlk kullanımda önbellekten okunur
+        self.panels_built = False
+        self.panels_scheduled = False
+        self.results_model = ResultTableModel()
         self.current_test = None
         
+        # İş havuzu: testler sıraya alınır, en fazla N tanesi aynı anda çalışır.
+        # Worker'lar alt süreç bekler, bu yüzden sınır CPU değil test sayısı
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(len(TestJob.TESTS))
+        self.jobs = {}  # test tipi -> bekleyen/çalışan TestJob
+        self.running_tests = set()
+        self.stale_tests = set()  # Canlı izlemede bayatlayıp yeniden çalışacak testler
+        self.after_fix = []  # Lint --fix dosyaları yeniden yazarken bekletilen testler
+        
+        # Adım süreleri ve kaynak kullanımı; --trace verildiyse pencere kapanınca yazılır
+        self.trace_dir = trace_dir
+        self.tracer = Tracer()
+        self.timeout_factor = timeout_factor
+        
+        # Canlı izleme (dosya değişikliğinde otomatik test)
+        self.watch_signals = WatchSignals()
+        self.watch_signals.changed.connect(self.on_files_changed)
+        self.watch_stop = None
+        
         # Proje kök dizinini bul
         self.project_root = self.find_project_root()
         
+        # Araç yollarını oturum başına bir kez çöz (her testte değil)
+        self.toolchain = resolve_toolchain(self.project_root)
+        STARTUP.mark("araç yolları")
+        
+        # Her test sonucu commit'iyle birlikte .akilhane-cache/history.db'ye yazılır
+        self.history = History(self.project_root)
+        
         self.init_ui()
+        STARTUP.mark("pencere (başlık + kontrol)")
         self.apply_theme()
+        STARTUP.mark("tema")
         
     def find_project_root(self):
         """Proje kök dizinini bul"""
@@ -91,84 +356,6 @@ class AkilhaneCheckerGUI(QMainWindow):
         # Bulunamazsa mevcut dizini kullan
         return os.getcwd()
         
-    def find_node_path(self):
-        """Node.js yolunu bul"""
-        
-        # Yaygın Node.js kurulum yolları
-        possible_paths = [
-            r"C:\Program Files\nodejs\node.exe",
-            r"C:\Program Files (x86)\nodejs\node.exe",
-            r"C:\Users\{}\AppData\Roaming\npm\node.exe".format(os.getenv('USERNAME', '')),
-            r"C:\Users\{}\AppData\Local\Programs\nodejs\node.exe".format(os.getenv('USERNAME', '')),
-        ]
-        
-        # PATH'ten node'u ara
-        try:
-            result = subprocess.run(["where", "node"], capture_output=True, text=True)
-            if result.returncode == 0:
-                return result.stdout.strip().split('\n')[0]
-        except:
-            pass
-        
-        # Olası yollardan birini dene
-        for path in possible_paths:
-            if os.path.exists(path):
-                return path
-                
-        return None
-        
-    def find_npm_path(self):
-        """npm yolunu bul"""
-        
-        # Yaygın npm kurulum yolları
-        possible_paths = [
-            r"C:\Program Files\nodejs\npm.cmd",
-            r"C:\Program Files (x86)\nodejs\npm.cmd",
-            r"C:\Users\{}\AppData\Roaming\npm\npm.cmd".format(os.getenv('USERNAME', '')),
-            r"C:\Users\{}\AppData\Local\Programs\nodejs\npm.cmd".format(os.getenv('USERNAME', '')),
-        ]
-        
-        # PATH'ten npm'i ara
-        try:
-            result = subprocess.run(["where", "npm"], capture_output=True, text=True)
-            if result.returncode == 0:
-                return result.stdout.strip().split('\n')[0]
-        except:
-            pass
-        
-        # Olası yollardan birini dene
-        for path in possible_paths:
-            if os.path.exists(path):
-                return path
-                
-        return None
-        
-    def find_npx_path(self):
-        """npx yolunu bul"""
-        
-        # Yaygın npx kurulum yolları
-        possible_paths = [
-            r"C:\Program Files\nodejs\npx.cmd",
-            r"C:\Program Files (x86)\nodejs\npx.cmd",
-            r"C:\Users\{}\AppData\Roaming\npm\npx.cmd".format(os.getenv('USERNAME', '')),
-            r"C:\Users\{}\AppData\Local\Programs\nodejs\npx.cmd".format(os.getenv('USERNAME', '')),
-        ]
-        
-        # PATH'ten npx'i ara
-        try:
-            result = subprocess.run(["where", "npx"], capture_output=True, text=True)
-            if result.returncode == 0:
-                return result.stdout.strip().split('\n')[0]
-        except:
-            pass
-        
-        # Olası yollardan birini dene
-        for path in possible_paths:
-            if os.path.exists(path):
-                return path
-                
-        return None
-        
     def init_ui(self):
         """UI bileşenlerini başlat"""
         
@@ -177,25 +364,42 @@ class AkilhaneCheckerGUI(QMainWindow):
         self.setCentralWidget(central_widget)
         
         # Ana layout
-        main_layout = QVBoxLayout(central_widget)
-        main_layout.setSpacing(20)
-        main_layout.setContentsMargins(20, 20, 20, 20)
+        self.main_layout = QVBoxLayout(central_widget)
+        self.main_layout.setSpacing(20)
+        self.main_layout.setContentsMargins(20, 20, 20, 20)
         
         # Header
-        self.create_header(main_layout)
+        self.create_header(self.main_layout)
         
         # Kontrol paneli
-        self.create_control_panel(main_layout)
-        
-        # Test sonuçları
-        self.create_results_panel(main_layout)
+        self.create_control_panel(self.main_layout)
         
-        # Log paneli
-        self.create_log_panel(main_layout)
+        # Sonuç ve log panelleri pencere ilk kez çizildikten sonra kurulur
+        # (build_panels)
         
         # Status bar
         self.statusBar().showMessage(f"Hazır - Proje: {self.project_root}")
         
+    def paintEvent(self, event):
+        """İlk çizimden sonra kalan panelleri kur"""
+        
+        super().paintEvent(event)
+        if not self.panels_scheduled:
+            self.panels_scheduled = True
+            STARTUP.mark("ilk çizim")
+            QTimer.singleShot(0, self.build_panels)
+            
+    def build_panels(self):
+        """Test sonuçları ve log panelleri (ertelenmiş)"""
+        
+        if self.panels_built:
+            return
+        self.panels_built = True
+        self.create_results_panel(self.main_layout)
+        self.create_log_panel(self.main_layout)
+        STARTUP.mark("sonuç + log panelleri")
+        self.panels_ready.emit()
+        
     def create_header(self, parent_layout):
         """Header bölümü"""
         
@@ -279,6 +483,11 @@ class AkilhaneCheckerGUI(QMainWindow):
         self.all_btn.clicked.connect(self.run_all_tests)
         self.all_btn.setStyleSheet(self.get_button_style("success"))
         
+        # İptal
+        self.cancel_btn = QPushButton("⛔ İptal")
+        self.cancel_btn.clicked.connect(self.cancel_tests)
+        self.cancel_btn.setStyleSheet(self.get_button_style("error"))
+        
         # Temizle
         self.clear_btn = QPushButton("🗑️ Temizle")
         self.clear_btn.clicked.connect(self.clear_results)
@@ -288,9 +497,30 @@ class AkilhaneCheckerGUI(QMainWindow):
         button_layout.addWidget(self.ts_btn)
         button_layout.addWidget(self.build_btn)
         button_layout.addWidget(self.all_btn)
+        button_layout.addWidget(self.cancel_btn)
         button_layout.addWidget(self.clear_btn)
         
         control_layout.addLayout(button_layout)
+        
+        option_layout = QHBoxLayout()
+        
+        # Daemon: Lint/TypeScript açık tutulan tsc --watch ve ESLint süreçlerinde
+        self.daemon_check = QCheckBox("⚡ Daemon (sıcak tsc/ESLint)")
+        self.daemon_check.setChecked(is_running(self.project_root))
+        self.daemon_check.toggled.connect(self.toggle_daemon)
+        
+        # Canlı izleme: kaydedilen dosyadan etkilenen testler kendiliğinden çalışır
+        self.watch_check = QCheckBox("👀 Canlı izleme")
+        self.watch_check.toggled.connect(self.toggle_watch)
+        
+        # Sadece git'e göre değişen dosyaları lint et (config değiştiyse tam lint)
+        self.changed_check = QCheckBox("🎯 Sadece değişen dosyaları lint et")
+        
+        option_layout.addWidget(self.daemon_check)
+        option_layout.addWidget(self.watch_check)
+        option_layout.addWidget(self.changed_check)
+        option_layout.addStretch()
+        control_layout.addLayout(option_layout)
         parent_layout.addWidget(control_widget)
         
     def create_results_panel(self, parent_layout):
@@ -304,14 +534,34 @@ class AkilhaneCheckerGUI(QMainWindow):
         results_title.setStyleSheet("font-size: 18px; font-weight: bold; margin-bottom: 10px;")
         results_layout.addWidget(results_title)
         
-        # Sonuçlar tablosu
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(5)
-        self.results_table.setHorizontalHeaderLabels([
-            "Test", "Durum", "Süre", "Zaman", "Detay"
-        ])
+        # Süzgeçler
+        filter_layout = QHBoxLayout()
+        self.status_filter = QComboBox()
+        self.status_filter.addItem("Tüm durumlar", None)
+        for status, text in ResultTableModel.STATUS_TEXT.items():
+            self.status_filter.addItem(text, status)
+        self.test_filter = QComboBox()
+        self.test_filter.addItem("Tüm testler", None)
+        for name, *_ in TestJob.TESTS.values():
+            self.test_filter.addItem(name, name)
+        self.status_filter.currentIndexChanged.connect(self.apply_result_filters)
+        self.test_filter.currentIndexChanged.connect(self.apply_result_filters)
+        filter_layout.addWidget(self.status_filter)
+        filter_layout.addWidget(self.test_filter)
+        filter_layout.addStretch()
+        results_layout.addLayout(filter_layout)
+        
+        # Sonuçlar tablosu: model -> süzgeç/sıralama proxy'si -> görünüm
+        self.results_proxy = ResultFilterProxy(self)
+        self.results_proxy.setSourceModel(self.results_model)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_proxy)
+        # Başlığa tıklanana kadar ekleme sırası korunur
+        self.results_table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.results_table.setSortingEnabled(True)
+        self.results_table.doubleClicked.connect(self.show_full_output)
         self.results_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background: rgba(255, 255, 255, 0.05);
                 border: 1px solid rgba(255, 255, 255, 0.1);
                 border-radius: 8px;
@@ -336,6 +586,39 @@ class AkilhaneCheckerGUI(QMainWindow):
         results_layout.addWidget(self.results_table)
         parent_layout.addWidget(results_widget)
         
+    def show_full_output(self, index):
+        """Satırın diske yazılmış tam çıktısını ayrı pencerede göster"""
+        
+        row = self.results_proxy.mapToSource(index).row()
+        path = self.results_model.log_path(row)
+        try:
+            size = os.path.getsize(path) if path else -1
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                # Çok büyük dosyada sadece son kısım
+                if size > LOG_VIEW_BYTES:
+                    f.seek(size - LOG_VIEW_BYTES)
+                    f.readline()
+                text = f.read()
+        except (OSError, TypeError):
+            self.statusBar().showMessage("Tam çıktı bulunamadı (silinmiş olabilir)")
+            return
+        if size > LOG_VIEW_BYTES:
+            text = f"... (ilk {(size - LOG_VIEW_BYTES) // 1024} KB gösterilmiyor)\n{text}"
+            
+        dialog = QDialog(self)
+        dialog.setWindowTitle(f"📄 {os.path.basename(path)}")
+        dialog.resize(900, 600)
+        viewer = QPlainTextEdit(dialog)
+        viewer.setReadOnly(True)
+        viewer.setPlainText(text)
+        QVBoxLayout(dialog).addWidget(viewer)
+        dialog.show()
+        
+    def apply_result_filters(self):
+        """Durum/test süzgeçlerini tabloya uygula"""
+        
+        self.results_proxy.set_filters(self.status_filter.currentData(), self.test_filter.currentData())
+        
     def create_log_panel(self, parent_layout):
         """Log paneli"""
         
@@ -347,11 +630,14 @@ class AkilhaneCheckerGUI(QMainWindow):
         log_title.setStyleSheet("font-size: 18px; font-weight: bold; margin-bottom: 10px;")
         log_layout.addWidget(log_title)
         
-        # Log text area
-        self.log_text = QTextEdit()
+        # Log alanı: satır (blok) sınırı aşılınca en eski satırlar düşer
+        self.log_text = QPlainTextEdit()
+        self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(LOG_MAX_BLOCKS)
         self.log_text.setMaximumHeight(200)
+        self.log_sink = LogSink(self.log_text, parent=self)
         self.log_text.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background: rgba(255, 255, 255, 0.05);
                 border: 1px solid rgba(255, 255, 255, 0.1);
                 border-radius: 8px;
@@ -399,7 +685,9 @@ class AkilhaneCheckerGUI(QMainWindow):
         """Tema uygula"""
         
         if self.dark_mode:
-            self.setStyleSheet(qdarkstyle.load_stylesheet_pyqt5())
+            if self.dark_stylesheet is None:
+                self.dark_stylesheet = load_dark_stylesheet(self.project_root)
+            self.setStyleSheet(self.dark_stylesheet)
             self.theme_btn.setText("🌙 Dark Mode")
         else:
             self.setStyleSheet("")
@@ -411,88 +699,189 @@ class AkilhaneCheckerGUI(QMainWindow):
         self.dark_mode = not self.dark_mode
         self.apply_theme()
         
+    def toggle_daemon(self, checked):
+        """Daemon kullanımını aç/kapat (kapatmak daemon'u durdurmaz)"""
+        
+        if not checked:
+            self.statusBar().showMessage("Daemon kullanılmıyor")
+            return
+        self.statusBar().showMessage("Daemon başlatılıyor...")
+        if ensure_daemon(self.project_root):
+            self.statusBar().showMessage("⚡ Daemon hazır")
+        else:
+            self.daemon_check.setChecked(False)
+            self.statusBar().showMessage("Daemon başlatılamadı, bkz. .akilhane-cache/daemon.log")
+            
+    def toggle_watch(self, checked):
+        """Dosya izleyicisini başlat/durdur"""
+        
+        if self.watch_stop is not None:
+            self.watch_stop.set()
+            self.watch_stop = None
+        if not checked:
+            self.statusBar().showMessage("Canlı izleme kapalı")
+            return
+        
+        watcher = FileWatcher(self.project_root)
+        stop = threading.Event()
+        
+        def loop():
+            try:
+                while not stop.is_set():
+                    changed = watcher.wait_for_changes(timeout=0.5)
+                    if changed and not stop.is_set():
+                        self.watch_signals.changed.emit(changed)
+            finally:
+                watcher.close()
+        
+        self.watch_stop = stop
+        threading.Thread(target=loop, daemon=True).start()
+        self.statusBar().showMessage(f"👀 Canlı izleme açık ({watcher.mode})")
+        
+    def on_files_changed(self, changed):
+        """Değişen dosyalardan etkilenen testleri (yeniden) çalıştır"""
+        
+        affected = [t for t in TestJob.TESTS if is_affected(TestJob.INPUTS.get(t), changed)]
+        if not affected:
+            return
+        shown = ", ".join(sorted(changed)[:5]) + (" ..." if len(changed) > 5 else "")
+        self.log_sink.write(f"🔁 Değişiklik: {shown} -> {', '.join(t.upper() for t in affected)}")
+        for test_type in affected:
+            if test_type in self.after_fix:
+                continue
+            if test_type in self.jobs:
+                # Süren test bayatladı: iptal et, bitince yeniden başlat
+                self.stale_tests.add(test_type)
+                self.cancel_test(test_type)
+            else:
+                self.run_test(test_type)
+                
     def run_test(self, test_type):
-        """Test çalıştır"""
+        """Test çalıştır
+        
+        Lint --fix ile sadece başka test çalışmıyorsa çalışır; düzeltme
+        sürerken gönderilen testler lint bitince başlar.
+        """
         
+        if test_type in self.jobs or test_type in self.after_fix:
+            self.statusBar().showMessage(f"{test_type.upper()} testi zaten sırada/çalışıyor")
+            return
+        lint_job = self.jobs.get("lint")
+        if lint_job is not None and lint_job.fix:
+            # tsc/build, --fix'in yarıda yeniden yazdığı dosyaları okumasın
+            self.after_fix.append(test_type)
+            self.update_progress_status()
+            return
+            
         self.current_test = test_type
-        self.statusBar().showMessage(f"{test_type.upper()} testi çalışıyor...")
         
-        # Thread'de çalıştır
-        self.test_thread = TestThread(test_type, self.project_root)
-        self.test_thread.result_ready.connect(self.on_test_complete)
-        self.test_thread.start()
+        # Havuza gönder; boş worker yoksa sırada bekler
+        job = TestJob(test_type, self.project_root, self.toolchain,
+                      use_daemon=self.daemon_check.isChecked(),
+                      changed_only=self.changed_check.isChecked(),
+                      tracer=self.tracer, history=self.history,
+                      timeout_factor=self.timeout_factor,
+                      fix=not self.jobs)
+        job.signals.started.connect(self.on_test_started)
+        job.signals.output_lines.connect(self.append_live_output)
+        job.signals.result_ready.connect(self.on_test_complete)
+        self.jobs[test_type] = job
+        self.pool.start(job)
+        self.update_progress_status()
         
     def run_all_tests(self):
         """Tüm testleri çalıştır"""
         
-        self.statusBar().showMessage("Tüm testler çalışıyor...")
-        
-        # Sırayla çalıştır
-        tests = ["lint", "typescript", "build"]
-        self.test_queue = tests.copy()
-        self.run_next_test()
+        # Lint --fix önce çalışır, diğerleri düzeltilmiş dosyalarla birlikte
+        # başlar; her biri bittiğinde ayrı raporlanır
+        for test in TestJob.TESTS:
+            self.run_test(test)
+            
+    def cancel_tests(self):
+        """Bekleyen ve çalışan testleri iptal et"""
         
-    def run_next_test(self):
-        """Sıradaki testi çalıştır"""
+        self.stale_tests.clear()
+        self.after_fix.clear()
+        for test_type in list(self.jobs):
+            self.cancel_test(test_type)
+            
+    def cancel_test(self, test_type):
+        """Tek bir testi sıradan çıkar ya da çalışıyorsa durdur"""
         
-        if self.test_queue:
-            test = self.test_queue.pop(0)
-            self.run_test(test)
+        job = self.jobs[test_type]
+        if self.pool.tryTake(job):
+            # Henüz başlamamıştı, sonucu burada üret
+            self.on_test_complete(test_type, TestResult(job.name, "warning", 0, "", "İptal edildi"))
         else:
-            self.statusBar().showMessage("Tüm testler tamamlandı!")
+            job.cancel()
+            
+    def on_test_started(self, test_type):
+        """Bir worker testi almaya başladığında"""
+        
+        self.running_tests.add(test_type)
+        self.update_progress_status()
+        
+    def update_progress_status(self):
+        """Durum çubuğunda çalışan/bekleyen sayısını göster"""
+        
+        running = len(self.running_tests)
+        waiting = len(self.jobs) - running + len(self.after_fix)
+        if self.jobs:
+            names = ", ".join(t.upper() for t in self.running_tests) or "-"
+            self.statusBar().showMessage(f"Çalışan: {running} ({names}) | Sırada: {waiting}")
             
-    def on_test_complete(self, result):
+    def on_test_complete(self, test_type, result):
         """Test tamamlandığında"""
         
-        self.test_results.append(result)
-        self.update_results_table()
+        job = self.jobs.pop(test_type, None)
+        self.running_tests.discard(test_type)
+        if job is not None and job.fix:
+            deferred, self.after_fix = self.after_fix, []
+            for deferred_type in deferred:
+                self.run_test(deferred_type)
+        
+        if test_type in self.stale_tests:
+            # Bayat sonucu gösterme, güncel dosyalarla yeniden çalıştır
+            self.stale_tests.discard(test_type)
+            self.run_test(test_type)
+            return
+        
+        self.results_model.add_result(result)
         self.update_log(result)
         
         # Buton durumunu güncelle
         self.update_button_status(result)
         
-        self.statusBar().showMessage(f"{result.name} testi tamamlandı!")
+        if self.jobs:
+            self.update_progress_status()
+        else:
+            self.statusBar().showMessage(f"{result.name} testi tamamlandı! Bekleyen test yok.")
+            
+    def closeEvent(self, event):
+        """Pencere kapanırken süreçleri öksüz bırakma"""
         
-    def update_results_table(self):
-        """Sonuçlar tablosunu güncelle"""
+        if self.watch_stop is not None:
+            self.watch_stop.set()
+        self.cancel_tests()
+        self.pool.waitForDone(5000)
+        if self.trace_dir is not None and self.tracer.spans:
+            jsonl_path, chrome_path = self.tracer.write(self.project_root, self.trace_dir or None)
+            print(f"📈 İz: {jsonl_path}\n   Chrome trace: {chrome_path}")
+        super().closeEvent(event)
         
-        self.results_table.setRowCount(len(self.test_results))
+    def append_live_output(self, test_name, lines):
+        """Çalışan testin çıktı satırlarını log'a ekle"""
+        
+        self.log_sink.write_lines(f"    [{test_name}] {line}" for line in lines)
         
-        for i, result in enumerate(self.test_results):
-            # Test adı
-            self.results_table.setItem(i, 0, QTableWidgetItem(result.name))
-            
-            # Durum
-            status_item = QTableWidgetItem()
-            if result.status == "success":
-                status_item.setText("✅ Başarılı")
-                status_item.setBackground(QColor(Colors.SUCCESS))
-            elif result.status == "error":
-                status_item.setText("❌ Hata")
-                status_item.setBackground(QColor(Colors.ERROR))
-            else:
-                status_item.setText("⚠️ Uyarı")
-                status_item.setBackground(QColor(Colors.WARNING))
-            self.results_table.setItem(i, 1, status_item)
-            
-            # Süre
-            self.results_table.setItem(i, 2, QTableWidgetItem(f"{result.duration:.2f}s"))
-            
-            # Zaman
-            self.results_table.setItem(i, 3, QTableWidgetItem(
-                result.timestamp.strftime("%H:%M:%S")
-            ))
-            
-            # Detay
-            detail = result.output[:50] + "..." if len(result.output) > 50 else result.output
-            self.results_table.setItem(i, 4, QTableWidgetItem(detail))
-            
     def update_log(self, result):
         """Log'u güncelle"""
         
         timestamp = result.timestamp.strftime("%H:%M:%S")
         
-        if result.status == "success":
+        if result.status == "success" and result.cached:
+            log_entry = f"[{timestamp}] ♻️ {result.name}: Başarılı - önbellekten, girdiler değişmedi ({result.duration:.2f}s)\n"
+        elif result.status == "success":
             log_entry = f"[{timestamp}] ✅ {result.name}: Başarılı ({result.duration:.2f}s)\n"
         elif result.status == "error":
             log_entry = f"[{timestamp}] ❌ {result.name}: Hata ({result.duration:.2f}s)\n"
@@ -500,34 +889,16 @@ class AkilhaneCheckerGUI(QMainWindow):
                 log_entry += f"    Hata: {result.error}\n"
         else:
             log_entry = f"[{timestamp}] ⚠️ {result.name}: Uyarı ({result.duration:.2f}s)\n"
+            if result.error:
+                log_entry += f"    Not: {result.error}\n"
             
-        if result.output:
-            # Karakter kodlaması düzeltmeleri - ASCII yaklaşımı
-            output = result.output
-            # Yaygın bozuk karakterleri düzelt
-            output = output.replace("âœ\"", "[OK]")
-            output = output.replace("â\"", "->")
-            output = output.replace("â\"", "-")
-            output = output.replace("â\"", "L")
-            output = output.replace("â\"", "T")
-            output = output.replace("â\"", "|")
-            output = output.replace("â\"", "+")
-            output = output.replace("â\"", "+")
-            output = output.replace("â\"", "L")
-            output = output.replace("â\"", "T")
-            output = output.replace("â\"", "T")
-            output = output.replace("â\"", "L")
-            
-            log_entry += f"    Çıktı: {output}\n"
+        # Canlı akışta gösterilmeyen (önbellekten gelen) çıktıyı yaz
+        if result.output and result.cached:
+            log_entry += f"    Çıktı: {result.output}\n"
+        if result.log_path:
+            log_entry += f"    Tam çıktı: {result.log_path}\n"
             
-        # Gerçek zamanlı güncelleme
-        self.log_text.append(log_entry)
-        self.log_text.ensureCursorVisible()
-        
-        # Scroll'u en alta taşı
-        cursor = self.log_text.textCursor()
-        cursor.movePosition(cursor.End)
-        self.log_text.setTextCursor(cursor)
+        self.log_sink.write(log_entry)
         
     def update_button_status(self, result):
         """Buton durumunu güncelle"""
@@ -551,9 +922,8 @@ class AkilhaneCheckerGUI(QMainWindow):
     def clear_results(self):
         """Sonuçları temizle"""
         
-        self.test_results.clear()
-        self.results_table.setRowCount(0)
-        self.log_text.clear()
+        self.results_model.clear()
+        self.log_sink.clear()
         
         # Butonları sıfırla
         self.lint_btn.setStyleSheet(self.get_button_style("info"))
@@ -562,263 +932,290 @@ class AkilhaneCheckerGUI(QMainWindow):
         
         self.statusBar().showMessage("Sonuçlar temizlendi")
 
-class TestThread(QThread):
-    """Test thread'i"""
+class WatchSignals(QObject):
+    """İzleyici thread'inden UI'a değişen dosya kümesi"""
+    
+    changed = pyqtSignal(object)
+
+class TestJobSignals(QObject):
+    """TestJob sinyalleri (QRunnable bir QObject olmadığı için ayrı sınıf)"""
+    
+    started = pyqtSignal(str)  # test tipi
+    output_lines = pyqtSignal(str, object)  # (test adı, satır listesi)
+    result_ready = pyqtSignal(str, object)  # (test tipi, TestResult)
+
+class TestJob(QRunnable):
+    """İş havuzunda çalışan tek test"""
+    
+    # Test tipi -> (sonuç adı, araç, argümanlar, varsayılan timeout saniye).
+    # Yeterli geçmiş varsa timeout geçmiş sürelerin p95'i x timeout_factor olur
+    TESTS = {
+        "lint": ("Lint Test", "npx", ["next", "lint", "--fix"], 60),
+        "typescript": ("TypeScript Test", "npx", ["tsc", "--noEmit"], 30),
+        "build": ("Build Test", "npm", ["run", "build"], 120),
+    }
     
-    result_ready = pyqtSignal(object)
+    # Canlı çıktının UI'a toplu gönderilme aralığı (saniye)
+    EMIT_INTERVAL = 0.05
     
-    def __init__(self, test_type, project_root):
+    # Daemon'da çalışabilen testler: test tipi -> daemon işlemi
+    DAEMON_ACTIONS = {"lint": "lint", "typescript": "typecheck"}
+    
+    # .next/cache görüntüsü önce geri yüklenen, başarıda kaydedilen testler
+    BUILD_CACHE_TESTS = ("build",)
+    
+    # Canlı izleme: test tipi -> girdi kalıpları (None = tüm girdiler)
+    INPUTS = {"lint": LINT_INPUTS, "typescript": TYPECHECK_INPUTS, "build": None}
+    
+    def __init__(self, test_type, project_root, toolchain=None, use_daemon=False,
+                 changed_only=False, tracer=None, history=None, timeout_factor=TIMEOUT_FACTOR,
+                 fix=True):
         super().__init__()
+        # Referansı GUI tutuyor; Qt bitince silmesin
+        self.setAutoDelete(False)
         self.test_type = test_type
         self.project_root = project_root
-        
-    def find_node_path(self):
-        """Node.js yolunu bul"""
-        
-        # Yaygın Node.js kurulum yolları
-        possible_paths = [
-            r"C:\Program Files\nodejs\node.exe",
-            r"C:\Program Files (x86)\nodejs\node.exe",
-            r"C:\Users\{}\AppData\Roaming\npm\node.exe".format(os.getenv('USERNAME', '')),
-            r"C:\Users\{}\AppData\Local\Programs\nodejs\node.exe".format(os.getenv('USERNAME', '')),
-        ]
-        
-        # PATH'ten node'u ara
-        try:
-            result = subprocess.run(["where", "node"], capture_output=True, text=True)
-            if result.returncode == 0:
-                return result.stdout.strip().split('\n')[0]
-        except:
-            pass
-        
-        # Olası yollardan birini dene
-        for path in possible_paths:
-            if os.path.exists(path):
-                return path
-                
-        return None
-        
-    def find_npx_path(self):
-        """npx yolunu bul"""
-        
-        # Yaygın npx kurulum yolları
-        possible_paths = [
-            r"C:\Program Files\nodejs\npx.cmd",
-            r"C:\Program Files (x86)\nodejs\npx.cmd",
-            r"C:\Users\{}\AppData\Roaming\npm\npx.cmd".format(os.getenv('USERNAME', '')),
-            r"C:\Users\{}\AppData\Local\Programs\nodejs\npx.cmd".format(os.getenv('USERNAME', '')),
-        ]
-        
-        # PATH'ten npx'i ara
-        try:
-            result = subprocess.run(["where", "npx"], capture_output=True, text=True)
-            if result.returncode == 0:
-                return result.stdout.strip().split('\n')[0]
-        except:
-            pass
-        
-        # Olası yollardan birini dene
-        for path in possible_paths:
-            if os.path.exists(path):
-                return path
-                
-        return None
+        # Oturum başında bir kez çözülmüş araç yolları (npm/npx)
+        self.toolchain = toolchain or {}
+        self.use_daemon = use_daemon
+        self.changed_only = changed_only
+        # False: lint --fix olmadan, kaynakları yeniden yazmadan çalışır
+        self.fix = fix and test_type == "lint"
+        self.daemon_params = {"fix": False} if test_type == "lint" and not fix else {}
+        self.tracer = tracer
+        self.history = history
+        self.timeout_factor = timeout_factor
+        self.queued_at = time.monotonic()  # Havuzda boş worker beklemeye başladığı an
+        self.stream_result = None  # Son çalıştırmanın StreamResult'ı (kaynak kullanımı)
+        self.source = None  # "daemon" veya "process"
+        self.output_log = None
+        self._lines = []
+        self._lines_lock = threading.Lock()
+        self._last_emit = 0.0
+        self._flush_timer = None
+        self.name = self.TESTS[test_type][0] if test_type in self.TESTS else test_type
+        self.signals = TestJobSignals()
+        self.cancel_event = threading.Event()
+        
+    def cancel(self):
+        """Çalışan komutu durdur"""
+        
+        self.cancel_event.set()
+        
+    def forward_line(self, stream, line):
+        """Süreç çıktısını geldikçe diske yaz ve UI'a ilet"""
+        
+        self.output_log.write(stream, line)
+        # Satır başına sinyal yerine en fazla EMIT_INTERVAL'da bir toplu gönder;
+        # çıktı sustuğunda bekleyen satırları zamanlayıcı gönderir
+        with self._lines_lock:
+            self._lines.append(line)
+            wait = self.EMIT_INTERVAL - (time.monotonic() - self._last_emit)
+            if wait > 0:
+                if self._flush_timer is None:
+                    self._flush_timer = threading.Timer(wait, self.flush_lines)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+                return
+        self.flush_lines()
+        
+    def flush_lines(self):
+        """Biriken satırları UI'a gönder"""
+        
+        with self._lines_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            lines, self._lines = self._lines, []
+            self._last_emit = time.monotonic()
+        if lines:
+            self.signals.output_lines.emit(self.name, lines)
+        
+    def command_line(self, tool, args):
+        """Önbellek anahtarı ve log için araç adıyla komut satırı"""
+        
+        # Boşluklu dosya yolları kabukta da tek argüman kalsın
+        return " ".join([tool] + [shlex.quote(arg) for arg in args])
         
     def run(self):
-        """Test'i çalıştır"""
+        """Test'i çalıştır, tam çıktıyı diske yaz
         
-        start_time = time.time()
+        Log dizini veya önbellek yazılamasa da (salt okunur checkout, dolu
+        disk) result_ready her zaman yayınlanır; yoksa test "zaten sırada"
+        kalır.
+        """
         
+        start_time = time.monotonic()
+        result = None
         try:
-            if self.test_type == "lint":
-                result = self.run_lint_test()
-            elif self.test_type == "typescript":
-                result = self.run_typescript_test()
-            elif self.test_type == "build":
-                result = self.run_build_test()
-            else:
-                result = TestResult("Unknown", "error", 0, "", "Unknown test type")
-                
+            self.signals.started.emit(self.test_type)
+            name = f"{datetime.now():%Y%m%d-%H%M%S-%f}-{self.test_type}"
+            self.output_log = OutputLog(cache_dir(self.project_root, "logs"), name)
+            try:
+                result = self.execute()
+            finally:
+                self.output_log.close()
+                self.flush_lines()
+            result.log_path = self.output_log.path
+            if self.tracer is not None:
+                span = self.tracer.record(result.name, start_time, time.monotonic(), self.queued_at,
+                                          self.stream_result, status=result.status, cached=result.cached,
+                                          source=self.source)
+                if self.history is not None:
+                    # Worker thread'inde: git ve SQLite UI'ı bekletmesin
+                    self.history.add([span], "gui")
         except Exception as e:
-            duration = time.time() - start_time
-            result = TestResult(self.test_type, "error", duration, "", str(e))
-            
-        self.result_ready.emit(result)
-        
-    def run_lint_test(self):
-        """Lint testi"""
-        
-        start_time = time.time()
+            if result is None:
+                result = TestResult(self.name, "error", time.monotonic() - start_time, "", str(e))
+            else:
+                result.error = "\n".join(part for part in (result.error, str(e)) if part)
+        finally:
+            if result is None:
+                result = TestResult(self.name, "error", time.monotonic() - start_time, "",
+                                    "Test yarıda kesildi")
+            self.signals.result_ready.emit(self.test_type, result)
+        
+    def execute(self):
+        """Önbelleğe bak, gerekirse komutu çalıştır ve TestResult döndür"""
+        
+        start_time = time.monotonic()
+        cache = ResultCache(self.project_root)
+        cache_key = None
+        
+        if self.test_type not in self.TESTS:
+            return TestResult("Unknown", "error", 0, "", "Unknown test type")
+        name, tool, args, timeout = self.TESTS[self.test_type]
+        if self.test_type == "lint" and not self.fix:
+            args = [arg for arg in args if arg != "--fix"]
         
         try:
-            # Proje kök dizinine geç
-            original_dir = os.getcwd()
-            os.chdir(self.project_root)
-            
-            # Windows için shell=True kullan
-            result = subprocess.run(
-                "npx next lint --fix",
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+            if self.changed_only and self.test_type == "lint":
+                # git diff'e göre sadece değişen dosyalar (yapılandırma değiştiyse hepsi)
+                files, reason = plan_lint(self.project_root)
+                self.forward_line("stdout", f"🎯 {reason}")
+                if files == []:
+                    return TestResult(name, "success", time.monotonic() - start_time,
+                                      "Lint edilecek değişen dosya yok")
+                if files:
+                    args = args + lint_args(files)
+                    self.daemon_params["files"] = files
+            command = self.command_line(tool, args)
             
-            # Orijinal dizine geri dön
-            os.chdir(original_dir)
-            
-            duration = time.time() - start_time
-            
-            if result.returncode == 0:
+            # Girdiler değişmediyse son başarılı sonucu tekrar oynat
+            cache_key = cache.key(command)
+            cached = cache.get(cache_key)
+            if cached:
+                for stream in ("stdout", "stderr"):
+                    for line in cached[stream].splitlines():
+                        self.output_log.write(stream, line)
                 return TestResult(
-                    "Lint Test",
+                    name,
                     "success",
-                    duration,
-                    result.stdout,
-                    result.stderr
-                )
-            else:
-                return TestResult(
-                    "Lint Test",
-                    "error",
-                    duration,
-                    result.stdout,
-                    result.stderr
+                    time.monotonic() - start_time,
+                    cached["stdout"],
+                    cached["stderr"],
+                    cached=True
                 )
+            
+            result = self.run_check(name, tool, args, timeout)
                 
-        except subprocess.TimeoutExpired:
-            duration = time.time() - start_time
-            return TestResult(
-                "Lint Test",
-                "error",
-                duration,
-                "",
-                "Timeout expired"
-            )
         except Exception as e:
-            duration = time.time() - start_time
-            return TestResult(
-                "Lint Test",
-                "error",
-                duration,
-                "",
-                str(e)
-            )
+            duration = time.monotonic() - start_time
+            result = TestResult(name, "error", duration, "", str(e))
+            
+        if cache_key and result.status == "success":
+            if fixes_sources(command):
+                # Sonuç --fix'in düzelttiği ağaca ait
+                cache_key = cache.key(command)
+            cache.put(cache_key, command, 0, result.output, result.error, result.duration)
             
-    def run_typescript_test(self):
-        """TypeScript testi"""
+        return result
         
-        start_time = time.time()
+    def run_check(self, name, tool, args, timeout):
+        """Komutu proje kökünde çalıştır ve TestResult döndür
+        
+        Çalışma dizini süreç başına cwd= ile verilir; os.chdir süreç
+        genelinde olduğundan paralel işler birbirinin dizinini bozardı.
+        """
+        
+        start_time = time.monotonic()
+        executable = self.toolchain.get(tool)
+        action = self.DAEMON_ACTIONS.get(self.test_type) if self.use_daemon else None
+        if self.history is not None:
+            timeout = self.history.adaptive_timeout(name, "daemon" if action else "process",
+                                                    self.timeout_factor, default=timeout)
         
         try:
-            # Proje kök dizinine geç
-            original_dir = os.getcwd()
-            os.chdir(self.project_root)
-            
-            # Windows için shell=True kullan
-            result = subprocess.run(
-                "npx tsc --noEmit",
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            
-            # Orijinal dizine geri dön
-            os.chdir(original_dir)
-            
-            duration = time.time() - start_time
-            
-            if result.returncode == 0:
-                return TestResult(
-                    "TypeScript Test",
-                    "success",
-                    duration,
-                    result.stdout,
-                    result.stderr
+            store = None
+            if self.test_type in self.BUILD_CACHE_TESTS:
+                store = NextCacheStore(self.project_root)
+                self.forward_line("stdout", store.restore())
+            result = None
+            if action:
+                try:
+                    result = run_daemon_check(self.project_root, action, timeout=timeout,
+                                              cancel_event=self.cancel_event, **self.daemon_params)
+                    self.source = "daemon"
+                    for line in result.stdout.splitlines():
+                        self.forward_line("stdout", line)
+                except DaemonUnavailable as e:
+                    self.forward_line("stderr", f"Daemon kullanılamadı ({e}), normal çalıştırılıyor")
+            if result is None and executable:
+                result = run_streaming(
+                    [executable] + args,
+                    cwd=self.project_root,
+                    shell=False,
+                    timeout=timeout,
+                    on_line=self.forward_line,
+                    cancel_event=self.cancel_event
                 )
-            else:
-                return TestResult(
-                    "TypeScript Test",
-                    "error",
-                    duration,
-                    result.stdout,
-                    result.stderr
+            elif result is None:
+                # Araç bulunamadı: PATH çözümlemesini kabuğa bırak
+                result = run_streaming(
+                    self.command_line(tool, args),
+                    cwd=self.project_root,
+                    shell=True,
+                    timeout=timeout,
+                    on_line=self.forward_line,
+                    cancel_event=self.cancel_event
                 )
-                
-        except subprocess.TimeoutExpired:
-            duration = time.time() - start_time
+            
+            duration = time.monotonic() - start_time
+            self.stream_result = result
+            self.source = self.source or "process"
+            if store is not None and result.returncode == 0:
+                self.forward_line("stdout", store.save())
+            
             return TestResult(
-                "TypeScript Test",
-                "error",
+                name,
+                "success" if result.returncode == 0 else "error",
                 duration,
-                "",
-                "Timeout expired"
+                result.stdout,
+                result.stderr
             )
-        except Exception as e:
-            duration = time.time() - start_time
+                
+        except subprocess.TimeoutExpired:
+            duration = time.monotonic() - start_time
             return TestResult(
-                "TypeScript Test",
+                name,
                 "error",
                 duration,
                 "",
-                str(e)
-            )
-            
-    def run_build_test(self):
-        """Build testi"""
-        
-        start_time = time.time()
-        
-        try:
-            # Proje kök dizinine geç
-            original_dir = os.getcwd()
-            os.chdir(self.project_root)
-            
-            # Windows için shell=True kullan
-            result = subprocess.run(
-                "npm run build",
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=120
+                f"Zaman aşımı ({timeout:.0f}s), süreç ağacı durduruldu"
             )
-            
-            # Orijinal dizine geri dön
-            os.chdir(original_dir)
-            
-            duration = time.time() - start_time
-            
-            if result.returncode == 0:
-                return TestResult(
-                    "Build Test",
-                    "success",
-                    duration,
-                    result.stdout,
-                    result.stderr
-                )
-            else:
-                return TestResult(
-                    "Build Test",
-                    "error",
-                    duration,
-                    result.stdout,
-                    result.stderr
-                )
-                
-        except subprocess.TimeoutExpired:
-            duration = time.time() - start_time
+        except CommandCancelled:
+            duration = time.monotonic() - start_time
             return TestResult(
-                "Build Test",
-                "error",
+                name,
+                "warning",
                 duration,
                 "",
-                "Timeout expired"
+                "İptal edildi"
             )
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             return TestResult(
-                "Build Test",
+                name,
                 "error",
                 duration,
                 "",
@@ -828,16 +1225,34 @@ class TestThread(QThread):
 def main():
     """Ana fonksiyon"""
     
-    app = QApplication(sys.argv)
+    parser = argparse.ArgumentParser(description="AkılHane Checker GUI")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="Açılış adımlarının süresini yazdır ve pencere hazır olunca çık")
+    parser.add_argument("--trace", nargs="?", const="", metavar="DIR",
+                        help="Test sürelerini, kuyruk beklemesini, CPU ve bellek kullanımını kapanışta "
+                             "JSONL ve Chrome trace olarak DIR'e yaz (varsayılan: .akilhane-cache/traces)")
+    parser.add_argument("--timeout-factor", type=float, default=TIMEOUT_FACTOR, metavar="F",
+                        help="Test zaman aşımı = geçmiş sürelerin p95'i x F (en az 30 sn; az geçmişte "
+                             "sabit değerler, 0: hep sabit, varsayılan: %(default)s)")
+    args, qt_args = parser.parse_known_args()
+    
+    app = QApplication(sys.argv[:1] + qt_args)
+    STARTUP.mark("QApplication")
     
     # Uygulama ayarları
     app.setApplicationName("AkılHane Checker GUI")
     app.setApplicationVersion("2.0.0")
     
     # Ana pencere
-    window = AkilhaneCheckerGUI()
+    window = AkilhaneCheckerGUI(trace_dir=args.trace, timeout_factor=args.timeout_factor)
     window.show()
     
+    if args.startup_profile:
+        def report():
+            print(STARTUP.report())
+            app.quit()
+        window.panels_ready.connect(report)
+    
     sys.exit(app.exec_())
 
 if __name__ == "__main__":
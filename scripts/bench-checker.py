@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+AkılHane Checker - Benchmark
+Python araçlarının kendi yükünü ölçer: skor takibi, komut orkestrasyonu
+ve GUI tablo/log güncellemeleri. Sonuçlar commit bazlı JSON olarak saklanır.
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPTS_DIR)
+
+from checker_cache import cache_dir
+from checker_history import current_commit
+from checker_runner import run_streaming
+
+PROJECT_ROOT = os.path.dirname(SCRIPTS_DIR)
+SUITES = ("score", "orchestration", "gui")
+SIZES = (1000, 10000, 100000, 1000000)
+
+# Karşılaştırmada bundan kısa farklar gürültü sayılır (saniye)
+MIN_DIFFERENCE = 0.001
+
+# Süreç başlatma maliyetinin ölçüme baskın gelmemesi için en ucuz komut
+STUB = [shutil.which("true")] if shutil.which("true") else [sys.executable, "-c", "pass"]
+# Başarısız sonuç önbelleğe yazılmaz: her çağrı gerçekten komutu çalıştırır
+FAILING_STUB = [shutil.which("false")] if shutil.which("false") else [sys.executable, "-c", "raise SystemExit(1)"]
+
+def load_script(filename, name):
+    """Tire içeren betik dosyasını modül olarak yükle"""
+    spec = importlib.util.spec_from_file_location(name, os.path.join(SCRIPTS_DIR, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+@contextlib.contextmanager
+def quiet():
+    """Ölçülen kodun çıktısını (emoji raporlar, loglar) yut"""
+    with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+def measure(fn, repeat, number=1, setup=None):
+    """fn'i repeat tur, her turda number kez çalıştır; çağrı başına süreler"""
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        times.append((time.perf_counter() - start) / number)
+    return {
+        "median": statistics.median(times),
+        "min": min(times),
+        "max": max(times),
+        "repeat": repeat,
+        "number": number,
+    }
+
+class Bench:
+    """Ölçümleri toplar ve ilerlemeyi yazdırır"""
+
+    def __init__(self, repeat):
+        self.repeat = repeat
+        self.results = {}
+
+    def run(self, name, fn, number=1, setup=None, repeat=None):
+        with quiet():
+            result = measure(fn, repeat or self.repeat, number, setup)
+        self.results[name] = result
+        print(f"   {name:<44} {result['median'] * 1000:10.3f} ms  (min {result['min'] * 1000:.3f})")
+
+    def skip(self, name, reason):
+        print(f"   {name:<44} atlandı: {reason}")
+
+def synthetic_scores(game_score, size):
+    """size görevlik geçmişi olan skor durumu"""
+    scores = game_score.empty_scores()
+    start = datetime(2024, 1, 1)
+    history = scores["history"]
+    for index in range(size):
+        history.append({
+            "timestamp": (start + timedelta(minutes=index)).isoformat(),
+            "mission": f"Mission {index % 20}",
+            "xp_earned": 100,
+            "details": "Synthetic benchmark mission",
+        })
+    scores["total_xp"] = 100 * size
+    scores["missions_completed"] = size
+    scores["level"] = scores["total_xp"] // 1000 + 1
+    return scores
+
+def bench_score(bench, sizes, backends):
+    """GameScoreTracker: yükleme, add_xp ve tam kayıt"""
+    game_score = load_script("game-score.py", "game_score")
+    for backend in backends:
+        for size in sizes:
+            with tempfile.TemporaryDirectory() as directory:
+                score_file = os.path.join(directory, "game-scores.json")
+                with open(score_file, "w", encoding="utf-8") as f:
+                    json.dump(synthetic_scores(game_score, size), f)
+                with quiet():
+                    tracker = game_score.GameScoreTracker(score_file, backend=backend)  # Gerekirse göç
+
+                label = f"score.{backend}"
+                bench.run(f"{label}.load[{size}]",
+                          lambda: game_score.GameScoreTracker(score_file, backend=backend))
+                bench.run(f"{label}.add_xp[{size}]",
+                          lambda: tracker.add_xp(100, "Benchmark", "add_xp"), number=20)
+                bench.run(f"{label}.save[{size}]", tracker.save_scores)
+
+def bench_orchestration(bench, gui):
+    """Saplama komutlarla run_streaming / run_command / run_checks / TestJob yükü"""
+    check_project = load_script("check-project.py", "check_project")
+
+    # Referans: orkestrasyonsuz çıplak süreç
+    bench.run("orchestration.subprocess_run", lambda: subprocess.run(STUB), number=20)
+    bench.run("orchestration.run_streaming", lambda: run_streaming(STUB, shell=False), number=20)
+
+    lines = [sys.executable, "-c", "import sys; sys.stdout.write('satır ✓ çıktı\\n' * 100000)"]
+    bench.run("orchestration.run_streaming[100k satır]",
+              lambda: run_streaming(lines, shell=False, on_line=lambda stream, line: None))
+
+    stub_command = " ".join(STUB)
+    bench.run("orchestration.run_command",
+              lambda: check_project.run_command(stub_command, "Saplama"), number=20)
+
+    checks = [
+        check_project.Check("A", "A", stub_command, "A"),
+        check_project.Check("B", "B", stub_command, "B"),
+        check_project.Check("C", "C", stub_command, "C", deps=("A", "B")),
+    ]
+    bench.run("orchestration.run_checks[3 adım]",
+              lambda: check_project.run_checks(checks, 2), number=10)
+
+    if gui is None:
+        bench.skip("orchestration.test_job", "PyQt5 yok")
+        return
+
+    class BenchJob(gui.TestJob):
+        # GUI'nin test listesi (havuz boyutu, filtre) değişmesin diye ayrı sınıf
+        TESTS = {"bench": ("Bench Test", "stub", FAILING_STUB[1:], 60)}
+
+    with tempfile.TemporaryDirectory() as directory:
+        toolchain = {"stub": FAILING_STUB[0]}
+        bench.run("orchestration.test_job",
+                  lambda: BenchJob("bench", directory, toolchain).run(), number=20)
+
+def load_gui():
+    """GUI modülünü offscreen yükle; PyQt5 yoksa None"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    try:
+        return load_script("akilhane-checker-gui.py", "akilhane_checker_gui")
+    except ImportError:
+        return None
+
+def bench_gui(bench, gui):
+    """Sonuç tablosu ve log paneli: büyük çıktılar altında güncelleme süresi"""
+    if gui is None:
+        bench.skip("gui", "PyQt5 yok")
+        return
+    app = gui.QApplication.instance() or gui.QApplication([sys.argv[0]])
+    window = gui.AkilhaneCheckerGUI()
+    window.show()
+    window.build_panels()
+    app.processEvents()
+
+    results = [gui.TestResult(f"Test {index % 3}", ("success", "error", "warning")[index % 3],
+                              index / 1000, "çıktı\n" * 50, "hata satırı\n" * 20)
+               for index in range(5000)]
+
+    def add_results():
+        for result in results:
+            window.results_model.add_result(result)
+        app.processEvents()
+    bench.run("gui.add_result[5000]", add_results, setup=window.results_model.clear)
+
+    def update_log():
+        for result in results[:1000]:
+            window.update_log(result)
+        window.log_sink.flush()
+        app.processEvents()
+    bench.run("gui.update_log[1000 sonuç]", update_log, setup=window.log_sink.clear)
+
+    batch = [f"satır {index} ✓ ├ ş" for index in range(500)]
+    def live_output():
+        for _ in range(200):
+            window.append_live_output("Build Test", batch)
+        window.log_sink.flush()
+        app.processEvents()
+    bench.run("gui.live_output[100k satır]", live_output, setup=window.log_sink.clear)
+
+    window.close()
+
+def default_output():
+    commit, dirty = current_commit(PROJECT_ROOT)
+    name = (commit[:12] if commit else "nocommit") + ("-dirty" if dirty else "")
+    return os.path.join(cache_dir(PROJECT_ROOT, "bench"), f"bench-{name}.json")
+
+def compare(baseline_path, results, threshold):
+    """Temel ölçümle karşılaştır; yavaşlayan ölçüm varsa False"""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    print(f"\n📊 Karşılaştırma: {baseline_path} ({(baseline.get('commit') or 'commit yok')[:12]})")
+    slower = []
+    for name, result in results.items():
+        old = baseline["results"].get(name)
+        if old is None:
+            continue
+        ratio = result["median"] / old["median"] if old["median"] else float("inf")
+        marker = ""
+        if ratio > 1 + threshold and result["median"] - old["median"] > MIN_DIFFERENCE:
+            marker = "  🐢"
+            slower.append(name)
+        elif ratio < 1 / (1 + threshold):
+            marker = "  🚀"
+        print(f"   {name:<44} {old['median'] * 1000:10.3f} -> {result['median'] * 1000:10.3f} ms "
+              f"({(ratio - 1) * 100:+.0f}%){marker}")
+    if slower:
+        print(f"🐢 %{threshold * 100:.0f}'den fazla yavaşlayan: {', '.join(slower)}")
+    else:
+        print("✅ Yavaşlama yok")
+    return not slower
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="AkılHane Checker benchmark")
+    parser.add_argument("--suite", action="append", choices=SUITES,
+                        help="Çalıştırılacak grup (tekrarlanabilir, varsayılan: hepsi)")
+    parser.add_argument("--sizes", default=",".join(str(size) for size in SIZES),
+                        help="Skor geçmişi boyutları (varsayılan: %(default)s)")
+    parser.add_argument("--backend", action="append", choices=("json", "sqlite"),
+                        help="Skor depolama motoru (tekrarlanabilir, varsayılan: json)")
+    parser.add_argument("--repeat", type=int, default=3, help="Ölçüm turu sayısı (varsayılan: %(default)s)")
+    parser.add_argument("--output", help="Sonuç JSON'u (varsayılan: .akilhane-cache/bench/bench-<commit>.json)")
+    parser.add_argument("--compare", metavar="BASELINE",
+                        help="Bu JSON ile karşılaştır; yavaşlama varsa 1 ile çık")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="--compare: yavaşlama eşiği, oran (varsayılan: %(default)s)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    suites = args.suite or list(SUITES)
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    bench = Bench(max(1, args.repeat))
+    gui = load_gui() if {"orchestration", "gui"} & set(suites) else None
+
+    print(f"⏱️ AkılHane Checker benchmark ({', '.join(suites)}, {bench.repeat} tur)")
+    if "score" in suites:
+        bench_score(bench, sizes, args.backend or ["json"])
+    if "orchestration" in suites:
+        bench_orchestration(bench, gui)
+    if "gui" in suites:
+        bench_gui(bench, gui)
+
+    commit, dirty = current_commit(PROJECT_ROOT)
+    report = {
+        "commit": commit,
+        "dirty": dirty,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "results": bench.results,
+    }
+    output = args.output or default_output()
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"💾 Sonuçlar: {output}")
+
+    if args.compare and not compare(args.compare, bench.results, args.threshold):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
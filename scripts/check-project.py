@@ -4,12 +4,32 @@ AkılHane Project Checker
 Hackathon için proje kalite kontrolü
 """
 
+import argparse
+import asyncio
 import subprocess
 import sys
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from datetime import datetime
 import time
 
+from checker_async import run_cancellable, stream_process, to_thread
+from checker_buildcache import NextCacheStore
+from checker_cache import ResultCache
+from checker_history import TIMEOUT_FACTOR, WINDOW, History, build_report
+from checker_install import current_stamp, install_command, install_reason, write_stamp
+from checker_daemon import DaemonUnavailable, ensure_daemon, run_daemon_check
+from checker_lint import (LINT_CHECK_COMMAND, LINT_COMMAND, fixes_sources, lint_command, plan_lint,
+                          run_sharded_lint)
+from checker_runner import POLL_INTERVAL, CommandCancelled, run_streaming
+from checker_toolchain import resolve_command, resolve_toolchain
+from checker_trace import Tracer
+from checker_watch import DEBOUNCE, LINT_INPUTS, TYPECHECK_INPUTS, FileWatcher, is_affected
+
+# Başarısızlıkta özette tekrar gösterilecek stderr satırı sayısı
+ERROR_TAIL_LINES = 20
+
 class Colors:
     HEADER = '\033[95m'
     OKBLUE = '\033[94m'
@@ -21,6 +41,42 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
+# Paralel adımların çıktıları satır ortasında karışmasın
+_print_lock = threading.Lock()
+
+def log(*lines):
+    """Satırları tek parça halinde yazdır"""
+    with _print_lock:
+        for line in lines:
+            print(line)
+
+class Check:
+    """Bağımlılık grafiğindeki tek bir kontrol adımı"""
+
+    def __init__(self, name, title, command, description, deps=(), critical=True,
+                 daemon_action=None, inputs=None, daemon_params=None, runner=None, build_cache=False):
+        self.name = name
+        self.title = title
+        self.command = command
+        self.description = description
+        self.deps = tuple(deps)
+        self.critical = critical
+        self.daemon_action = daemon_action  # --daemon ile sıcak süreçte çalışır
+        self.daemon_params = daemon_params or {}
+        self.runner = runner  # runner(on_line, cancel_event, timeout) -> StreamResult; komut yerine
+        self.inputs = inputs  # --watch için girdi kalıpları (None = tüm girdiler)
+        self.build_cache = build_cache  # .next/cache görüntüsü geri yüklenir/kaydedilir
+
+# Lint ve TypeScript birbirinden bağımsız, Build ikisine bağlı
+CHECKS = [
+    Check("Lint", "1. Lint Kontrolü", LINT_COMMAND, "ESLint kontrolü ve düzeltme",
+          daemon_action="lint", inputs=LINT_INPUTS),
+    Check("TypeScript", "2. TypeScript Kontrolü", "npx tsc --noEmit", "TypeScript tip kontrolü",
+          daemon_action="typecheck", inputs=TYPECHECK_INPUTS),
+    Check("Build", "3. Build Kontrolü", "npm run build", "Production build", deps=("Lint", "TypeScript"),
+          build_cache=True),
+]
+
 def print_header():
     print(f"{Colors.HEADER}{Colors.BOLD}")
     print("╔══════════════════════════════════════════════════════════════╗")
@@ -31,74 +87,472 @@ def print_header():
     print(f"{Colors.OKCYAN}🕐 Başlangıç: {datetime.now().strftime('%H:%M:%S')}{Colors.ENDC}")
     print()
 
-def run_command(command, description, critical=True):
-    print(f"{Colors.OKBLUE}🔍 {description}...{Colors.ENDC}")
-    print(f"   Komut: {command}")
+class StepRun:
+    """Bir adımın çalıştırma dışındaki işleri: duyuru, önbellek, iz ve rapor
+
+    Thread ve asyncio motorları komutu kendi yollarıyla çalıştırır,
+    sonucu bu sınıf üzerinden raporlar.
+    """
+
+    def __init__(self, command, description, critical=True, cache=None, label=None,
+                 trace=None, queued_at=None, timeout=None):
+        log(f"{Colors.OKBLUE}🔍 {description}...{Colors.ENDC}",
+            f"   Komut: {command}")
+        self.command = command
+        self.description = description
+        self.critical = critical
+        self.cache = cache
+        self.label = label
+        self.trace = trace
+        self.queued_at = queued_at
+        self.timeout = timeout
+        self.cache_key = None
+        self.start_time = time.monotonic()
+        self.prefix = f"   [{label}] " if label else "   │ "
     
-    start_time = time.time()
+    def record(self, status, result=None, **fields):
+        # --trace: süre, kuyruk beklemesi ve süreç ağacının kaynak kullanımı
+        if self.trace is not None:
+            self.trace.record(self.label or self.description, self.start_time, time.monotonic(),
+                              self.queued_at, result, status=status, command=self.command, **fields)
     
-    try:
-        result = subprocess.run(command, shell=True, capture_output=True, text=True)
-        duration = time.time() - start_time
+    def forward(self, stream, line):
+        # Çıktıyı süreç bitmesini beklemeden geldikçe yazdır
+        color = Colors.WARNING if stream == "stderr" else ""
+        log(f"{color}{self.prefix}{line}{Colors.ENDC if color else ''}")
+    
+    def note(self, message):
+        log(f"{Colors.OKCYAN}   {message}{Colors.ENDC}")
+    
+    def from_cache(self):
+        """Girdiler değişmediyse önbellekteki başarılı sonucu kullan"""
+        if not self.cache:
+            return False
+        self.cache_key = self.cache.key(self.command)
+        cached = self.cache.get(self.cache_key)
+        if not cached:
+            return False
+        log(f"{Colors.OKGREEN}♻️  {self.description} önbellekten: girdiler değişmedi "
+            f"(ilk çalıştırma {cached['duration']:.2f}s){Colors.ENDC}")
+        self.record("cached")
+        return True
+    
+    def finish(self, result, source="process"):
+        """Sonucu önbelleğe yaz ve raporla; devam edilebilirse True"""
+        duration = time.monotonic() - self.start_time
+        if self.cache:
+            # --fix'in sonucu düzeltilmiş ağaca aittir: anahtar komuttan sonra
+            key = self.cache.key(self.command) if fixes_sources(self.command) else self.cache_key
+            self.cache.put(key, self.command, result.returncode, result.stdout, result.stderr, duration)
+        self.record("success" if result.returncode == 0 else "error", result, source=source)
         
         if result.returncode == 0:
-            print(f"{Colors.OKGREEN}✅ {description} başarılı! ({duration:.2f}s){Colors.ENDC}")
-            if result.stdout.strip():
-                print(f"   Çıktı: {result.stdout.strip()}")
+            log(f"{Colors.OKGREEN}✅ {self.description} başarılı! ({duration:.2f}s){Colors.ENDC}")
             return True
-        else:
-            print(f"{Colors.FAIL}❌ {description} başarısız! ({duration:.2f}s){Colors.ENDC}")
-            if result.stderr.strip():
-                print(f"   Hata: {result.stderr.strip()}")
-            if critical:
-                print(f"{Colors.FAIL}💥 Kritik hata! İşlem durduruluyor.{Colors.ENDC}")
-                return False
-            else:
-                print(f"{Colors.WARNING}⚠️  Kritik olmayan hata, devam ediliyor...{Colors.ENDC}")
-                return True
+        lines = [f"{Colors.FAIL}❌ {self.description} başarısız! ({duration:.2f}s){Colors.ENDC}"]
+        error_tail = result.stderr.strip().splitlines()[-ERROR_TAIL_LINES:]
+        if error_tail:
+            lines.append("   Hata: " + "\n         ".join(error_tail))
+        if self.critical:
+            lines.append(f"{Colors.FAIL}💥 Kritik hata! İşlem durduruluyor.{Colors.ENDC}")
+            log(*lines)
+            return False
+        lines.append(f"{Colors.WARNING}⚠️  Kritik olmayan hata, devam ediliyor...{Colors.ENDC}")
+        log(*lines)
+        return True
+    
+    def cancelled(self):
+        log(f"{Colors.WARNING}⛔ {self.description} iptal edildi{Colors.ENDC}")
+        self.record("cancelled")
+        return False
+    
+    def timed_out(self):
+        log(f"{Colors.FAIL}⏰ {self.description} {self.timeout:.0f}s içinde bitmedi, "
+            f"süreç ağacı durduruldu{Colors.ENDC}")
+        self.record("timeout")
+        return not self.critical
+    
+    def crashed(self, error):
+        log(f"{Colors.FAIL}💥 Komut çalıştırma hatası: {error}{Colors.ENDC}")
+        self.record("error", error=str(error))
+        return False
+
+def run_command(command, description, critical=True, cache=None, label=None, daemon_action=None,
+                cancel_event=None, daemon_params=None, runner=None, trace=None, queued_at=None,
+                timeout=None, build_cache=None):
+    step = StepRun(command, description, critical, cache, label, trace, queued_at, timeout)
+    try:
+        if step.from_cache():
+            return True
+        if build_cache is not None:
+            step.note(build_cache.restore())
+
+        result = None
+        source = "process"
+        if daemon_action:
+            try:
+                result = run_daemon_check(os.getcwd(), daemon_action, timeout=timeout,
+                                          cancel_event=cancel_event, **(daemon_params or {}))
+                source = "daemon"
+                for line in result.stdout.splitlines():
+                    step.forward("stdout", line)
+            except DaemonUnavailable as e:
+                log(f"{Colors.WARNING}⚠️  Daemon kullanılamadı ({e}), normal çalıştırılıyor{Colors.ENDC}")
+        if result is None and runner is not None:
+            result = runner(step.forward, cancel_event, timeout)
+        if result is None:
+            # npm/npx oturumda bir kez çözülür, kabuk olmadan tam yolla çalışır
+            args, shell = resolve_command(command, resolve_toolchain(os.getcwd()))
+            result = run_streaming(args, shell=shell, timeout=timeout, on_line=step.forward,
+                                   cancel_event=cancel_event)
+        passed = step.finish(result, source)
+        if build_cache is not None and result.returncode == 0:
+            step.note(build_cache.save())
+        return passed
                 
+    except CommandCancelled:
+        return step.cancelled()
+    except subprocess.TimeoutExpired:
+        return step.timed_out()
     except Exception as e:
-        print(f"{Colors.FAIL}💥 Komut çalıştırma hatası: {e}{Colors.ENDC}")
-        return False
+        return step.crashed(e)
 
-def check_node_modules():
-    """Node modules kontrolü"""
-    if not os.path.exists("node_modules"):
-        print(f"{Colors.WARNING}📦 node_modules bulunamadı, npm install çalıştırılıyor...{Colors.ENDC}")
-        return run_command("npm install", "Dependencies yükleniyor", critical=True)
-    return True
+class CheckSchedule:
+    """run_checks ve run_checks_async'in ortak bağımlılık grafiği defteri
 
-def main():
-    print_header()
+    Hangi adımın bekleyip hangisinin çalıştığını ve sonuçları tutar;
+    adımları başlatmak ve bitmelerini beklemek motorun işidir. Kaynak
+    dosyaları yeniden yazan adımlar (lint --fix) bitmeden diğer adımlar
+    başlamaz; sonuçları beklenmez, spekülatif modda da geçerlidir.
+    """
     
-    # Proje bilgileri
-    print(f"{Colors.BOLD}📋 Proje Bilgileri:{Colors.ENDC}")
-    print(f"   🏠 Dizin: {os.getcwd()}")
-    print(f"   📦 Package.json: {'✅ Var' if os.path.exists('package.json') else '❌ Yok'}")
-    print(f"   🔧 Next.js Config: {'✅ Var' if os.path.exists('next.config.js') or os.path.exists('next.config.ts') else '❌ Yok'}")
-    print(f"   📝 TypeScript Config: {'✅ Var' if os.path.exists('tsconfig.json') else '❌ Yok'}")
-    print()
+    def __init__(self, checks, jobs, speculative=False, previous=None):
+        previous = previous or {}
+        self.checks = checks
+        self.jobs = max(1, jobs)
+        self.speculative = speculative
+        self.by_name = {check.name: check for check in checks}
+        for check in checks:
+            for dep in check.deps:
+                if dep not in self.by_name and dep not in previous:
+                    raise ValueError(f"{check.name}: bilinmeyen bağımlılık '{dep}'")
+        self.outcome = {name: ok for name, ok in previous.items() if name not in self.by_name}
+        self.pending = list(checks)
+        self.running = {}  # future/görev -> kontrol
+        self.ready_at = {}  # adım adı -> bağımlılıklarının bittiği an
+        self.fixers = {check.name for check in checks if fixes_sources(check.command)}
     
-    # Node modules kontrolü
-    if not check_node_modules():
-        sys.exit(1)
+    def _sources_ready(self, check):
+        """Dosyaları düzelten adımlar bittiyse (ya da check onlardan biriyse) True"""
+        return check.name in self.fixers or all(name in self.outcome for name in self.fixers)
     
-    # Test sonuçları
-    results = []
+    def active(self):
+        return bool(self.pending or self.running)
     
-    # 1. Lint kontrolü
-    print(f"\n{Colors.BOLD}🔍 1. Lint Kontrolü{Colors.ENDC}")
-    results.append(("Lint", run_command("npx next lint --fix", "ESLint kontrolü ve düzeltme")))
+    def drop_pending(self):
+        """Bekleyen adımları başlatmadan başarısız say (iptal)"""
+        for check in self.pending:
+            self.outcome[check.name] = False
+        self.pending.clear()
     
-    # 2. TypeScript kontrolü
-    print(f"\n{Colors.BOLD}🔍 2. TypeScript Kontrolü{Colors.ENDC}")
-    results.append(("TypeScript", run_command("npx tsc --noEmit", "TypeScript tip kontrolü")))
+    def advance(self, start):
+        """Hazır adımları start(check) ile başlat, bağımlılığı düşenleri atla
+
+        start, adımı temsil eden future/görevi döndürür. Bir şey
+        değiştiyse True.
+        """
+        progressed = False
+        for check in list(self.pending):
+            failed_deps = [dep for dep in check.deps if self.outcome.get(dep) is False]
+            if failed_deps and not self.speculative:
+                log(f"\n{Colors.WARNING}⏭️  {check.name} atlandı "
+                    f"(başarısız bağımlılık: {', '.join(failed_deps)}){Colors.ENDC}")
+                self.outcome[check.name] = False
+                self.pending.remove(check)
+                progressed = True
+            elif self._sources_ready(check) and (
+                    self.speculative or all(self.outcome.get(dep) for dep in check.deps)):
+                self.ready_at.setdefault(check.name, time.monotonic())
+                if len(self.running) >= self.jobs:
+                    break
+                self.pending.remove(check)
+                log(f"\n{Colors.BOLD}🔍 {check.title}{Colors.ENDC}")
+                self.running[start(check)] = check
+                progressed = True
+        return progressed
     
-    # 3. Build kontrolü
-    print(f"\n{Colors.BOLD}🔍 3. Build Kontrolü{Colors.ENDC}")
-    results.append(("Build", run_command("npm run build", "Production build")))
+    def finished(self):
+        """Çalışan adım kalmadıysa True; başlatılamayan bekleyen varsa ValueError"""
+        if self.running:
+            return False
+        if self.pending:
+            raise ValueError("Bağımlılık grafiğinde döngü var: "
+                             + ", ".join(check.name for check in self.pending))
+        return True
     
-    # Sonuç özeti
+    def complete(self, handle, ok):
+        check = self.running.pop(handle)
+        self.outcome[check.name] = ok
+        return check
+    
+    def results(self):
+        """[(ad, sonuç)]; spekülatif başlatılan adım, bağımlılığı başarısızsa geçmiş sayılmaz"""
+        outcome = self.outcome
+        if self.speculative:
+            resolved = {}
+            def passed(name):
+                if name not in resolved:
+                    if name not in self.by_name:
+                        resolved[name] = outcome[name]
+                    else:
+                        resolved[name] = outcome[name] and all(passed(dep) for dep in self.by_name[name].deps)
+                return resolved[name]
+            outcome = {check.name: passed(check.name) for check in self.checks}
+        return [(check.name, outcome[check.name]) for check in self.checks]
+
+def run_checks(checks, jobs, speculative=False, cache=None, daemon=False,
+               cancel_event=None, previous=None, trace=None, timeouts=None, build_cache=None):
+    """Kontrolleri bağımlılık grafiğine göre paralel çalıştır
+
+    Bir adım, bağımlı olduğu adımların hepsi başarılı olunca başlar;
+    bağımlılıklarından biri başarısız olursa atlanır. speculative=True
+    iken bağımlılıklar beklenmez, adım hemen başlatılır ve sonucu
+    bağımlılıklarının sonucuyla birlikte değerlendirilir. daemon=True
+    iken daemon_action tanımlı adımlar sıcak daemon süreçlerinde çalışır.
+    checks dışında kalan bağımlılıkların sonucu previous sözlüğünden
+    alınır; cancel_event set edilince bekleyen adımlar başlatılmaz.
+    trace verilirse her adım, hazır olduğu andan itibaren kuyruk
+    beklemesiyle birlikte kaydedilir. timeouts: adım adı -> saniye.
+    build_cache (NextCacheStore) build_cache=True adımlarda .next/cache'i
+    çalıştırmadan önce geri yükler, başarılı olunca kaydeder.
+    """
+    timeouts = timeouts or {}
+    # Komutlar kendi süreç gruplarında: Ctrl+C onlara ulaşmaz, iptalle durdurulur
+    cancel_event = cancel_event or threading.Event()
+    schedule = CheckSchedule(checks, jobs, speculative, previous)
+
+    with ThreadPoolExecutor(max_workers=schedule.jobs) as pool:
+        def start(check):
+            return pool.submit(run_command, check.command, check.description,
+                               check.critical, cache, check.name,
+                               check.daemon_action if daemon else None, cancel_event,
+                               check.daemon_params, check.runner, trace,
+                               schedule.ready_at[check.name], timeouts.get(check.name),
+                               build_cache if check.build_cache else None)
+        
+        while schedule.active():
+            if cancel_event.is_set():
+                schedule.drop_pending()
+            if schedule.advance(start):
+                continue
+            if schedule.finished():
+                break  # İptal: bekleyenler atıldı
+
+            try:
+                done, _ = wait(schedule.running, return_when=FIRST_COMPLETED)
+            except KeyboardInterrupt:
+                cancel_event.set()
+                raise
+            for future in done:
+                schedule.complete(future, future.result())
+
+    return schedule.results()
+
+async def run_command_async(command, description, critical=True, cache=None, label=None,
+                            daemon_action=None, daemon_params=None, runner=None, trace=None,
+                            queued_at=None, timeout=None, build_cache=None):
+    """run_command'in asyncio karşılığı
+
+    Görev iptal edilirse süreç ağacı durdurulur ve adım iptal edilmiş
+    sayılır. Daemon ve parçalı lint bloklayan çağrılar olduğundan
+    thread'de çalışır, iptalde kendi cancel_event'leri set edilir.
+    """
+    step = StepRun(command, description, critical, cache, label, trace, queued_at, timeout)
+    try:
+        if await to_thread(step.from_cache):
+            return True
+        if build_cache is not None:
+            step.note(await to_thread(build_cache.restore))
+
+        result = None
+        source = "process"
+        if daemon_action:
+            try:
+                result = await run_cancellable(run_daemon_check, os.getcwd(), daemon_action,
+                                               timeout=timeout, **(daemon_params or {}))
+                source = "daemon"
+                for line in result.stdout.splitlines():
+                    step.forward("stdout", line)
+            except DaemonUnavailable as e:
+                log(f"{Colors.WARNING}⚠️  Daemon kullanılamadı ({e}), normal çalıştırılıyor{Colors.ENDC}")
+        if result is None and runner is not None:
+            result = await run_cancellable(runner, step.forward, timeout=timeout)
+        if result is None:
+            args, shell = resolve_command(command, resolve_toolchain(os.getcwd()))
+            result = await stream_process(args, shell=shell, timeout=timeout, on_line=step.forward)
+        passed = step.finish(result, source)
+        if build_cache is not None and result.returncode == 0:
+            step.note(await to_thread(build_cache.save))
+        return passed
+
+    except (CommandCancelled, asyncio.CancelledError):
+        return step.cancelled()
+    except subprocess.TimeoutExpired:
+        return step.timed_out()
+    except Exception as e:
+        return step.crashed(e)
+
+async def run_checks_async(checks, jobs, speculative=False, cache=None, daemon=False,
+                           cancel_event=None, previous=None, trace=None, timeouts=None,
+                           build_cache=None, fail_fast=False):
+    """run_checks'in asyncio karşılığı
+
+    Her adım bir asyncio görevidir, aynı anda en fazla jobs tanesi
+    çalışır. fail_fast=True iken kritik bir adım başarısız olunca
+    çalışan kardeş adımlar iptal edilir (süreç ağaçları durdurulur),
+    bekleyenler başlatılmaz. cancel_event thread'lerden gelen iptal
+    isteği içindir (izleme modu) ve düzenli aralıklarla yoklanır.
+    """
+    timeouts = timeouts or {}
+    schedule = CheckSchedule(checks, jobs, speculative, previous)
+    stopping = False
+
+    def start(check):
+        return asyncio.ensure_future(run_command_async(
+            check.command, check.description, check.critical, cache, check.name,
+            check.daemon_action if daemon else None, check.daemon_params, check.runner,
+            trace, schedule.ready_at[check.name], timeouts.get(check.name),
+            build_cache if check.build_cache else None))
+
+    def stop():
+        nonlocal stopping
+        stopping = True
+        schedule.drop_pending()
+        for task in schedule.running:
+            task.cancel()
+
+    while schedule.active():
+        if not stopping and cancel_event is not None and cancel_event.is_set():
+            stop()
+        if schedule.advance(start):
+            continue
+        if schedule.finished():
+            break  # İptal: bekleyenler atıldı
+
+        done, _ = await asyncio.wait(schedule.running, timeout=POLL_INTERVAL if cancel_event else None,
+                                     return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            # Başlamadan iptal edilen görev sonuç üretmez
+            ok = False if task.cancelled() else task.result()
+            check = schedule.complete(task, ok)
+            if fail_fast and not ok and check.critical and not stopping:
+                others = ([other.name for other in schedule.running.values()]
+                          + [other.name for other in schedule.pending])
+                log(f"\n{Colors.FAIL}🛑 Fail-fast: {check.name} başarısız"
+                    + (f", durduruluyor: {', '.join(others)}" if others else "") + Colors.ENDC)
+                stop()
+
+    return schedule.results()
+
+def execute_checks(args, checks, **kwargs):
+    """Kontrolleri --engine ile seçilen motorda çalıştır"""
+    if args.engine == "asyncio":
+        return asyncio.run(run_checks_async(checks, args.jobs, speculative=args.speculative_build,
+                                            fail_fast=args.fail_fast, **kwargs))
+    return run_checks(checks, args.jobs, speculative=args.speculative_build, **kwargs)
+
+def check_node_modules():
+    """node_modules kurulduğu lockfile ve Node sürümüyle güncel mi; değilse kur
+
+    Karar node_modules içindeki damga dosyasıyla verilir; kurulum
+    sadece damga tutmadığında çalışır.
+    """
+    start_time = time.monotonic()
+    root = os.getcwd()
+    stamp = current_stamp(root, resolve_toolchain(root))
+    reason = install_reason(root, stamp)
+    lockfile = stamp["lockfile"][:12] if stamp["lockfile"] else "yok"
+    if reason is None:
+        print(f"{Colors.OKGREEN}📦 Bağımlılıklar güncel (lockfile {lockfile}, Node {stamp['node']}; "
+              f"kontrol {time.monotonic() - start_time:.2f}s){Colors.ENDC}")
+        return True
+    
+    command = install_command(root)
+    print(f"{Colors.WARNING}📦 Kurulum gerekli: {reason} (lockfile {lockfile}, Node {stamp['node']}; "
+          f"kontrol {time.monotonic() - start_time:.2f}s) -> {command}{Colors.ENDC}")
+    install_start = time.monotonic()
+    if not run_command(command, "Dependencies yükleniyor", critical=True):
+        return False
+    duration = time.monotonic() - install_start
+    if write_stamp(root, stamp, duration):
+        print(f"{Colors.OKCYAN}📦 Kurulum {duration:.2f}s sürdü, damga yazıldı{Colors.ENDC}")
+    else:
+        print(f"{Colors.WARNING}⚠️  Kurulum {duration:.2f}s sürdü, damga yazılamadı; "
+              f"sonraki çalıştırmada tekrar kurulacak{Colors.ENDC}")
+    return True
+
+def changed_only_checks(checks, base=None, staged=False):
+    """Lint adımını git diff'te değişen dosyalarla sınırla
+
+    (kontroller, önceden belirlenmiş sonuçlar) döndürür. Lint
+    yapılandırması değiştiyse tam lint, lint edilecek dosya yoksa Lint
+    geçmiş sayılır ve çalıştırılmaz.
+    """
+    files, reason = plan_lint(os.getcwd(), base, staged)
+    print(f"{Colors.OKCYAN}🎯 Değişen dosya lint'i: {reason}{Colors.ENDC}")
+    if files is None:
+        print(f"{Colors.WARNING}   Tam lint çalıştırılacak{Colors.ENDC}")
+        return checks, {}
+    if not files:
+        print(f"{Colors.OKGREEN}   Lint edilecek dosya yok, Lint atlandı{Colors.ENDC}")
+        return [check for check in checks if check.name != "Lint"], {"Lint": True}
+    
+    narrowed = []
+    for check in checks:
+        if check.name == "Lint":
+            fix = check.daemon_params.get("fix", True)
+            check = Check(check.name, check.title, lint_command(files, fix), check.description,
+                          check.deps, check.critical, check.daemon_action, check.inputs,
+                          daemon_params=dict(check.daemon_params, files=files))
+        narrowed.append(check)
+    return narrowed, {}
+
+def lint_without_fix(checks):
+    """Lint'i dosyaları düzeltmeden çalıştır (--no-fix)
+
+    --fix'li Lint, tsc ve next build'in okuduğu src/ dosyalarını yeniden
+    yazdığından onlar Lint'i bekler; düzeltmesiz Lint onlarla paralel koşar.
+    """
+    result = []
+    for check in checks:
+        if check.name == "Lint" and check.command == LINT_COMMAND:
+            check = Check(check.name, check.title, LINT_CHECK_COMMAND, "ESLint kontrolü",
+                          check.deps, check.critical, check.daemon_action, check.inputs,
+                          dict(check.daemon_params, fix=False))
+        result.append(check)
+    return result
+
+def sharded_lint_checks(checks, shards):
+    """Tam Lint adımını shards paralel ESLint işçisine böl"""
+    root = os.getcwd()
+    
+    sharded = []
+    for check in checks:
+        fix = check.daemon_params.get("fix", True)
+        if check.name == "Lint" and check.command == lint_command(fix=fix):
+            def runner(on_line, cancel_event, timeout=None, fix=fix):
+                return run_sharded_lint(root, shards, resolve_toolchain(root), on_line, cancel_event,
+                                        timeout, fix)
+            
+            check = Check(check.name, check.title,
+                          f"npx eslint{' --fix' if fix else ''} ({shards} parça)",
+                          check.description, check.deps, check.critical, check.daemon_action,
+                          check.inputs, check.daemon_params, runner=runner)
+        sharded.append(check)
+    return sharded
+
+def print_summary(results):
+    """Sonuç özeti kutusunu yazdır, hepsi geçtiyse True döndür"""
     print(f"\n{Colors.BOLD}📊 SONUÇ ÖZETİ{Colors.ENDC}")
     print("╔══════════════════════════════════════════════════════════════╗")
     
@@ -111,6 +565,234 @@ def main():
             all_passed = False
     
     print("╚══════════════════════════════════════════════════════════════╝")
+    return all_passed
+
+def watch(checks, args, cache, daemon, trace=None, timeouts=None, build_cache=None):
+    """Dosya değişikliklerinde sadece etkilenen kontrolleri yeniden çalıştır
+
+    Kayıt patlamaları debounce ile tek tura toplanır. Yeni değişiklik
+    gelince süren tur iptal edilir; iptal edilen kontroller yeni turda
+    tekrar çalışır. Değişmeyen adımlar önbellekten döner.
+    """
+    root = os.getcwd()
+    watcher = FileWatcher(root, debounce=args.debounce)
+    last = {}  # kontrol adı -> son tamamlanan turdaki sonuç
+    state = {"thread": None, "cancel": None, "names": set()}
+    
+    def start(names):
+        selected = [check for check in checks if check.name in names]
+        cancel_event = threading.Event()
+        
+        def worker():
+            results = execute_checks(args, selected, cache=cache, daemon=daemon,
+                                     cancel_event=cancel_event, previous=last, trace=trace,
+                                     timeouts=timeouts, build_cache=build_cache)
+            if cancel_event.is_set():
+                return
+            last.update(results)
+            with _print_lock:
+                print_summary([(check.name, last[check.name]) for check in checks if check.name in last])
+                print(f"{Colors.OKCYAN}👀 Değişiklikler bekleniyor ({watcher.mode})...{Colors.ENDC}")
+        
+        thread = threading.Thread(target=worker, daemon=True)
+        state.update(thread=thread, cancel=cancel_event, names=set(names))
+        thread.start()
+    
+    def dependents(names):
+        # Yeniden çalışan adımın bağımlıları da bayat sayılır
+        names = set(names)
+        while True:
+            extra = {check.name for check in checks
+                     if check.name not in names and names.intersection(check.deps)}
+            if not extra:
+                return names
+            names |= extra
+    
+    print(f"{Colors.OKCYAN}👀 İzleme modu ({watcher.mode}), çıkmak için Ctrl+C{Colors.ENDC}")
+    start({check.name for check in checks})
+    try:
+        while True:
+            changed = watcher.wait_for_changes()
+            names = dependents(check.name for check in checks if is_affected(check.inputs, changed))
+            if not names:
+                continue
+            shown = ", ".join(sorted(changed)[:5]) + (" ..." if len(changed) > 5 else "")
+            log(f"\n{Colors.OKBLUE}🔁 Değişiklik: {shown} -> {', '.join(sorted(names))}{Colors.ENDC}")
+            thread = state["thread"]
+            if thread is not None and thread.is_alive():
+                # Süren tur bayatladı: iptal et, kontrollerini yeni tura ekle
+                state["cancel"].set()
+                thread.join()
+                names |= state["names"]
+            start(names)
+    except KeyboardInterrupt:
+        if state["cancel"] is not None:
+            state["cancel"].set()
+            state["thread"].join()
+        print(f"\n{Colors.OKCYAN}👋 İzleme durduruldu{Colors.ENDC}")
+    finally:
+        watcher.close()
+
+def write_trace(trace, directory):
+    if directory is None:
+        return
+    jsonl_path, chrome_path = trace.write(os.getcwd(), directory or None)
+    print(f"{Colors.OKCYAN}📈 İz: {jsonl_path}{Colors.ENDC}")
+    print(f"{Colors.OKCYAN}   Chrome trace (chrome://tracing, ui.perfetto.dev): {chrome_path}{Colors.ENDC}")
+
+def step_timeouts(checks, history, factor, daemon):
+    """Adım başına geçmişten zaman aşımı; yeterli geçmiş yoksa adım sınırsız"""
+    timeouts = {}
+    for check in checks:
+        source = "daemon" if daemon and check.daemon_action else "process"
+        timeout = history.adaptive_timeout(check.name, source, factor)
+        if timeout is not None:
+            timeouts[check.name] = timeout
+    if timeouts:
+        shown = ", ".join(f"{name} {seconds:.0f}s" for name, seconds in timeouts.items())
+        print(f"{Colors.OKCYAN}⏱️  Zaman aşımları (geçmiş p95 × {factor:g}): {shown}{Colors.ENDC}")
+    return timeouts
+
+def print_perf_report(window=WINDOW):
+    """Geçmiş sürelerden adım başına medyan/p95 ve yavaşlamalar
+
+    Son commit'in süreleri önceki window çalıştırmayla tek yönlü
+    Mann-Whitney U testiyle karşılaştırılır. Yavaşlama yoksa True döner.
+    """
+    reports = build_report(History(os.getcwd()), window)
+    print(f"{Colors.BOLD}📊 PERFORMANS RAPORU{Colors.ENDC} (adım başına son {window} başarılı çalıştırma)")
+    if not reports:
+        print(f"{Colors.WARNING}   Henüz geçmiş yok: kontrolleri en az bir kez çalıştırın{Colors.ENDC}")
+        return True
+    print(f"   {'Adım':<18} {'Kaynak':<8} {'n':>3} {'Medyan':>8} {'p95':>8} "
+          f"{'Son':>8} {'Değişim':>8} {'p':>6}")
+    regressed = []
+    for report in reports:
+        change = f"{report.change * 100:+.0f}%" if report.change is not None else "-"
+        p_value = f"{report.p_value:.3f}" if report.p_value is not None else "-"
+        line = (f"   {report.name:<18} {report.source:<8} {report.count:>3} {report.median:>7.2f}s "
+                f"{report.p95:>7.2f}s {report.recent_median:>7.2f}s {change:>8} {p_value:>6}")
+        if report.regressed:
+            regressed.append(report)
+            print(f"{Colors.FAIL}{line}  🐢 YAVAŞLAMA{Colors.ENDC}")
+        else:
+            print(line)
+    for report in regressed:
+        commits = ", ".join(commit[:8] for commit in report.commits) or "commit yok"
+        print(f"{Colors.FAIL}🐢 {report.name}: {report.baseline_median:.2f}s -> "
+              f"{report.recent_median:.2f}s ({commits}){Colors.ENDC}")
+    if not regressed:
+        print(f"{Colors.OKGREEN}✅ Anlamlı yavaşlama yok{Colors.ENDC}")
+    return not regressed
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="AkılHane proje kalite kontrolü")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Aynı anda çalışacak en fazla kontrol sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument("--engine", choices=("threads", "asyncio"),
+                        help="Çalıştırma motoru (varsayılan: threads, --fail-fast ile asyncio)")
+    parser.add_argument("--fail-fast", action="store_true",
+                        help="Kritik bir kontrol başarısız olunca çalışan diğer kontrolleri hemen "
+                             "durdur (asyncio motoru)")
+    parser.add_argument("--no-fix", action="store_true",
+                        help="Lint dosyaları düzeltmesin (--fix yok); TypeScript/Build Lint'i beklemeden "
+                             "paralel başlar")
+    parser.add_argument("--speculative-build", action="store_true",
+                        help="Build'i Lint/TypeScript sonucunu beklemeden başlat")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Sonuç önbelleğini kullanma, tüm kontrolleri yeniden çalıştır")
+    parser.add_argument("--no-build-cache", action="store_true",
+                        help=".next/cache görüntülerini geri yükleme/kaydetme (depo: .akilhane-cache/next-cache "
+                             "veya AKILHANE_NEXT_CACHE_DIR)")
+    parser.add_argument("--daemon", action="store_true",
+                        help="Lint/TypeScript'i açık tutulan tsc --watch ve ESLint süreçlerinde çalıştır "
+                             "(gerekirse daemon'u başlatır)")
+    parser.add_argument("--changed", nargs="?", const="HEAD", metavar="BASE",
+                        help="Sadece BASE'e (varsayılan: HEAD) göre değişen dosyaları lint et")
+    parser.add_argument("--staged", action="store_true",
+                        help="Sadece commit için hazırlanmış (staged) dosyaları lint et")
+    parser.add_argument("--lint-shards", type=int, default=1, metavar="N",
+                        help="Tam lint'i N paralel ESLint işçisine böl (0: CPU sayısı, varsayılan: 1)")
+    parser.add_argument("--watch", action="store_true",
+                        help="Dosya değişikliklerini izle, etkilenen kontrolleri otomatik yeniden çalıştır")
+    parser.add_argument("--debounce", type=float, default=DEBOUNCE,
+                        help="--watch: kayıtları birleştirme penceresi, saniye (varsayılan: %(default)s)")
+    parser.add_argument("--trace", nargs="?", const="", metavar="DIR",
+                        help="Adım sürelerini, kuyruk beklemesini, CPU ve bellek kullanımını JSONL ve "
+                             "Chrome trace olarak DIR'e yaz (varsayılan: .akilhane-cache/traces)")
+    parser.add_argument("--timeout-factor", type=float, default=TIMEOUT_FACTOR, metavar="F",
+                        help="Adım zaman aşımı = geçmiş sürelerin p95'i x F (en az 30 sn; az geçmişte "
+                             "zaman aşımı yok, 0: kapalı, varsayılan: %(default)s)")
+    parser.add_argument("--perf-report", action="store_true",
+                        help="Kontrolleri çalıştırmadan geçmiş sürelerden performans raporu yazdır; "
+                             "anlamlı yavaşlama varsa 1 ile çık")
+    parser.add_argument("--perf-window", type=int, default=WINDOW, metavar="N",
+                        help="--perf-report: adım başına karşılaştırılacak çalıştırma sayısı "
+                             "(varsayılan: %(default)s)")
+    args = parser.parse_args(argv)
+    if args.fail_fast and args.engine == "threads":
+        parser.error("--fail-fast asyncio motoruyla çalışır (--engine asyncio)")
+    if args.watch:
+        # İzleme, lint planını başta bir kez kurar; daraltılmış/parçalı lint bayatlardı
+        narrowing = [flag for flag, used in (("--changed", args.changed), ("--staged", args.staged),
+                                             ("--lint-shards", args.lint_shards != 1)) if used]
+        if narrowing:
+            parser.error(f"--watch ile {', '.join(narrowing)} birlikte kullanılamaz")
+    if args.engine is None:
+        args.engine = "asyncio" if args.fail_fast else "threads"
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.perf_report:
+        sys.exit(0 if print_perf_report(args.perf_window) else 1)
+    print_header()
+    
+    # Proje bilgileri
+    print(f"{Colors.BOLD}📋 Proje Bilgileri:{Colors.ENDC}")
+    print(f"   🏠 Dizin: {os.getcwd()}")
+    print(f"   📦 Package.json: {'✅ Var' if os.path.exists('package.json') else '❌ Yok'}")
+    print(f"   🔧 Next.js Config: {'✅ Var' if os.path.exists('next.config.js') or os.path.exists('next.config.ts') else '❌ Yok'}")
+    print(f"   📝 TypeScript Config: {'✅ Var' if os.path.exists('tsconfig.json') else '❌ Yok'}")
+    print()
+    
+    # Node modules kontrolü
+    if not check_node_modules():
+        sys.exit(1)
+    
+    # Kontroller: Lint (--fix) önce, TypeScript ondan sonra (--no-fix ile paralel), Build ikisinden sonra
+    cache = None if args.no_cache else ResultCache(os.getcwd())
+    build_cache = None if args.no_build_cache else NextCacheStore(os.getcwd())
+    daemon = args.daemon and ensure_daemon(os.getcwd())
+    if args.daemon:
+        if daemon:
+            print(f"{Colors.OKCYAN}⚡ Daemon hazır: Lint/TypeScript sıcak süreçlerde çalışacak{Colors.ENDC}")
+        else:
+            print(f"{Colors.WARNING}⚠️  Daemon başlatılamadı, kontroller normal çalışacak{Colors.ENDC}")
+    # Adım süreleri her çalıştırmada .akilhane-cache/history.db'ye yazılır
+    trace = Tracer()
+    history = History(os.getcwd())
+    timeouts = step_timeouts(CHECKS, history, args.timeout_factor, daemon)
+    checks, previous = CHECKS, {}
+    if args.no_fix:
+        checks = lint_without_fix(checks)
+    if args.watch:
+        watch(checks, args, cache, daemon, trace, timeouts, build_cache)
+        history.add(trace.spans, "cli")
+        write_trace(trace, args.trace)
+        sys.exit(0)
+    if args.changed or args.staged:
+        checks, previous = changed_only_checks(checks, args.changed, args.staged)
+    if args.lint_shards != 1:
+        shards = args.lint_shards or os.cpu_count() or 1
+        checks = sharded_lint_checks(checks, shards)
+    results = list(previous.items()) + execute_checks(
+        args, checks, cache=cache, daemon=daemon, previous=previous, trace=trace,
+        timeouts=timeouts, build_cache=build_cache)
+    
+    all_passed = print_summary(results)
+    history.add(trace.spans, "cli")
+    write_trace(trace, args.trace)
     
     # Final mesaj
     print(f"\n{Colors.BOLD}🎯 FİNAL DURUM{Colors.ENDC}")
@@ -0,0 +1,145 @@
+"""
+AkılHane Checker - asyncio Komut Çalıştırıcı
+Komutları asyncio alt süreç transport'larıyla başlatır, çıktıyı satır satır
+iletir; görev iptal edilince sürecin tüm ağacını durdurur
+"""
+
+import asyncio
+import functools
+import os
+import signal
+import subprocess
+import threading
+import time
+
+from checker_runner import (DRAIN_TIMEOUT, KILL_GRACE, POLL_INTERVAL, TAIL_LINES,
+                            LineDecoder, StreamResult, _group_options)
+
+class _PipeProtocol(asyncio.SubprocessProtocol):
+    """stdout/stderr'i geldikçe LineDecoder'lara veren süreç protokolü"""
+
+    def __init__(self, stdout, stderr):
+        self.decoders = {1: stdout, 2: stderr}
+        loop = asyncio.get_running_loop()
+        self.exited = loop.create_future()
+        self.drained = loop.create_future()  # iki pipe da kapandı
+
+    def pipe_data_received(self, fd, data):
+        decoder = self.decoders.get(fd)
+        if decoder is not None:
+            decoder.feed(data)
+
+    def pipe_connection_lost(self, fd, exc):
+        decoder = self.decoders.pop(fd, None)
+        if decoder is not None:
+            decoder.close()
+        if not self.decoders and not self.drained.done():
+            self.drained.set_result(None)
+
+    def process_exited(self):
+        if not self.exited.done():
+            self.exited.set_result(None)
+
+    def close(self):
+        """Okumayı bırak, yarım kalan son satırları ilet"""
+        for decoder in self.decoders.values():
+            decoder.close()
+        self.decoders.clear()
+
+async def _wait_exit(transport, protocol):
+    """Sürecin çıkmasını bekle, çıkış kodunu döndür
+
+    Pipe'ları açık tutan torun süreç olsa da sürecin kendi çıkışı
+    beklenir; process_exited gecikirse çıkış kodu yoklanır.
+    """
+    while transport.get_returncode() is None:
+        await asyncio.wait([protocol.exited], timeout=POLL_INTERVAL)
+    return transport.get_returncode()
+
+async def kill_tree_async(transport, protocol, grace=KILL_GRACE):
+    """checker_runner.kill_tree'nin asyncio karşılığı"""
+    pid = transport.get_pid()
+    if os.name == "nt":
+        killer = await asyncio.create_subprocess_exec(
+            "taskkill", "/T", "/F", "/PID", str(pid),
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        await killer.wait()
+    else:
+        try:
+            os.killpg(pid, signal.SIGTERM)
+            await asyncio.wait_for(_wait_exit(transport, protocol), grace)
+        except (ProcessLookupError, PermissionError, asyncio.TimeoutError):
+            pass
+        try:
+            # Lider çıksa da gruptaki torunlar yaşıyor olabilir
+            os.killpg(pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+    if transport.get_returncode() is None:
+        try:
+            transport.kill()
+        except ProcessLookupError:
+            pass
+    await _wait_exit(transport, protocol)
+    # Öldürülen süreçten kalan çıktıyı uzun süre bekleme
+    await asyncio.wait([protocol.drained], timeout=POLL_INTERVAL)
+
+async def stream_process(command, cwd=None, shell=True, timeout=None, on_line=None,
+                         tail_lines=TAIL_LINES, env=None):
+    """run_streaming'in asyncio karşılığı
+
+    Görev iptal edilirse süreç ağacı durdurulup asyncio.CancelledError
+    yeniden fırlatılır; timeout dolarsa subprocess.TimeoutExpired.
+    Süreci asyncio topladığından CPU/RSS kullanımı ölçülmez.
+    """
+    start_time = time.monotonic()
+    loop = asyncio.get_running_loop()
+    options = dict(stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                   cwd=cwd, env=env, **_group_options())
+    stdout = LineDecoder("stdout", on_line, tail_lines)
+    stderr = LineDecoder("stderr", on_line, tail_lines)
+    factory = functools.partial(_PipeProtocol, stdout, stderr)
+    if shell:
+        transport, protocol = await loop.subprocess_shell(factory, command, **options)
+    else:
+        transport, protocol = await loop.subprocess_exec(factory, *command, **options)
+
+    try:
+        returncode = await asyncio.wait_for(_wait_exit(transport, protocol), timeout)
+        # Pipe'ı açık tutan torun süreçler okumayı sonsuza kadar bekletmesin
+        await asyncio.wait([protocol.drained], timeout=DRAIN_TIMEOUT)
+    except asyncio.TimeoutError:
+        await kill_tree_async(transport, protocol)
+        raise subprocess.TimeoutExpired(command, timeout)
+    except BaseException:
+        await kill_tree_async(transport, protocol)
+        raise
+    finally:
+        protocol.close()
+        transport.close()
+
+    return StreamResult(
+        returncode,
+        stdout.text(),
+        stderr.text(),
+        time.monotonic() - start_time,
+        max(0, stdout.line_count - tail_lines) + max(0, stderr.line_count - tail_lines),
+    )
+
+async def to_thread(fn, *args, **kwargs):
+    """Bloklayan çağrıyı varsayılan executor'da çalıştır"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(fn, *args, **kwargs))
+
+async def run_cancellable(fn, *args, **kwargs):
+    """cancel_event alan bloklayan çağrıyı thread'de çalıştır
+
+    Görev iptal edilince cancel_event set edilir; çağrı kendi iptal
+    yoluyla (CommandCancelled) thread'de sonlanır.
+    """
+    cancel_event = threading.Event()
+    try:
+        return await to_thread(fn, *args, cancel_event=cancel_event, **kwargs)
+    except asyncio.CancelledError:
+        cancel_event.set()
+        raise
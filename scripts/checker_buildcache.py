@@ -0,0 +1,289 @@
+"""
+AkılHane Checker - Next.js Build Önbelleği
+.next/cache anlık görüntülerini package-lock.json, next.config.* ve
+tsconfig.json hash'leriyle saklar; build öncesi en uygun görüntüyü geri
+yükler, başarılı build sonrası kaydeder
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+
+from checker_cache import cache_dir
+
+STORE_DIR = "next-cache"
+# CI'da çalışma alanı her seferinde temiz başlar: depo kalıcı bir dizine alınabilir
+STORE_ENV = "AKILHANE_NEXT_CACHE_DIR"
+NEXT_CACHE = os.path.join(".next", "cache")
+
+# Anahtarın parçaları; next.config için ilk bulunan dosya kullanılır
+KEY_FILES = (
+    ("lockfile", ("package-lock.json",)),
+    ("next_config", ("next.config.ts", "next.config.js", "next.config.mjs")),
+    ("tsconfig", ("tsconfig.json",)),
+)
+# Kısmi eşleşmede parça ağırlıkları: lockfile değişince önbelleğin çoğu bayatlar
+WEIGHTS = {"lockfile": 4, "next_config": 2, "tsconfig": 1}
+
+# .next/cache içinde, diskteki önbelleğin hangi görüntüden geldiğini tutar
+MARKER = ".akilhane-snapshot"
+
+# Tahliye: toplam boyut ve son kullanımdan beri geçen süre sınırı
+MAX_BYTES = 2 * 1024 * 1024 * 1024
+MAX_AGE = 14 * 24 * 3600
+# Yeni yazılan nesneler, manifest'i henüz yazılmamış bir kayıt sürüyor
+# olabileceğinden bu süre dolmadan silinmez
+OBJECT_GRACE = 3600
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def key_parts(project_root):
+    """Anahtar parçası -> dosya içeriğinin sha256'sı (dosya yoksa None)"""
+    parts = {}
+    for part, names in KEY_FILES:
+        parts[part] = None
+        for name in names:
+            path = os.path.join(project_root, name)
+            if os.path.isfile(path):
+                parts[part] = _file_digest(path)
+                break
+    return parts
+
+def snapshot_key(parts):
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()
+
+def _write_atomic(directory, path, write):
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+class NextCacheStore:
+    """.next/cache için içerik adresli görüntü deposu
+
+    Dosya içerikleri objects/<sha256> altında bir kez saklanır, her
+    görüntü snapshots/<anahtar>.json manifest'idir; manifest'in mtime
+    değeri son kullanım zamanıdır. Görüntüler arasında değişmeyen
+    webpack/SWC dosyaları tekrar yazılmaz.
+    """
+
+    def __init__(self, project_root, directory=None, max_bytes=MAX_BYTES, max_age=MAX_AGE):
+        self.project_root = project_root
+        self.directory = directory or os.environ.get(STORE_ENV) or cache_dir(project_root, STORE_DIR)
+        self.objects_dir = os.path.join(self.directory, "objects")
+        self.snapshots_dir = os.path.join(self.directory, "snapshots")
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.snapshots_dir, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.cache_path = os.path.join(project_root, NEXT_CACHE)
+
+    def _object_path(self, digest):
+        return os.path.join(self.objects_dir, digest[:2], digest)
+
+    def _manifest_path(self, key):
+        return os.path.join(self.snapshots_dir, f"{key}.json")
+
+    def _load(self, key):
+        try:
+            with open(self._manifest_path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _manifests(self):
+        """[(son kullanım, manifest)] eskiden yeniye"""
+        manifests = []
+        for entry in os.scandir(self.snapshots_dir):
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                used = entry.stat().st_mtime
+                with open(entry.path, "r", encoding="utf-8") as f:
+                    manifests.append((used, json.load(f)))
+            except (OSError, ValueError):
+                continue
+        manifests.sort(key=lambda item: item[0])
+        return manifests
+
+    def _disk_key(self):
+        """Diskteki .next/cache'in geldiği görüntü (bilinmiyorsa None)"""
+        try:
+            with open(os.path.join(self.cache_path, MARKER), "r", encoding="utf-8") as f:
+                return f.read().strip() or None
+        except OSError:
+            return None
+
+    def best_match(self, parts):
+        """En çok ağırlıklı parçası tutan görüntü; eşitlikte en son kullanılan"""
+        best, best_rank = None, None
+        for used, manifest in self._manifests():
+            score = sum(WEIGHTS[part] for part, digest in parts.items()
+                        if manifest.get("parts", {}).get(part) == digest)
+            rank = (score, used)
+            if best_rank is None or rank >= best_rank:
+                best, best_rank = manifest, rank
+        return best
+
+    def restore(self):
+        """Build öncesi: diskteki önbellek güncel değilse en uygun görüntüyü geri yükle
+
+        Tam eşleşen görüntü yoksa ve diskte zaten bir .next/cache varsa
+        o korunur; kısmi eşleşme sadece önbelleksiz başlangıçta kullanılır.
+        Durumu anlatan tek satırlık mesaj döndürür; depo hataları build'i
+        durdurmaz.
+        """
+        try:
+            return self._restore()
+        except (OSError, ValueError, KeyError) as e:
+            return f"⚠️ .next/cache geri yüklenemedi: {e}"
+
+    def _restore(self):
+        start_time = time.monotonic()
+        parts = key_parts(self.project_root)
+        key = snapshot_key(parts)
+        if self._disk_key() == key:
+            return f"🗄️ .next/cache güncel ({key[:12]})"
+        manifest = self.best_match(parts)
+        on_disk = os.path.isdir(self.cache_path)
+        if manifest is None:
+            return "🗄️ Kayıtlı .next/cache görüntüsü yok" + (", diskteki korunuyor" if on_disk else "")
+        exact = manifest["key"] == key
+        if on_disk and not exact:
+            return "🗄️ Tam eşleşen görüntü yok, diskteki .next/cache korunuyor"
+
+        # Yarım kalan geri yükleme build'i bozmasın: yan dizine yaz, sonra yer değiştir
+        next_dir = os.path.dirname(self.cache_path)
+        os.makedirs(next_dir, exist_ok=True)
+        staging = tempfile.mkdtemp(prefix="cache-restore-", dir=next_dir)
+        try:
+            for rel_path, (digest, size, mtime_ns) in manifest["files"].items():
+                target = os.path.join(staging, *rel_path.split("/"))
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                shutil.copyfile(self._object_path(digest), target)
+                # Kayıtta değişmemiş dosyalar yeniden hash'lenmesin
+                os.utime(target, ns=(mtime_ns, mtime_ns))
+            with open(os.path.join(staging, MARKER), "w", encoding="utf-8") as f:
+                f.write(manifest["key"])
+            if on_disk:
+                shutil.rmtree(self.cache_path)
+            os.replace(staging, self.cache_path)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        os.utime(self._manifest_path(manifest["key"]))
+        size = sum(size for _, size, _ in manifest["files"].values())
+        return (f"🗄️ .next/cache geri yüklendi: {'tam' if exact else 'kısmi'} eşleşme "
+                f"({manifest['key'][:12]}, {len(manifest['files'])} dosya, "
+                f"{size / 1024 / 1024:.1f} MB, {time.monotonic() - start_time:.2f}s)")
+
+    def save(self):
+        """Başarılı build sonrası .next/cache'i güncel anahtarla kaydet ve tahliye et"""
+        try:
+            return self._save()
+        except (OSError, ValueError, KeyError) as e:
+            return f"⚠️ .next/cache kaydedilemedi: {e}"
+
+    def _save(self):
+        start_time = time.monotonic()
+        if not os.path.isdir(self.cache_path):
+            return "🗄️ .next/cache yok, kaydedilmedi"
+        parts = key_parts(self.project_root)
+        key = snapshot_key(parts)
+        # Geri yüklenen görüntünün dosyaları boyut/mtime aynıysa yeniden hash'lenmez
+        disk_key = self._disk_key()
+        previous = (self._load(disk_key) if disk_key else None) or {"files": {}}
+        files = {}
+        written = 0
+        for root, subdirs, filenames in os.walk(self.cache_path):
+            subdirs.sort()
+            for filename in sorted(filenames):
+                path = os.path.join(root, filename)
+                rel_path = os.path.relpath(path, self.cache_path).replace(os.sep, "/")
+                if rel_path == MARKER:
+                    continue
+                try:
+                    stat = os.stat(path)
+                    known = previous["files"].get(rel_path)
+                    if known and known[1] == stat.st_size and known[2] == stat.st_mtime_ns:
+                        digest = known[0]
+                    else:
+                        digest = _file_digest(path)
+                    object_path = self._object_path(digest)
+                    if os.path.exists(object_path):
+                        os.utime(object_path)
+                    else:
+                        os.makedirs(os.path.dirname(object_path), exist_ok=True)
+                        with open(path, "rb") as source:
+                            _write_atomic(os.path.dirname(object_path), object_path,
+                                          lambda f: shutil.copyfileobj(source, f, 1 << 20))
+                        written += stat.st_size
+                except OSError:
+                    # Build'in arkasında silinen geçici dosya
+                    continue
+                files[rel_path] = (digest, stat.st_size, stat.st_mtime_ns)
+
+        manifest = {"key": key, "parts": parts, "created": time.time(),
+                    "files": files}
+        _write_atomic(self.snapshots_dir, self._manifest_path(key),
+                      lambda f: f.write(json.dumps(manifest).encode("utf-8")))
+        with open(os.path.join(self.cache_path, MARKER), "w", encoding="utf-8") as f:
+            f.write(key)
+        evicted = self.evict()
+        size = sum(size for _, size, _ in files.values())
+        return (f"🗄️ .next/cache kaydedildi ({key[:12]}, {len(files)} dosya, "
+                f"{size / 1024 / 1024:.1f} MB, yeni {written / 1024 / 1024:.1f} MB, "
+                f"{time.monotonic() - start_time:.2f}s"
+                + (f", {evicted} eski görüntü silindi)" if evicted else ")"))
+
+    def evict(self):
+        """Yaşı/toplam boyutu aşan görüntüleri ve sahipsiz nesneleri sil
+
+        En son kullanılan görüntü boyut sınırını aşsa da tutulur. Silinen
+        görüntü sayısını döndürür.
+        """
+        now = time.time()
+        manifests = self._manifests()
+        kept = [(used, manifest) for used, manifest in manifests if now - used <= self.max_age]
+
+        def total(items):
+            sizes = {}
+            for _, manifest in items:
+                for digest, size, _ in manifest["files"].values():
+                    sizes[digest] = size
+            return sum(sizes.values())
+
+        while len(kept) > 1 and total(kept) > self.max_bytes:
+            kept.pop(0)
+        for used, manifest in manifests:
+            if all(manifest is not other for _, other in kept):
+                try:
+                    os.remove(self._manifest_path(manifest["key"]))
+                except OSError:
+                    pass
+
+        referenced = {digest for _, manifest in kept for digest, _, _ in manifest["files"].values()}
+        for root, _, filenames in os.walk(self.objects_dir):
+            for filename in filenames:
+                path = os.path.join(root, filename)
+                if filename in referenced:
+                    continue
+                try:
+                    if now - os.stat(path).st_mtime > OBJECT_GRACE:
+                        os.remove(path)
+                except OSError:
+                    pass
+        return len(manifests) - len(kept)
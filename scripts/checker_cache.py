@@ -0,0 +1,143 @@
+"""
+AkılHane Checker - Sonuç Önbelleği
+Girdiler değişmediyse lint/typecheck/build sonucunu diskten tekrar oynatır
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+# Tüm checker araçlarının ortak önbellek dizini (proje kökünde)
+CACHE_DIR_NAME = ".akilhane-cache"
+
+# Sonucu etkileyen dizinler ve kök dosyalar
+INPUT_DIRS = ("src", "public")
+INPUT_FILES = (
+    "package.json",
+    "package-lock.json",
+    "tsconfig.json",
+    "next.config.ts",
+    "next.config.js",
+    ".eslintrc.js",
+    "tailwind.config.ts",
+    "postcss.config.mjs",
+    "next-env.d.ts",
+    ".env",
+    ".env.local",
+    ".env.production",
+)
+
+def cache_dir(project_root, *parts):
+    """Önbellek dizini altında bir yol döndür (dizini oluşturur)"""
+    path = os.path.join(project_root, CACHE_DIR_NAME, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def iter_input_files(project_root, dirs=INPUT_DIRS, files=INPUT_FILES):
+    """Hash'e giren dosyaları sıralı olarak (göreli yol) üret"""
+    for name in files:
+        if os.path.isfile(os.path.join(project_root, name)):
+            yield name
+    for top in dirs:
+        top_path = os.path.join(project_root, top)
+        for root, subdirs, filenames in os.walk(top_path):
+            subdirs.sort()
+            for filename in sorted(filenames):
+                full_path = os.path.join(root, filename)
+                yield os.path.relpath(full_path, project_root).replace(os.sep, "/")
+
+def hash_inputs(project_root, dirs=INPUT_DIRS, files=INPUT_FILES):
+    """Girdi dosyalarının yol + içeriklerinden tek bir sha256 üret"""
+    digest = hashlib.sha256()
+    for rel_path in iter_input_files(project_root, dirs, files):
+        digest.update(rel_path.encode("utf-8") + b"\0")
+        try:
+            with open(os.path.join(project_root, rel_path), "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+        except OSError:
+            # Okuma sırasında silinen dosya: yolu yine de hash'e girdi
+            pass
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+class ResultCache:
+    """İçerik hash'i anahtarlı, LRU tahliyeli kalıcı sonuç önbelleği
+
+    Her kayıt results/<anahtar>.json dosyasıdır; dosyanın mtime değeri
+    son kullanım zamanıdır. Sadece başarılı sonuçlar saklanır, hatalar
+    her seferinde yeniden çalıştırılır.
+    """
+
+    def __init__(self, project_root, max_bytes=64 * 1024 * 1024, max_entries=256):
+        self.project_root = project_root
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.results_dir = cache_dir(project_root, "results")
+
+    def key(self, command):
+        """Komut satırı + güncel girdi ağacı için anahtar"""
+        digest = hashlib.sha256()
+        digest.update(command.encode("utf-8") + b"\0")
+        digest.update(hash_inputs(self.project_root).encode("ascii"))
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.results_dir, f"{key}.json")
+
+    def get(self, key):
+        """Kayıt varsa döndür ve son kullanım zamanını güncelle"""
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                record = json.load(f)
+            os.utime(path)
+            return record
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key, command, returncode, stdout="", stderr="", duration=0.0):
+        """Başarılı sonucu sakla; başarısızları yok say"""
+        if returncode != 0:
+            return
+        record = {
+            "command": command,
+            "returncode": returncode,
+            "stdout": stdout,
+            "stderr": stderr,
+            "duration": duration,
+            "created": time.time(),
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=self.results_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(record, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        self.evict()
+
+    def evict(self):
+        """Boyut/adet sınırı aşıldıysa en eski kullanılanları sil"""
+        entries = []
+        for entry in os.scandir(self.results_dir):
+            if entry.name.endswith(".json"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        while entries and (total > self.max_bytes or len(entries) > self.max_entries):
+            _, size, path = entries.pop(0)
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
@@ -0,0 +1,408 @@
+"""
+AkılHane Checker - Sıcak Araç Daemon'u
+tsc --watch ve ESLint işçisini açık tutar; ön yüzler yerel soketle konuşur
+
+Kullanım:
+    python scripts/checker_daemon.py start|stop|status [--project-root DİZİN]
+"""
+
+import argparse
+import json
+import os
+import re
+import secrets
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+
+from checker_cache import CACHE_DIR_NAME, INPUT_DIRS, cache_dir, iter_input_files
+from checker_runner import CommandCancelled, POLL_INTERVAL, StreamResult, _group_options, kill_tree
+from checker_toolchain import resolve_command, resolve_toolchain
+
+STATE_FILE = "daemon.json"
+LOG_FILE = "daemon.log"
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "eslint-worker.js")
+
+# İstek gelmezse daemon kendini kapatır (süreç öksüz kalmasın)
+IDLE_TIMEOUT = 30 * 60
+# start sonrası daemon'un hazır olmasını bekleme sınırı
+STARTUP_TIMEOUT = 15
+# tsc'nin bir dosya değişikliğini fark edip yeni tur başlatması için süre
+TSC_SETTLE = 1.0
+# tsc --watch'un izlediği uzantılar (tazelik kontrolü için)
+TSC_EXTENSIONS = (".ts", ".tsx", ".mts", ".cts", ".js", ".jsx", ".json")
+
+# tsc --watch, --incremental ile tur arası durumu .tsbuildinfo'da saklar
+TSC_COMMAND = ("npx tsc --noEmit --watch --preserveWatchOutput --incremental "
+               "--tsBuildInfoFile .akilhane-cache/tsc.tsbuildinfo --locale en --pretty false")
+
+class DaemonUnavailable(Exception):
+    """Daemon çalışmıyor veya isteğe cevap veremedi"""
+
+def newest_input_mtime(project_root):
+    """tsc'nin izlediği girdiler içindeki en yeni mtime
+
+    Silinen dosyalar sadece dizinin mtime değerini değiştirdiği için
+    dizinler de hesaba katılır.
+    """
+    paths = set(INPUT_DIRS)
+    for rel_path in iter_input_files(project_root):
+        if rel_path.endswith(TSC_EXTENSIONS):
+            paths.add(rel_path)
+            paths.add(os.path.dirname(rel_path))
+    paths.discard("")  # Kök dizin .next vb. yüzünden sürekli değişir
+    newest = 0.0
+    for rel_path in paths:
+        try:
+            newest = max(newest, os.stat(os.path.join(project_root, rel_path)).st_mtime)
+        except OSError:
+            pass
+    return newest
+
+class TscWatcher:
+    """tsc --watch sürecini izler, her derleme turunun tanılarını saklar"""
+
+    CYCLE_START = re.compile(r"Starting (?:compilation in watch mode|incremental compilation)")
+    CYCLE_END = re.compile(r"Found (\d+) errors?")
+
+    def __init__(self, project_root, toolchain):
+        self.project_root = project_root
+        self.cond = threading.Condition()
+        self.cycle_start = None  # Süren turun başlangıcı (tur yoksa None)
+        self.last_start = None  # Son biten turun başlangıcı
+        self.last_end = None
+        self.last_errors = 0
+        self.last_output = ""
+        self._lines = []
+
+        cache_dir(project_root)
+        args, shell = resolve_command(TSC_COMMAND, toolchain)
+        self.process = subprocess.Popen(
+            args,
+            shell=shell,
+            cwd=project_root,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            encoding="utf-8",
+            errors="replace",
+            **_group_options(),
+        )
+        threading.Thread(target=self._read, daemon=True).start()
+
+    def _read(self):
+        for line in self.process.stdout:
+            line = line.rstrip("\r\n")
+            with self.cond:
+                if self.CYCLE_START.search(line):
+                    self.cycle_start = time.time()
+                    self._lines = []
+                    continue
+                match = self.CYCLE_END.search(line)
+                if match and self.cycle_start is not None:
+                    self.last_start = self.cycle_start
+                    self.last_end = time.time()
+                    self.last_errors = int(match.group(1))
+                    self.last_output = "\n".join(self._lines).strip()
+                    self.cycle_start = None
+                    self.cond.notify_all()
+                elif line.strip():
+                    self._lines.append(line)
+        with self.cond:
+            self.cond.notify_all()
+
+    def check(self, timeout=None):
+        """Güncel dosyaları yansıtan ilk tur sonucunu döndür
+
+        Son turdan sonra değişen dosya varsa tsc'nin yeni turu beklenir;
+        tsc'nin ilgilenmediği bir dosya değiştiyse TSC_SETTLE sonunda son
+        sonuç kullanılır.
+        """
+        requested = time.time()
+        newest = newest_input_mtime(self.project_root)
+        deadline = requested + timeout if timeout else None
+        with self.cond:
+            while True:
+                if self.process.poll() is not None:
+                    raise DaemonUnavailable("tsc --watch sonlandı")
+                if self.cycle_start is None and self.last_end is not None:
+                    fresh = newest < self.last_start
+                    settled = time.time() - max(requested, self.last_end) >= TSC_SETTLE
+                    if fresh or settled:
+                        return {
+                            "returncode": 1 if self.last_errors else 0,
+                            "stdout": self.last_output,
+                            "stderr": "",
+                        }
+                if deadline is not None and time.time() > deadline:
+                    raise DaemonUnavailable("tsc turu zaman aşımına uğradı")
+                self.cond.wait(POLL_INTERVAL)
+
+    def stop(self):
+        # npx -> sh -> node zinciri: sadece npx öldürülürse tsc --watch yetim kalır
+        if self.process.poll() is None:
+            kill_tree(self.process)
+
+class ESLintWorker:
+    """eslint-worker.js ile satır başına JSON konuşan sıcak süreç"""
+
+    def __init__(self, project_root, toolchain):
+        self.lock = threading.Lock()
+        self.next_id = 0
+        node = toolchain.get("node") or "node"
+        self.process = subprocess.Popen(
+            [node, WORKER_SCRIPT, project_root],
+            cwd=project_root,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
+            **_group_options(),
+        )
+
+    def lint(self, fix=True, files=None):
+        with self.lock:
+            if self.process.poll() is not None:
+                raise DaemonUnavailable("ESLint işçisi sonlandı")
+            self.next_id += 1
+            request = {"id": self.next_id, "fix": fix, "files": files or []}
+            self.process.stdin.write(json.dumps(request) + "\n")
+            self.process.stdin.flush()
+            line = self.process.stdout.readline()
+        if not line:
+            raise DaemonUnavailable("ESLint işçisi cevap vermedi")
+        response = json.loads(line)
+        if not response.get("ok"):
+            return {"returncode": 2, "stdout": "", "stderr": response.get("error", "")}
+        return {
+            "returncode": 1 if response["errorCount"] else 0,
+            "stdout": response["output"].strip(),
+            "stderr": "",
+        }
+
+    def stop(self):
+        if self.process.poll() is None:
+            kill_tree(self.process)
+
+class CheckerDaemon(socketserver.ThreadingTCPServer):
+    """127.0.0.1 üzerinde dinleyen, token doğrulamalı istek sunucusu"""
+
+    daemon_threads = True
+
+    def __init__(self, project_root):
+        super().__init__(("127.0.0.1", 0), _RequestHandler)
+        self.project_root = project_root
+        self.token = secrets.token_hex(16)
+        self.last_request = time.time()
+        self._tsc = None
+        self._eslint = None
+        self._tools_lock = threading.Lock()
+        self.toolchain = resolve_toolchain(project_root)
+        self.state_file = os.path.join(cache_dir(project_root), STATE_FILE)
+
+    def tsc(self):
+        # Araçlar ilk istekte başlatılır, sonra sıcak kalır
+        with self._tools_lock:
+            if self._tsc is None or self._tsc.process.poll() is not None:
+                self._tsc = TscWatcher(self.project_root, self.toolchain)
+            return self._tsc
+
+    def eslint(self):
+        with self._tools_lock:
+            if self._eslint is None or self._eslint.process.poll() is not None:
+                self._eslint = ESLintWorker(self.project_root, self.toolchain)
+            return self._eslint
+
+    def handle_action(self, request):
+        self.last_request = time.time()
+        action = request.get("action")
+        if action == "ping":
+            return {"ok": True, "pid": os.getpid()}
+        if action == "shutdown":
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {"ok": True}
+
+        start_time = time.time()
+        if action == "typecheck":
+            result = self.tsc().check(request.get("timeout"))
+        elif action == "lint":
+            result = self.eslint().lint(request.get("fix", True), request.get("files"))
+        else:
+            return {"ok": False, "error": f"Bilinmeyen işlem: {action}"}
+        result.update(ok=True, duration=time.time() - start_time)
+        self.last_request = time.time()
+        return result
+
+    def write_state(self):
+        state = {"pid": os.getpid(), "port": self.server_address[1], "token": self.token}
+        tmp_file = self.state_file + ".tmp"
+        # Token'ı sadece dosya sahibi okuyabilsin
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_file, self.state_file)
+
+    def watch_idle(self, idle_timeout):
+        while True:
+            time.sleep(min(idle_timeout, 30))
+            if time.time() - self.last_request > idle_timeout:
+                self.shutdown()
+                return
+
+    def serve(self, idle_timeout=IDLE_TIMEOUT):
+        # tsc ilk turu istek beklemeden başlasın
+        self.tsc()
+        self.write_state()
+        threading.Thread(target=self.watch_idle, args=(idle_timeout,), daemon=True).start()
+        try:
+            self.serve_forever(poll_interval=0.5)
+        finally:
+            for tool in (self._tsc, self._eslint):
+                if tool is not None:
+                    tool.stop()
+            try:
+                if read_state(self.project_root).get("pid") == os.getpid():
+                    os.remove(self.state_file)
+            except (OSError, AttributeError):
+                pass
+            self.server_close()
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline().decode("utf-8"))
+            if not secrets.compare_digest(str(request.get("token", "")), self.server.token):
+                response = {"ok": False, "error": "Geçersiz token"}
+            else:
+                response = self.server.handle_action(request)
+        except Exception as e:
+            response = {"ok": False, "error": str(e)}
+        self.wfile.write((json.dumps(response, ensure_ascii=False) + "\n").encode("utf-8"))
+
+def read_state(project_root):
+    """daemon.json içeriği (yoksa None)"""
+    try:
+        with open(os.path.join(project_root, CACHE_DIR_NAME, STATE_FILE), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def request(project_root, action, timeout=None, cancel_event=None, **params):
+    """Daemon'a tek istek gönder, yanıt sözlüğünü döndür
+
+    Daemon yoksa veya bağlantı koparsa DaemonUnavailable, cancel_event
+    set edilirse CommandCancelled fırlatılır.
+    """
+    state = read_state(project_root)
+    if not state:
+        raise DaemonUnavailable("Daemon çalışmıyor")
+    payload = dict(params, action=action, token=state["token"], timeout=timeout)
+    start_time = time.time()
+    try:
+        with socket.create_connection(("127.0.0.1", state["port"]), timeout=2) as sock:
+            sock.sendall((json.dumps(payload) + "\n").encode("utf-8"))
+            sock.settimeout(POLL_INTERVAL)
+            data = b""
+            while not data.endswith(b"\n"):
+                if cancel_event is not None and cancel_event.is_set():
+                    raise CommandCancelled(action)
+                if timeout is not None and time.time() - start_time > timeout:
+                    raise subprocess.TimeoutExpired(action, timeout)
+                try:
+                    chunk = sock.recv(65536)
+                except socket.timeout:
+                    continue
+                if not chunk:
+                    raise DaemonUnavailable("Daemon bağlantıyı kapattı")
+                data += chunk
+    except OSError as e:
+        raise DaemonUnavailable(f"Daemon'a bağlanılamadı: {e}")
+    response = json.loads(data.decode("utf-8"))
+    if not response.get("ok"):
+        raise DaemonUnavailable(response.get("error", "Bilinmeyen daemon hatası"))
+    return response
+
+def run_daemon_check(project_root, action, timeout=None, cancel_event=None, **params):
+    """Daemon üzerinden kontrol çalıştır; run_streaming ile aynı sonuç tipi"""
+    start_time = time.time()
+    response = request(project_root, action, timeout, cancel_event, **params)
+    return StreamResult(response["returncode"], response["stdout"], response["stderr"],
+                        time.time() - start_time)
+
+def is_running(project_root):
+    try:
+        request(project_root, "ping", timeout=2)
+        return True
+    except DaemonUnavailable:
+        return False
+
+def ensure_daemon(project_root, timeout=STARTUP_TIMEOUT):
+    """Daemon çalışmıyorsa arka planda başlat ve hazır olmasını bekle"""
+    if is_running(project_root):
+        return True
+    log_path = os.path.join(cache_dir(project_root), LOG_FILE)
+    kwargs = {}
+    if os.name == "nt":
+        kwargs["creationflags"] = (subprocess.DETACHED_PROCESS
+                                   | subprocess.CREATE_NEW_PROCESS_GROUP)
+    else:
+        # Terminal kapanınca (SIGHUP) daemon da ölmesin
+        kwargs["start_new_session"] = True
+    with open(log_path, "ab") as log_file:
+        subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), "serve", "--project-root", project_root],
+            cwd=project_root,
+            stdin=subprocess.DEVNULL,
+            stdout=log_file,
+            stderr=log_file,
+            **kwargs
+        )
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if is_running(project_root):
+            return True
+        time.sleep(POLL_INTERVAL)
+    return False
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="AkılHane checker daemon'u")
+    parser.add_argument("command", choices=("start", "serve", "stop", "status"))
+    parser.add_argument("--project-root", default=os.getcwd(),
+                        help="Proje kök dizini (varsayılan: çalışma dizini)")
+    parser.add_argument("--idle-timeout", type=int, default=IDLE_TIMEOUT,
+                        help="Bu kadar saniye istek gelmezse kapan")
+    args = parser.parse_args(argv)
+    project_root = os.path.abspath(args.project_root)
+
+    if args.command == "serve":
+        # Aynı proje için ikinci daemon açma
+        if is_running(project_root):
+            print("ℹ️  Daemon zaten çalışıyor")
+            return 0
+        CheckerDaemon(project_root).serve(args.idle_timeout)
+        return 0
+    if args.command == "start":
+        if ensure_daemon(project_root):
+            print(f"✅ Daemon çalışıyor (pid {read_state(project_root)['pid']})")
+            return 0
+        print(f"❌ Daemon başlatılamadı, bkz. .akilhane-cache/{LOG_FILE}")
+        return 1
+    if args.command == "stop":
+        try:
+            request(project_root, "shutdown", timeout=5)
+            print("🛑 Daemon durduruldu")
+        except DaemonUnavailable:
+            print("ℹ️  Daemon çalışmıyor")
+        return 0
+    if is_running(project_root):
+        print(f"✅ Daemon çalışıyor (pid {read_state(project_root)['pid']})")
+        return 0
+    print("ℹ️  Daemon çalışmıyor")
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,264 @@
+"""
+AkılHane Checker - Süre Geçmişi
+Her adımın süresini ve sonucunu git commit'iyle birlikte SQLite'a yazar,
+yavaşlamaları Mann-Whitney U testiyle bulur
+"""
+
+import math
+import os
+import sqlite3
+import statistics
+import subprocess
+import time
+
+from checker_cache import cache_dir
+
+HISTORY_FILE = "history.db"
+
+# Rapor: karşılaştırma penceresi, en az örnek sayıları ve eşikler
+WINDOW = 20
+MIN_RECENT = 3
+MIN_BASELINE = 5
+ALPHA = 0.05
+MIN_SLOWDOWN = 0.10  # Medyanda en az %10 artış
+
+# Uyarlanır zaman aşımı: son WINDOW başarılı sürenin p95'i x TIMEOUT_FACTOR,
+# en az MIN_TIMEOUT saniye; MIN_TIMEOUT_SAMPLES'tan az geçmiş varsa varsayılan
+TIMEOUT_FACTOR = 3.0
+MIN_TIMEOUT = 30.0
+MIN_TIMEOUT_SAMPLES = 5
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS steps (
+    id INTEGER PRIMARY KEY,
+    recorded_at REAL NOT NULL,
+    git_commit TEXT,
+    dirty INTEGER NOT NULL DEFAULT 0,
+    frontend TEXT NOT NULL,
+    name TEXT NOT NULL,
+    source TEXT,
+    status TEXT NOT NULL,
+    cached INTEGER NOT NULL DEFAULT 0,
+    returncode INTEGER,
+    duration REAL NOT NULL,
+    queue_wait REAL,
+    cpu_user REAL,
+    cpu_sys REAL,
+    max_rss_kb INTEGER
+);
+CREATE INDEX IF NOT EXISTS steps_name ON steps (name, source, id);
+"""
+
+def current_commit(project_root):
+    """(HEAD commit'i, çalışma ağacı kirli mi); git yoksa (None, False)"""
+    def git(*args):
+        return subprocess.run(["git", *args], cwd=project_root, stdin=subprocess.DEVNULL,
+                              stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    try:
+        head = git("rev-parse", "HEAD")
+        if head.returncode != 0:
+            return None, False
+        status = git("status", "--porcelain", "--untracked-files=no")
+    except OSError:
+        return None, False
+    return head.stdout.decode().strip(), bool(status.stdout.strip())
+
+class History:
+    """Adım süreleri için yerel zaman serisi (.akilhane-cache/history.db)
+
+    Her çağrı kendi bağlantısını açar; farklı thread'lerden kullanılabilir.
+    """
+
+    def __init__(self, project_root):
+        self.project_root = project_root
+        self.path = os.path.join(cache_dir(project_root), HISTORY_FILE)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        return conn
+
+    def add(self, spans, frontend):
+        """Tracer kayıtlarını commit bilgisiyle birlikte yaz
+
+        Geçmiş yazılamazsa (kilitli/bozuk veritabanı) kontroller etkilenmez,
+        False döner.
+        """
+        if not spans:
+            return True
+        commit, dirty = current_commit(self.project_root)
+        now = time.time()
+        rows = [(
+            now,
+            commit,
+            int(dirty),
+            frontend,
+            span["name"],
+            span.get("source"),
+            span.get("status") or "unknown",
+            int(bool(span.get("cached")) or span.get("status") == "cached"),
+            span.get("returncode"),
+            span["duration"],
+            span.get("queue_wait"),
+            span.get("cpu_user"),
+            span.get("cpu_sys"),
+            span.get("max_rss_kb"),
+        ) for span in spans]
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT INTO steps (recorded_at, git_commit, dirty, frontend, name, source, status,"
+                        " cached, returncode, duration, queue_wait, cpu_user, cpu_sys, max_rss_kb)"
+                        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError):
+            return False
+        return True
+
+    def samples(self):
+        """(adım, kaynak) -> [(commit, süre), ...] eskiden yeniye
+
+        Sadece gerçekten çalışmış başarılı adımlar: önbellekten dönen,
+        iptal edilen ve hatalı adımların süresi karşılaştırılamaz.
+        """
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT name, source, git_commit, duration FROM steps"
+                " WHERE status = 'success' AND cached = 0 ORDER BY id").fetchall()
+        finally:
+            conn.close()
+        series = {}
+        for name, source, commit, duration in rows:
+            series.setdefault((name, source or "process"), []).append((commit, duration))
+        return series
+
+    def durations(self, name, source="process", limit=WINDOW):
+        """Adımın son limit başarılı (önbelleksiz) süresi"""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT duration FROM steps WHERE name = ? AND COALESCE(source, 'process') = ?"
+                " AND status = 'success' AND cached = 0 ORDER BY id DESC LIMIT ?",
+                (name, source, limit)).fetchall()
+        finally:
+            conn.close()
+        return [duration for (duration,) in rows]
+
+    def adaptive_timeout(self, name, source="process", factor=TIMEOUT_FACTOR, default=None):
+        """Geçmişten zaman aşımı (saniye); factor <= 0 veya az geçmişte default"""
+        if factor <= 0:
+            return default
+        try:
+            samples = self.durations(name, source)
+        except (sqlite3.Error, OSError):
+            return default
+        if len(samples) < MIN_TIMEOUT_SAMPLES:
+            return default
+        return max(MIN_TIMEOUT, percentile(samples, 95) * factor)
+
+def percentile(values, q):
+    """Doğrusal ara değerli yüzdelik (q: 0-100)"""
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    low = math.floor(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+def _exact_u_tail(n1, n2, u):
+    """Bağ yokken P(U >= u): U'nun tam dağılımı (dinamik programlama)"""
+    # counts[i][j] = i ve j örnekle her U değerinin kaç sıralamada çıktığı
+    counts = [[None] * (n2 + 1) for _ in range(n1 + 1)]
+    for i in range(n1 + 1):
+        for j in range(n2 + 1):
+            if i == 0 or j == 0:
+                counts[i][j] = [1]
+                continue
+            # En büyük değer ilk gruptaysa j tane ikinci grup değerini geçer
+            with_first, with_second = counts[i - 1][j], counts[i][j - 1]
+            merged = [0] * (i * j + 1)
+            for value, count in enumerate(with_first):
+                merged[value + j] += count
+            for value, count in enumerate(with_second):
+                merged[value] += count
+            counts[i][j] = merged
+    distribution = counts[n1][n2]
+    return sum(distribution[math.ceil(u):]) / sum(distribution)
+
+def mann_whitney_greater(recent, baseline):
+    """Tek yönlü Mann-Whitney U: recent, baseline'dan büyük mü
+
+    (U, p) döndürür. Bağ yoksa ve örnekler küçükse tam dağılım, aksi
+    halde bağ düzeltmeli normal yaklaşım kullanılır.
+    """
+    n1, n2 = len(recent), len(baseline)
+    combined = sorted([(value, 0) for value in recent] + [(value, 1) for value in baseline])
+    ranks = [0.0] * len(combined)
+    tie_term = 0
+    index = 0
+    while index < len(combined):
+        end = index
+        while end + 1 < len(combined) and combined[end + 1][0] == combined[index][0]:
+            end += 1
+        for k in range(index, end + 1):
+            ranks[k] = (index + end) / 2 + 1
+        size = end - index + 1
+        tie_term += size ** 3 - size
+        index = end + 1
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, combined) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+
+    if tie_term == 0 and n1 * n2 <= 400:
+        return u, _exact_u_tail(n1, n2, u)
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return u, 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return u, 0.5 * math.erfc(z / math.sqrt(2))
+
+class StepReport:
+    """Bir adımın pencere istatistikleri ve yavaşlama kararı"""
+
+    def __init__(self, name, source, samples, window=WINDOW):
+        self.name = name
+        self.source = source
+        recent_window = samples[-window:]
+        self.count = len(recent_window)
+        self.median = statistics.median(duration for _, duration in recent_window)
+        self.p95 = percentile([duration for _, duration in recent_window], 95)
+
+        # Son commit'in örnekleri; CI'da commit başına tek çalıştırma
+        # olabileceğinden en az MIN_RECENT örnek alınır
+        last_commit = samples[-1][0]
+        recent_count = 0
+        while recent_count < len(samples) and samples[-1 - recent_count][0] == last_commit:
+            recent_count += 1
+        recent_count = max(recent_count, MIN_RECENT)
+        recent = samples[-recent_count:]
+        baseline = samples[-recent_count - window:-recent_count]
+
+        self.commits = list(dict.fromkeys(commit for commit, _ in recent if commit))
+        self.recent_median = statistics.median(duration for _, duration in recent)
+        self.baseline_median = None
+        self.change = None
+        self.p_value = None
+        self.regressed = False
+        if len(samples) >= recent_count + MIN_BASELINE:
+            baseline_values = [duration for _, duration in baseline]
+            self.baseline_median = statistics.median(baseline_values)
+            if self.baseline_median > 0:
+                self.change = self.recent_median / self.baseline_median - 1
+            _, self.p_value = mann_whitney_greater([duration for _, duration in recent], baseline_values)
+            self.regressed = (self.p_value < ALPHA and self.change is not None
+                              and self.change >= MIN_SLOWDOWN)
+
+def build_report(history, window=WINDOW):
+    """Tüm adımlar için StepReport listesi (adım adına göre)"""
+    return [StepReport(name, source, samples, window)
+            for (name, source), samples in sorted(history.samples().items())]
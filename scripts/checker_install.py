@@ -0,0 +1,76 @@
+"""
+AkılHane Checker - Bağımlılık Damgası
+node_modules'un hangi lockfile ve Node sürümüyle kurulduğunu bir damga
+dosyasında tutar; damga tutmadığında yeniden kurulum ister
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import time
+
+# node_modules içinde: klasör silinince damga da gider
+STAMP_FILE = ".akilhane-install.json"
+LOCKFILE = "package-lock.json"
+
+def node_version(toolchain):
+    """`node --version` çıktısı (Node bulunamazsa None)"""
+    node = toolchain.get("node")
+    if not node:
+        return None
+    try:
+        result = subprocess.run([node, "--version"], stdin=subprocess.DEVNULL,
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=30)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout.decode().strip() or None
+
+def lockfile_hash(project_root):
+    """package-lock.json'un sha256'sı (lockfile yoksa None)"""
+    try:
+        with open(os.path.join(project_root, LOCKFILE), "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+def current_stamp(project_root, toolchain):
+    return {"lockfile": lockfile_hash(project_root), "node": node_version(toolchain)}
+
+def read_stamp(project_root):
+    try:
+        with open(os.path.join(project_root, "node_modules", STAMP_FILE), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def write_stamp(project_root, stamp, duration):
+    """Başarılı kurulumdan sonra damgayı yaz"""
+    path = os.path.join(project_root, "node_modules", STAMP_FILE)
+    record = dict(stamp, installed_at=time.time(), duration=round(duration, 3))
+    try:
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(record, f, indent=2)
+        os.replace(path + ".tmp", path)
+    except OSError:
+        return False
+    return True
+
+def install_reason(project_root, stamp):
+    """Kurulum gerekiyorsa nedeni, node_modules güncelse None"""
+    if not os.path.isdir(os.path.join(project_root, "node_modules")):
+        return "node_modules yok"
+    recorded = read_stamp(project_root)
+    if recorded is None:
+        return "kurulum damgası yok"
+    if recorded.get("lockfile") != stamp["lockfile"]:
+        return "package-lock.json değişti"
+    if recorded.get("node") != stamp["node"]:
+        return f"Node sürümü değişti ({recorded.get('node')} -> {stamp['node']})"
+    return None
+
+def install_command(project_root):
+    """Lockfile varsa birebir kurulum (npm ci), yoksa npm install; ikisi de önce yerel npm önbelleği"""
+    if os.path.isfile(os.path.join(project_root, LOCKFILE)):
+        return "npm ci --prefer-offline"
+    return "npm install --prefer-offline"
@@ -0,0 +1,338 @@
+"""
+AkılHane Checker - Değişen Dosya ve Parçalı Lint
+git diff'ten lint edilecek dosyaları bulur; tam lint'i çekirdeklere böler
+"""
+
+import fnmatch
+import heapq
+import json
+import os
+import shlex
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from checker_cache import CACHE_DIR_NAME, cache_dir
+from checker_runner import POLL_INTERVAL, CommandCancelled, StreamResult, run_streaming
+from checker_toolchain import resolve_command
+
+# next lint'in varsayılan olarak taradığı dizinler ve lint edilen uzantılar
+LINT_DIRS = ("src", "app", "pages", "components", "lib")
+LINT_EXTENSIONS = (".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs")
+
+# Bunlardan biri değiştiyse her dosyanın sonucu değişebilir: tam lint
+FULL_LINT_TRIGGERS = (
+    ".eslintrc*",
+    "eslint.config.*",
+    ".eslintignore",
+    "package.json",
+    "package-lock.json",
+    "tsconfig.json",
+    "next.config.*",
+)
+
+# Komut satırı bu uzunluğu aşarsa (Windows sınırı ~8K) dosya listesi yerine tam lint
+MAX_COMMAND_LENGTH = 8000
+
+LINT_COMMAND = "npx next lint --fix"
+# Başka adımlar aynı kaynakları okurken dosyaları yeniden yazmayan lint
+LINT_CHECK_COMMAND = "npx next lint"
+
+# Parçalı lint: her işçi doğrudan ESLint'i çalıştırır (next lint dosya
+# bazında süre vermez). --stats dosya başına süreyi JSON'a ekler.
+ESLINT_COMMAND = "npx eslint --fix --stats --format json"
+ESLINT_CHECK_COMMAND = "npx eslint --stats --format json"
+TIMINGS_FILE = "lint-timings.json"
+
+# Lint hedefi aranırken girilmeyecek dizinler
+SKIP_DIRS = {"node_modules", ".next", "out", "dist", "build"}
+
+def _git(project_root, *args):
+    result = subprocess.run(
+        ["git", *args],
+        cwd=project_root,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.decode("utf-8", "replace").strip() or f"git {args[0]} başarısız")
+    return [path for path in os.fsdecode(result.stdout).split("\0") if path]
+
+def changed_files(project_root, base=None, staged=False):
+    """Proje köküne göre değişen dosyalar (silinenler dahil)
+
+    staged=True: sadece index'teki değişiklikler. Aksi halde çalışma ağacı
+    base ile (verilmediyse HEAD) karşılaştırılır; base bir dal ise dalın
+    ayrıldığı noktadan (merge-base) itibaren bakılır, izlenmeyen yeni
+    dosyalar da eklenir.
+    """
+    if staged:
+        return _git(project_root, "diff", "--cached", "--name-only", "--relative", "-z")
+    ref = "HEAD"
+    if base:
+        ref = _git(project_root, "merge-base", base, "HEAD")[0].strip()
+    files = _git(project_root, "diff", "--name-only", "--relative", "-z", ref)
+    files += _git(project_root, "ls-files", "--others", "--exclude-standard", "-z")
+    return sorted(set(files))
+
+def plan_lint(project_root, base=None, staged=False):
+    """(dosyalar, neden) döndür
+
+    dosyalar None ise tam lint gerekir, boş liste ise lint edilecek dosya
+    yoktur.
+    """
+    try:
+        changed = changed_files(project_root, base, staged)
+    except (OSError, RuntimeError) as e:
+        return None, f"git değişiklikleri okunamadı ({e})"
+
+    triggers = [path for path in changed
+                if any(fnmatch.fnmatch(path, pattern) for pattern in FULL_LINT_TRIGGERS)]
+    if triggers:
+        return None, f"lint yapılandırması değişti: {', '.join(triggers)}"
+
+    files = [
+        path for path in changed
+        if path.endswith(LINT_EXTENSIONS)
+        and path.split("/", 1)[0] in LINT_DIRS
+        and os.path.isfile(os.path.join(project_root, path))
+    ]
+    if len(lint_command(files)) > MAX_COMMAND_LENGTH:
+        return None, f"{len(files)} dosya komut satırına sığmıyor"
+    return files, f"{len(files)}/{len(changed)} değişen dosya lint edilecek"
+
+def lint_args(files):
+    """next lint'e verilecek --file argümanları"""
+    args = []
+    for path in files:
+        args += ["--file", path]
+    return args
+
+def lint_command(files=(), fix=True):
+    """Verilen dosyaları (boşsa tüm projeyi) lint eden komut satırı"""
+    base = LINT_COMMAND if fix else LINT_CHECK_COMMAND
+    return " ".join([base] + [shlex.quote(arg) for arg in lint_args(files)])
+
+def fixes_sources(command):
+    """Komut kaynak dosyaları yeniden yazar mı (--fix)
+
+    Böyle bir adımın sonucu düzeltilmiş ağaca aittir; önbellek anahtarı
+    komut bittikten sonra hesaplanmalıdır.
+    """
+    return "--fix" in command.split()
+
+def lint_targets(project_root):
+    """LINT_DIRS altındaki tüm lint edilebilir dosyalar (göreli, sıralı)"""
+    files = []
+    for top in LINT_DIRS:
+        for root, subdirs, filenames in os.walk(os.path.join(project_root, top)):
+            subdirs[:] = sorted(d for d in subdirs if d not in SKIP_DIRS)
+            for filename in sorted(filenames):
+                if filename.endswith(LINT_EXTENSIONS):
+                    full_path = os.path.join(root, filename)
+                    files.append(os.path.relpath(full_path, project_root).replace(os.sep, "/"))
+    return files
+
+def _timings_path(project_root):
+    return os.path.join(cache_dir(project_root), TIMINGS_FILE)
+
+def load_timings(project_root):
+    """Dosya -> son lint süresi (saniye)"""
+    try:
+        with open(_timings_path(project_root), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_timings(project_root, timings):
+    path = _timings_path(project_root)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(timings, f, indent=0, sort_keys=True)
+        os.replace(tmp_path, path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def _size(project_root, path):
+    try:
+        return os.path.getsize(os.path.join(project_root, path))
+    except OSError:
+        return 0
+
+def estimate_costs(project_root, files, timings):
+    """Dosya başına tahmini lint süresi
+
+    Geçmiş süresi olan dosyalar için o süre, olmayanlar için bilinen
+    dosyalardan çıkan saniye/bayt oranıyla boyut kullanılır.
+    """
+    sizes = {path: _size(project_root, path) for path in files}
+    known = [path for path in files if path in timings]
+    known_bytes = sum(sizes[path] for path in known)
+    rate = sum(timings[path] for path in known) / known_bytes if known_bytes else 1e-5
+    return {path: timings[path] if path in timings else sizes[path] * rate for path in files}
+
+def partition(costs, shards):
+    """En uzun iş önce (LPT): her dosyayı o an en hafif parçaya ver"""
+    buckets = [[] for _ in range(max(1, shards))]
+    heap = [(0.0, index) for index in range(len(buckets))]
+    for path in sorted(costs, key=lambda p: (-costs[p], p)):
+        load, index = heapq.heappop(heap)
+        buckets[index].append(path)
+        heapq.heappush(heap, (load + costs[path], index))
+    return [sorted(bucket) for bucket in buckets if bucket]
+
+def _chunks(files, limit=MAX_COMMAND_LENGTH):
+    """Dosyaları komut satırı sınırına sığan gruplara böl"""
+    chunk, length = [], len(ESLINT_COMMAND) + 200
+    for path in files:
+        if chunk and length + len(path) + 3 > limit:
+            yield chunk
+            chunk, length = [], len(ESLINT_COMMAND) + 200
+        chunk.append(path)
+        length += len(path) + 3
+    if chunk:
+        yield chunk
+
+def _file_time(result):
+    """--stats çıktısından dosyanın toplam lint süresi (saniye)"""
+    try:
+        return sum(p["total"] for p in result["stats"]["times"]["passes"]) / 1000.0
+    except (KeyError, TypeError):
+        return None
+
+def _run_shard(project_root, index, files, toolchain, on_line, cancel_event, deadline=None, fix=True):
+    """Bir parçayı (gerekirse birden çok ESLint çağrısıyla) çalıştır
+
+    deadline (time.monotonic) verilirse her çağrı kalan süreyle sınırlanır.
+    """
+    cache_dir(project_root, "lint-shards")
+    env = dict(os.environ, ESLINT_USE_FLAT_CONFIG="false")  # .eslintrc.js (eski biçim)
+    results, fatal, runs = [], [], []
+    for number, chunk in enumerate(_chunks(files)):
+        out_rel = f"{CACHE_DIR_NAME}/lint-shards/shard-{index}-{number}.json"
+        out_file = os.path.join(project_root, out_rel)
+        if os.path.exists(out_file):
+            # Önceki çalıştırmanın çıktısı yeni sonuç sanılmasın
+            os.remove(out_file)
+        command = " ".join([ESLINT_COMMAND if fix else ESLINT_CHECK_COMMAND, "--output-file", out_rel]
+                           + [shlex.quote(path) for path in chunk])
+        args, shell = resolve_command(command, toolchain)
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        run = run_streaming(args, cwd=project_root, shell=shell, timeout=timeout, on_line=on_line,
+                            cancel_event=cancel_event, env=env)
+        duration = run.duration
+        runs.append(run)
+        try:
+            with open(out_file, "r", encoding="utf-8") as f:
+                chunk_results = json.load(f)
+            os.remove(out_file)
+        except (OSError, ValueError):
+            fatal.append(run.stderr.strip() or f"ESLint parçası {index} çıktı üretmedi (kod {run.returncode})")
+            continue
+        # --stats yoksa parçanın süresini dosyalara boyutla paylaştır
+        total_size = sum(_size(project_root, path) for path in chunk) or 1
+        for result in chunk_results:
+            path = os.path.relpath(result["filePath"], project_root).replace(os.sep, "/")
+            spent = _file_time(result)
+            if spent is None:
+                spent = duration * _size(project_root, path) / total_size
+            result["relPath"], result["seconds"] = path, spent
+        results += chunk_results
+        if run.returncode not in (0, 1):
+            fatal.append(run.stderr.strip() or f"ESLint parçası {index} kod {run.returncode} ile bitti")
+    return results, fatal, runs
+
+def format_report(results):
+    """Birleşik, tekrarsız stylish benzeri rapor ve (hata, uyarı) sayısı"""
+    seen = set()
+    lines = []
+    errors = warnings = 0
+    for result in sorted(results, key=lambda r: r["relPath"]):
+        messages = []
+        for message in result.get("messages", []):
+            key = (result["relPath"], message.get("line"), message.get("column"),
+                   message.get("ruleId"), message.get("message"))
+            if key in seen:
+                continue
+            seen.add(key)
+            messages.append(message)
+        if not messages:
+            continue
+        lines.append(result["relPath"])
+        for message in sorted(messages, key=lambda m: (m.get("line") or 0, m.get("column") or 0)):
+            if message.get("severity") == 2 or message.get("fatal"):
+                errors += 1
+                level = "error"
+            else:
+                warnings += 1
+                level = "warning"
+            lines.append(f"  {message.get('line', 0)}:{message.get('column', 0)}  {level}  "
+                         f"{message.get('message', '')}  {message.get('ruleId') or ''}".rstrip())
+        lines.append("")
+    if errors or warnings:
+        lines.append(f"✖ {errors + warnings} sorun ({errors} hata, {warnings} uyarı)")
+    return "\n".join(lines), errors, warnings
+
+def run_sharded_lint(project_root, shards, toolchain, on_line=None, cancel_event=None, timeout=None,
+                     fix=True):
+    """Tam lint'i shards parçada paralel çalıştır, tek sonuç döndür
+
+    Parçalar dosya başına geçmiş sürelerle (yoksa boyutla) dengelenir;
+    süreler .akilhane-cache/lint-timings.json'a yazılır. Çıkış kodu:
+    hata varsa 1, bir ESLint işçisi çöktüyse 2. timeout tüm parçalar
+    için ortaktır: dolunca bütün işçiler durdurulur ve
+    subprocess.TimeoutExpired, iptalde CommandCancelled fırlatılır.
+    """
+    start_time = time.monotonic()
+    deadline = start_time + timeout if timeout is not None else None
+    files = lint_targets(project_root)
+    timings = load_timings(project_root)
+    buckets = partition(estimate_costs(project_root, files, timings), shards)
+
+    # Dış iptal veya bir parçanın zaman aşımı/hatası diğer parçaları da durdurur
+    stop = threading.Event()
+    results, fatal, runs = [], [], []
+    with ThreadPoolExecutor(max_workers=max(1, len(buckets))) as pool:
+        futures = [pool.submit(_run_shard, project_root, index, bucket, toolchain, on_line, stop,
+                               deadline, fix)
+                   for index, bucket in enumerate(buckets)]
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=POLL_INTERVAL)
+            if (cancel_event is not None and cancel_event.is_set()) or any(
+                    future.exception() is not None for future in done):
+                stop.set()
+        failures = [future.exception() for future in futures if future.exception() is not None]
+        if failures:
+            if cancel_event is not None and cancel_event.is_set():
+                raise CommandCancelled(ESLINT_COMMAND)
+            # Durdurulan parçaların CommandCancelled'ı asıl nedeni gizlemesin
+            raise next((e for e in failures if not isinstance(e, CommandCancelled)), failures[0])
+        for future in futures:
+            shard_results, shard_fatal, shard_runs = future.result()
+            results += shard_results
+            fatal += shard_fatal
+            runs += shard_runs
+
+    # Silinen dosyaların süreleri atılır
+    save_timings(project_root, {result["relPath"]: round(result["seconds"], 4) for result in results})
+
+    report, errors, _ = format_report(results)
+    report = f"{report}\n{len(files)} dosya, {len(buckets)} parça".strip()
+    if on_line:
+        for line in report.splitlines():
+            on_line("stdout", line)
+    returncode = 2 if fatal else (1 if errors else 0)
+    # Kaynak kullanımı: işçilerin CPU'su toplanır, RSS için en büyüğü alınır
+    measured = [run for run in runs if run.cpu_user is not None]
+    usage = (None, None, None)
+    if measured:
+        usage = (sum(run.cpu_user for run in measured), sum(run.cpu_sys for run in measured),
+                 max(run.max_rss_kb for run in measured))
+    return StreamResult(returncode, report, "\n".join(fatal), time.monotonic() - start_time,
+                        0, *usage)
@@ -0,0 +1,286 @@
+"""
+AkılHane Checker - Akışlı Komut Çalıştırıcı
+stdout/stderr'i geldikçe satır satır iletir, bellekte sadece son satırları tutar
+"""
+
+import codecs
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+
+# Okuma parça boyutu ve varsayılan kuyruk (tail) uzunluğu
+CHUNK_SIZE = 64 * 1024
+TAIL_LINES = 1000
+
+# Süreç bittikten sonra pipe'ı açık tutan torun süreçler için bekleme sınırı
+DRAIN_TIMEOUT = 5
+
+# İptal/zaman aşımı kontrol aralığı (saniye)
+POLL_INTERVAL = 0.1
+
+# Süreç ağacına TERM'den sonra KILL göndermeden önce tanınan süre
+KILL_GRACE = 2.0
+
+# Diske dökülen tam çıktı dosyalarından saklanacak en fazla sayı
+LOG_KEEP = 200
+
+class CommandCancelled(Exception):
+    """Komut iptal isteğiyle durduruldu"""
+
+class StreamResult:
+    """Akışlı çalıştırmanın sonucu"""
+
+    def __init__(self, returncode, stdout, stderr, duration, dropped_lines=0,
+                 cpu_user=None, cpu_sys=None, max_rss_kb=None):
+        self.returncode = returncode
+        self.stdout = stdout  # Son TAIL_LINES satır
+        self.stderr = stderr
+        self.duration = duration  # Monoton saatle duvar süresi
+        self.dropped_lines = dropped_lines  # Ring buffer'dan düşen satır sayısı
+        # Süreç ağacının kaynak kullanımı (wait4); ölçülemezse None
+        self.cpu_user = cpu_user
+        self.cpu_sys = cpu_sys
+        self.max_rss_kb = max_rss_kb
+
+class LineDecoder:
+    """Parça parça gelen baytları UTF-8 satırlarına çevirir, son satırları tutar"""
+
+    def __init__(self, name, on_line, tail_lines):
+        self.name = name
+        self.on_line = on_line
+        self.tail = deque(maxlen=tail_lines)
+        self.line_count = 0
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._pending = ""
+        self._lock = threading.Lock()
+
+    def _emit(self, line):
+        line = line.rstrip("\r")
+        with self._lock:
+            self.tail.append(line)
+            self.line_count += 1
+        if self.on_line:
+            self.on_line(self.name, line)
+
+    def feed(self, chunk):
+        self._pending += self._decoder.decode(chunk)
+        *lines, self._pending = self._pending.split("\n")
+        for line in lines:
+            self._emit(line)
+
+    def close(self):
+        """Akış bitti: yarım kalan son satırı da ilet"""
+        self._pending += self._decoder.decode(b"", final=True)
+        if self._pending:
+            self._emit(self._pending)
+            self._pending = ""
+
+    def text(self):
+        with self._lock:
+            return "\n".join(self.tail)
+
+class _StreamReader(threading.Thread):
+    """Bir pipe'ı parça parça okuyup LineDecoder'a veren thread"""
+
+    def __init__(self, name, pipe, on_line, tail_lines):
+        super().__init__(daemon=True)
+        self.name = name
+        self.pipe = pipe
+        self.lines = LineDecoder(name, on_line, tail_lines)
+
+    @property
+    def line_count(self):
+        return self.lines.line_count
+
+    def run(self):
+        read = getattr(self.pipe, "read1", self.pipe.read)
+        try:
+            while True:
+                chunk = read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                self.lines.feed(chunk)
+        except (OSError, ValueError):
+            # Pipe süreç öldürülürken kapandı
+            pass
+        self.lines.close()
+
+    def text(self):
+        return self.lines.text()
+
+class OutputLog:
+    """Komut çıktısının tamamını diske yazar; bellekte sadece kuyruk kalır
+
+    Dizinde keep adetten fazla .log varsa en eskiler silinir.
+    """
+
+    def __init__(self, directory, name, keep=LOG_KEEP):
+        self.path = os.path.join(directory, f"{name}.log")
+        self._prune(directory, keep - 1)
+        self._file = open(self.path, "w", encoding="utf-8", errors="replace")
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _prune(directory, keep):
+        logs = []
+        for entry in os.scandir(directory):
+            if entry.name.endswith(".log"):
+                try:
+                    logs.append((entry.stat().st_mtime, entry.path))
+                except OSError:
+                    pass
+        logs.sort()
+        for _, path in logs[:max(0, len(logs) - keep)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def write(self, stream, line):
+        with self._lock:
+            if not self._file.closed:
+                self._file.write(f"[stderr] {line}\n" if stream == "stderr" else f"{line}\n")
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+def _exit_code(status):
+    """wait durumunu Popen.returncode biçimine çevir (sinyal = negatif)"""
+    if hasattr(os, "waitstatus_to_exitcode"):
+        return os.waitstatus_to_exitcode(status)
+    # Python 3.8
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+def _wait(process, timeout):
+    """process.wait(timeout) gibi; POSIX'te (returncode, rusage) döndürür
+
+    os.wait4 süreci kendisi toplar, böylece çocuğun ve onun beklediği
+    torunların (shell=True'da asıl araç) CPU süresi ve en yüksek RSS'i
+    alınır. wait4 olmayan sistemlerde rusage None olur.
+    """
+    if not hasattr(os, "wait4"):
+        return process.wait(timeout=timeout), None
+    deadline = time.monotonic() + timeout
+    delay = 0.0005
+    while True:
+        try:
+            pid, status, usage = os.wait4(process.pid, os.WNOHANG)
+        except ChildProcessError:
+            # Süreç başka bir yerde toplandı
+            return process.wait(), None
+        if pid:
+            process.returncode = _exit_code(status)
+            return process.returncode, usage
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise subprocess.TimeoutExpired(process.args, timeout)
+        delay = min(delay * 2, remaining, 0.05)
+        time.sleep(delay)
+
+def _usage_fields(usage):
+    """rusage -> (cpu_user, cpu_sys, max_rss_kb)
+
+    Linux'ta çocuğun ru_maxrss'i exec öncesi ebeveyn belleğini de kapsar;
+    küçük komutlarda değer çağıran Python sürecinin RSS'inin altına inmez.
+    """
+    if usage is None:
+        return None, None, None
+    # ru_maxrss Linux'ta KB, macOS'ta bayt
+    max_rss = usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+    return usage.ru_utime, usage.ru_stime, max_rss
+
+def _group_options():
+    """Komutu kendi süreç grubunda/oturumunda başlatan Popen argümanları"""
+    if os.name == "nt":
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+def kill_tree(process, grace=KILL_GRACE):
+    """Sürecin tüm ağacını durdur (shell=True'da kabuk ve Node torunları)
+
+    POSIX'te süreç grubuna önce SIGTERM, grace saniye içinde çıkmazsa
+    SIGKILL gönderilir; Windows'ta taskkill /T /F ağacı kapatır.
+    """
+    if os.name == "nt":
+        subprocess.run(["taskkill", "/T", "/F", "/PID", str(process.pid)],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    else:
+        try:
+            os.killpg(process.pid, signal.SIGTERM)
+            process.wait(timeout=grace)
+        except (ProcessLookupError, PermissionError, subprocess.TimeoutExpired):
+            pass
+        try:
+            # Lider çıksa da gruptaki torunlar yaşıyor olabilir
+            os.killpg(process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+    if process.returncode is None:
+        process.kill()
+    process.wait()
+
+def run_streaming(command, cwd=None, shell=True, timeout=None, on_line=None,
+                  tail_lines=TAIL_LINES, cancel_event=None, env=None):
+    """Komutu çalıştır, çıktısını geldikçe on_line(stream, line) ile ilet
+
+    stream "stdout" veya "stderr" olur. Komut kendi süreç grubunda çalışır;
+    zaman aşımında, iptalde ya da Ctrl+C'de tüm ağaç durdurulur ve
+    subprocess.TimeoutExpired, cancel_event set edilirse CommandCancelled
+    fırlatılır.
+    """
+    start_time = time.monotonic()
+    process = subprocess.Popen(
+        command,
+        shell=shell,
+        cwd=cwd,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        **_group_options(),
+    )
+    readers = [
+        _StreamReader("stdout", process.stdout, on_line, tail_lines),
+        _StreamReader("stderr", process.stderr, on_line, tail_lines),
+    ]
+    for reader in readers:
+        reader.start()
+
+    try:
+        while True:
+            try:
+                returncode, usage = _wait(process, POLL_INTERVAL)
+                break
+            except subprocess.TimeoutExpired:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise CommandCancelled(command)
+                if timeout is not None and time.monotonic() - start_time > timeout:
+                    raise subprocess.TimeoutExpired(command, timeout)
+    except BaseException:
+        kill_tree(process)
+        # Öldürülen süreçten kalan çıktıyı uzun süre bekleme
+        for reader in readers:
+            reader.join(timeout=POLL_INTERVAL)
+        raise
+    # Pipe'ı açık tutan torun süreçler okuyucuları sonsuza kadar bekletmesin
+    for reader in readers:
+        reader.join(timeout=DRAIN_TIMEOUT)
+
+    duration = time.monotonic() - start_time
+    stdout_reader, stderr_reader = readers
+    dropped = sum(max(0, reader.line_count - tail_lines) for reader in readers)
+    return StreamResult(
+        returncode,
+        stdout_reader.text(),
+        stderr_reader.text(),
+        duration,
+        dropped,
+        *_usage_fields(usage),
+    )
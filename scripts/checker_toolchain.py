@@ -0,0 +1,124 @@
+"""
+AkılHane Checker - Araç Zinciri Çözümleme
+node/npm/npx yollarını PATH'ten bir kez bulur; oturumda ve diskte saklar
+"""
+
+import hashlib
+import json
+import os
+import shlex
+import shutil
+import threading
+
+from checker_cache import cache_dir
+
+TOOLS = ("node", "npm", "npx")
+
+# Bu karakterleri içeren komutlar kabuk sözdizimi kullanıyor demektir
+SHELL_CHARS = set(";&|<>$`*?(){}")
+
+# PATH'te yoksa denenecek yaygın Windows kurulum dizinleri
+WINDOWS_DIRS = (
+    r"C:\Program Files\nodejs",
+    r"C:\Program Files (x86)\nodejs",
+    os.path.join(os.getenv("APPDATA", ""), "npm"),
+    os.path.join(os.getenv("LOCALAPPDATA", ""), "Programs", "nodejs"),
+)
+
+# PATH değeri -> çözülmüş araçlar (oturum önbelleği)
+_session = {}
+_lock = threading.Lock()
+
+def _path_hash():
+    return hashlib.sha256(os.environ.get("PATH", "").encode("utf-8")).hexdigest()
+
+def _find(tool):
+    """Aracı PATH'te (Windows'ta PATHEXT ile), sonra bilinen dizinlerde ara"""
+    found = shutil.which(tool)
+    if found or os.name != "nt":
+        return found
+    for directory in WINDOWS_DIRS:
+        found = shutil.which(tool, path=directory)
+        if found:
+            return found
+    return None
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+def _load_persisted(state_file, path_hash):
+    """Disk kaydı hâlâ geçerliyse araç yollarını döndür"""
+    try:
+        with open(state_file, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if state.get("path_hash") != path_hash:
+        return None
+    tools = {}
+    for tool in TOOLS:
+        entry = state.get("tools", {}).get(tool)
+        # Bulunamayan araç sonradan PATH'teki bir dizine kurulmuş olabilir
+        if entry is None or entry["path"] is None:
+            return None
+        # Araç güncellendiyse/silindiyse yeniden çöz
+        if _mtime(entry["path"]) != entry["mtime"]:
+            return None
+        tools[tool] = entry["path"]
+    return tools
+
+def _persist(state_file, path_hash, tools):
+    state = {
+        "path_hash": path_hash,
+        "tools": {tool: {"path": path, "mtime": _mtime(path) if path else None}
+                  for tool, path in tools.items()},
+    }
+    tmp_file = state_file + ".tmp"
+    try:
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_file, state_file)
+    except OSError:
+        pass
+
+def resolve_toolchain(project_root=None):
+    """{"node": yol, "npm": yol, "npx": yol} (bulunamayanlar None)
+
+    Sonuç aynı PATH için oturum boyunca tekrar kullanılır. project_root
+    verilirse .akilhane-cache/toolchain.json dosyasına da yazılır; PATH
+    veya araçların mtime değeri değişince kayıt geçersiz sayılır. Bir
+    araç bulunamadıysa sonuç saklanmaz.
+    """
+    path_hash = _path_hash()
+    with _lock:
+        if path_hash in _session:
+            return _session[path_hash]
+
+        state_file = os.path.join(cache_dir(project_root), "toolchain.json") if project_root else None
+        tools = _load_persisted(state_file, path_hash) if state_file else None
+        if tools is None:
+            tools = {tool: _find(tool) for tool in TOOLS}
+            if not all(tools.values()):
+                # Olumsuz sonuç saklanmaz: eksik araç her çağrıda yeniden aranır
+                return tools
+            if state_file:
+                _persist(state_file, path_hash, tools)
+
+        _session[path_hash] = tools
+        return tools
+
+def resolve_command(command, toolchain):
+    """Komut satırını (argümanlar, shell) çiftine çevir
+
+    İlk kelime çözülmüş bir araçsa kabuk olmadan tam yolla çalıştırılır;
+    değilse komut olduğu gibi kabuğa bırakılır.
+    """
+    if any(char in command for char in SHELL_CHARS):
+        return command, True
+    parts = shlex.split(command, posix=os.name != "nt")
+    if parts and toolchain.get(parts[0]):
+        return [toolchain[parts[0]]] + parts[1:], False
+    return command, True
@@ -0,0 +1,120 @@
+"""
+AkılHane Checker - Adım İzleri
+Her adımın süresini, kuyrukta beklemesini ve kaynak kullanımını kaydeder;
+JSON lines ve Chrome trace (chrome://tracing, Perfetto) olarak yazar
+"""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+from checker_cache import cache_dir
+
+TRACE_DIR = "traces"
+
+class Tracer:
+    """Adım kayıtlarını toplar
+
+    Zamanlar time.monotonic() değerleridir; duvar saatine sadece yazarken
+    başlangıç anı üzerinden çevrilir.
+    """
+
+    def __init__(self):
+        self.origin = time.monotonic()
+        self.started_at = datetime.now()
+        self.spans = []
+        self._threads = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, start, end, queued=None, result=None, **fields):
+        """Bir adımı kaydet
+
+        queued: adımın başlamaya hazır olduğu an (kuyruk bekleme süresi
+        için), result: varsa StreamResult (returncode ve kaynak kullanımı).
+        """
+        span = {
+            "name": name,
+            "start": round(start - self.origin, 6),
+            "duration": round(end - start, 6),
+            "queue_wait": round(start - queued, 6) if queued is not None else None,
+            "returncode": None,
+            "cpu_user": None,
+            "cpu_sys": None,
+            "max_rss_kb": None,
+            "cpu_percent": None,
+        }
+        if result is not None:
+            span["returncode"] = result.returncode
+            span["max_rss_kb"] = getattr(result, "max_rss_kb", None)
+            cpu_user, cpu_sys = getattr(result, "cpu_user", None), getattr(result, "cpu_sys", None)
+            if cpu_user is not None:
+                span["cpu_user"], span["cpu_sys"] = round(cpu_user, 6), round(cpu_sys, 6)
+                if span["duration"] > 0:
+                    # 100'ün çok altı: adım çoğunlukla G/Ç ya da ağ bekliyor
+                    span["cpu_percent"] = round(100 * (cpu_user + cpu_sys) / span["duration"], 1)
+        span.update(fields)
+        thread = threading.current_thread()
+        with self._lock:
+            span["thread"] = self._threads.setdefault(thread.ident, (len(self._threads) + 1, thread.name))[0]
+            self.spans.append(span)
+        return span
+
+    def chrome_events(self):
+        """Chrome trace-event biçimi (mikrosaniye)"""
+        events = []
+        with self._lock:
+            spans = list(self.spans)
+            threads = dict(self._threads)
+        for tid, thread_name in threads.values():
+            events.append({"name": "thread_name", "ph": "M", "pid": 1, "tid": tid,
+                           "args": {"name": thread_name}})
+        for span in spans:
+            args = {key: value for key, value in span.items()
+                    if key not in ("name", "start", "duration", "thread") and value is not None}
+            if span["queue_wait"]:
+                events.append({
+                    "name": f"{span['name']} (kuyruk)",
+                    "cat": "queue",
+                    "ph": "X",
+                    "ts": round((span["start"] - span["queue_wait"]) * 1e6),
+                    "dur": round(span["queue_wait"] * 1e6),
+                    "pid": 1,
+                    "tid": span["thread"],
+                })
+            events.append({
+                "name": span["name"],
+                "cat": "check",
+                "ph": "X",
+                "ts": round(span["start"] * 1e6),
+                "dur": round(span["duration"] * 1e6),
+                "pid": 1,
+                "tid": span["thread"],
+                "args": args,
+            })
+        return events
+
+    def write(self, project_root, directory=None):
+        """İzleri yaz, (jsonl yolu, chrome trace yolu) döndür
+
+        directory verilmezse .akilhane-cache/traces kullanılır.
+        """
+        if directory is None:
+            directory = cache_dir(project_root, TRACE_DIR)
+        else:
+            os.makedirs(directory, exist_ok=True)
+        base = os.path.join(directory, f"trace-{self.started_at:%Y%m%d-%H%M%S}")
+        started = self.started_at.timestamp()
+
+        with open(f"{base}.jsonl", "w", encoding="utf-8") as f:
+            with self._lock:
+                spans = list(self.spans)
+            for span in spans:
+                line = dict(span, wall_start=round(started + span["start"], 3))
+                f.write(json.dumps(line, ensure_ascii=False) + "\n")
+
+        with open(f"{base}.json", "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self.chrome_events(), "displayTimeUnit": "ms"},
+                      f, ensure_ascii=False)
+        return f"{base}.jsonl", f"{base}.json"
@@ -0,0 +1,206 @@
+"""
+AkılHane Checker - Dosya İzleyici
+Kaydedilen dosyaları (Linux'ta inotify, diğerlerinde yoklama) toplu halde bildirir
+"""
+
+import ctypes
+import ctypes.util
+import fnmatch
+import os
+import select
+import struct
+import sys
+import time
+
+from checker_cache import INPUT_DIRS, INPUT_FILES, iter_input_files
+
+# Kaydetme patlamalarını birleştirme penceresi ve üst sınırı (saniye)
+DEBOUNCE = 0.5
+MAX_DELAY = 5.0
+# inotify yoksa dosya ağacını tarama aralığı
+POLL_INTERVAL = 1.0
+
+# Kontrol başına girdi kalıpları (fnmatch, proje köküne göre); None = tüm girdiler
+LINT_INPUTS = ("src/*", ".eslintrc.js", "package.json", "tsconfig.json")
+TYPECHECK_INPUTS = ("src/*", "tsconfig.json", "package.json", "next-env.d.ts")
+
+# İnotify değişikliği hangi dosyada olduğunu bilmediğinde (kuyruk taştı)
+ALL_CHANGED = "*"
+
+# Editörlerin geçici dosyaları
+IGNORED_NAMES = ("*~", ".#*", "*.swp", "*.swx", "4913")
+
+def is_affected(inputs, changed):
+    """Değişen yollardan biri kontrolün girdilerine giriyor mu"""
+    if ALL_CHANGED in changed or inputs is None:
+        return bool(changed)
+    return any(fnmatch.fnmatchcase(path, pattern) for path in changed for pattern in inputs)
+
+def _ignored(rel_path):
+    name = os.path.basename(rel_path)
+    return any(fnmatch.fnmatchcase(name, pattern) for pattern in IGNORED_NAMES)
+
+class _Inotify:
+    """libc inotify çağrıları üzerinde özyinelemeli dizin izleme"""
+
+    IN_MODIFY = 0x2
+    IN_CLOSE_WRITE = 0x8
+    IN_MOVED_FROM = 0x40
+    IN_MOVED_TO = 0x80
+    IN_CREATE = 0x100
+    IN_DELETE = 0x200
+    IN_DELETE_SELF = 0x400
+    IN_Q_OVERFLOW = 0x4000
+    IN_IGNORED = 0x8000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = os.O_NONBLOCK
+    IN_CLOEXEC = 0o2000000
+
+    MASK = (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+            | IN_CREATE | IN_DELETE | IN_DELETE_SELF)
+    EVENT = struct.Struct("iIII")
+
+    def __init__(self, project_root, dirs, files):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add = libc.inotify_add_watch
+        self._add.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+        self.fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 başarısız")
+        self.project_root = project_root
+        self.files = set(files)
+        self.watches = {}  # wd -> göreli dizin ("" = kök)
+        self._watch("", recursive=False)
+        for top in dirs:
+            if os.path.isdir(os.path.join(project_root, top)):
+                self._watch(top, recursive=True)
+
+    def _watch(self, rel_dir, recursive):
+        path = os.path.join(self.project_root, rel_dir)
+        wd = self._add(self.fd, os.fsencode(path), self.MASK)
+        if wd < 0:
+            # Dizin izlemeye başlamadan silindi ya da watch sınırı doldu
+            return
+        self.watches[wd] = rel_dir
+        if recursive:
+            try:
+                entries = list(os.scandir(path))
+            except OSError:
+                return
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    self._watch(f"{rel_dir}/{entry.name}", recursive=True)
+
+    def read(self, timeout):
+        """timeout içinde gelen olayların göreli yollarını döndür"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = self.EVENT.unpack_from(data, offset)
+            offset += self.EVENT.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+            offset += length
+            if mask & self.IN_Q_OVERFLOW:
+                changed.add(ALL_CHANGED)
+                continue
+            if mask & self.IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+            rel_dir = self.watches.get(wd)
+            if rel_dir is None or not name:
+                continue
+            rel_path = f"{rel_dir}/{name}" if rel_dir else name
+            # Kökte sadece yapılandırma dosyaları ve izlenen dizinler önemli
+            if not rel_dir and rel_path not in self.files:
+                continue
+            if mask & self.IN_ISDIR and mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                self._watch(rel_path, recursive=True)
+            changed.add(rel_path)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+class _Poller:
+    """inotify olmayan sistemler için mtime/boyut karşılaştırması"""
+
+    def __init__(self, project_root, dirs, files, interval=POLL_INTERVAL):
+        self.project_root = project_root
+        self.dirs = dirs
+        self.files = files
+        self.interval = interval
+        self.snapshot = self._scan()
+
+    def _scan(self):
+        snapshot = {}
+        for rel_path in iter_input_files(self.project_root, self.dirs, self.files):
+            try:
+                stat = os.stat(os.path.join(self.project_root, rel_path))
+            except OSError:
+                continue
+            snapshot[rel_path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def read(self, timeout):
+        time.sleep(min(self.interval, timeout) if timeout is not None else self.interval)
+        snapshot = self._scan()
+        changed = {path for path in snapshot.keys() | self.snapshot.keys()
+                   if snapshot.get(path) != self.snapshot.get(path)}
+        self.snapshot = snapshot
+        return changed
+
+    def close(self):
+        pass
+
+class FileWatcher:
+    """Girdi dosyalarını izler, kayıt patlamalarını tek bir küme olarak verir"""
+
+    def __init__(self, project_root, dirs=INPUT_DIRS, files=INPUT_FILES,
+                 debounce=DEBOUNCE, max_delay=MAX_DELAY, force_polling=False):
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.backend = None
+        if sys.platform.startswith("linux") and not force_polling:
+            try:
+                self.backend = _Inotify(project_root, dirs, files)
+            except (OSError, AttributeError):
+                self.backend = None
+        if self.backend is None:
+            self.backend = _Poller(project_root, dirs, files)
+
+    @property
+    def mode(self):
+        return "inotify" if isinstance(self.backend, _Inotify) else "polling"
+
+    def wait_for_changes(self, timeout=None):
+        """İlk değişikliği bekle, sonra debounce süresi sessizlik olana dek topla
+
+        timeout içinde değişiklik olmazsa boş küme döner.
+        """
+        deadline = time.time() + timeout if timeout is not None else None
+        changed = set()
+        while not changed:
+            remaining = None if deadline is None else deadline - time.time()
+            if remaining is not None and remaining <= 0:
+                return changed
+            changed = {path for path in self.backend.read(remaining) if not _ignored(path)}
+
+        # Sürekli kaydetmede sonsuza kadar bekleme: en fazla max_delay
+        first = time.time()
+        while time.time() - first < self.max_delay:
+            more = {path for path in self.backend.read(self.debounce) if not _ignored(path)}
+            if not more:
+                break
+            changed |= more
+        return changed
+
+    def close(self):
+        self.backend.close()
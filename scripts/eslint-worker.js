@@ -0,0 +1,77 @@
+// AkılHane Checker - Sıcak ESLint işçisi
+// checker_daemon.py tarafından başlatılır. stdin'den satır başına bir JSON
+// istek okur, aynı ESLint örneğiyle lint eder ve stdout'a tek satır JSON
+// yanıt yazar. Config ve typescript-eslint programı bellekte kalır.
+const path = require('path');
+const readline = require('readline');
+
+const projectRoot = path.resolve(process.argv[2] || process.cwd());
+const cacheLocation = path.join(projectRoot, '.akilhane-cache', 'eslintcache');
+
+// next lint varsayılan olarak bu dizinleri tarar (projede sadece src var)
+const DEFAULT_TARGETS = ['src'];
+
+// fix açık/kapalı için ayrı ESLint örnekleri
+const linters = {};
+
+async function getLinter(fix) {
+    const key = fix ? 'fix' : 'check';
+    if (!linters[key]) {
+        const eslintPath = require.resolve('eslint', { paths: [projectRoot] });
+        const eslint = require(eslintPath);
+        // Proje eski biçim .eslintrc.js kullanıyor (next lint ile aynı)
+        const ESLint = eslint.loadESLint
+            ? await eslint.loadESLint({ useFlatConfig: false })
+            : eslint.ESLint;
+        const linter = new ESLint({ cwd: projectRoot, fix, cache: true, cacheLocation });
+        linters[key] = { ESLint, linter, formatter: await linter.loadFormatter('stylish') };
+    }
+    return linters[key];
+}
+
+async function handle(request) {
+    const startTime = Date.now();
+    const { ESLint, linter, formatter } = await getLinter(Boolean(request.fix));
+    const targets = request.files && request.files.length ? request.files : DEFAULT_TARGETS;
+    const results = await linter.lintFiles(targets);
+    if (request.fix) {
+        await ESLint.outputFixes(results);
+    }
+
+    let errorCount = 0;
+    let warningCount = 0;
+    for (const result of results) {
+        errorCount += result.errorCount;
+        warningCount += result.warningCount;
+    }
+    return {
+        id: request.id,
+        ok: true,
+        errorCount,
+        warningCount,
+        output: formatter.format(results),
+        duration: (Date.now() - startTime) / 1000,
+    };
+}
+
+function reply(message) {
+    process.stdout.write(`${JSON.stringify(message)}\n`);
+}
+
+// İstekler sırayla işlenir; aynı dosyaya iki --fix aynı anda yazmasın
+let queue = Promise.resolve();
+
+readline.createInterface({ input: process.stdin }).on('line', (line) => {
+    if (!line.trim()) {
+        return;
+    }
+    queue = queue.then(async () => {
+        let request = {};
+        try {
+            request = JSON.parse(line);
+            reply(await handle(request));
+        } catch (error) {
+            reply({ id: request.id, ok: false, error: String(error && error.stack ? error.stack : error) });
+        }
+    });
+});
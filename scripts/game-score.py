@@ -4,80 +4,647 @@
 Tracks XP, achievements, and mission completion
 """
 
+import argparse
 import json
 import os
-from datetime import datetime
-from typing import Dict, List, Optional
+import sqlite3
+import sys
+import tempfile
+from bisect import bisect_right
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Set
 
-class GameScoreTracker:
-    def __init__(self, score_file: str = "game-scores.json"):
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+class FileLock:
+    """Re-entrant cross-process advisory lock on a sidecar file"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self._depth = 0
+
+    def acquire(self):
+        if self._depth == 0:
+            self._file = open(self.path, 'a+b')
+            if os.name == "nt":
+                self._file.seek(0)
+                while True:
+                    try:
+                        msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        # LK_LOCK gives up after ~10s; keep waiting
+                        continue
+            else:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        self._depth += 1
+
+    def release(self):
+        self._depth -= 1
+        if self._depth == 0:
+            if os.name == "nt":
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+class AchievementRule:
+    """Unlocks `name` (+xp) once `counter` reaches `threshold`
+
+    Counters: "missions_completed", "total_xp", "daily_streak" (consecutive
+    days with a mission) and "mission:<name>" (completions of one mission).
+    """
+
+    def __init__(self, name: str, counter: str, threshold: int, xp: int):
+        self.name = name
+        self.counter = counter
+        self.threshold = threshold
+        self.xp = xp
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "AchievementRule":
+        return cls(data["name"], data["counter"], data["threshold"], data["xp"])
+
+DEFAULT_ACHIEVEMENTS = [
+    {"name": "First Mission", "counter": "missions_completed", "threshold": 1, "xp": 50},
+    {"name": "Code Quality Master", "counter": "missions_completed", "threshold": 10, "xp": 200},
+    {"name": "Type Safety Expert", "counter": "missions_completed", "threshold": 20, "xp": 300},
+    {"name": "Build Master", "counter": "missions_completed", "threshold": 30, "xp": 400},
+    {"name": "AI Integration Expert", "counter": "missions_completed", "threshold": 50, "xp": 500},
+    {"name": "Deployment Hero", "counter": "missions_completed", "threshold": 100, "xp": 1000},
+]
+
+class AchievementEngine:
+    """Achievement rules compiled once and indexed by the counter they watch
+
+    Rules per counter are sorted by threshold and a cursor marks the first
+    rule not yet reached, so an update only looks at rules whose threshold
+    the counter actually crossed. Counters never need to go back below a
+    passed threshold because unlocks are permanent.
+    """
+
+    def __init__(self, rules: Iterable = DEFAULT_ACHIEVEMENTS):
+        self.unlocked: Set[str] = set()
+        self._rules: Dict[str, List[AchievementRule]] = {}
+        self._thresholds: Dict[str, List[int]] = {}
+        self._cursor: Dict[str, int] = {}
+        for rule in rules:
+            self.register(rule if isinstance(rule, AchievementRule) else AchievementRule.from_dict(rule))
+
+    def register(self, rule: AchievementRule):
+        """Add a rule; it is evaluated on the next update of its counter"""
+        rules = self._rules.setdefault(rule.counter, [])
+        rules.append(rule)
+        rules.sort(key=lambda r: r.threshold)
+        self._thresholds[rule.counter] = [r.threshold for r in rules]
+        self._cursor[rule.counter] = 0
+
+    def update(self, counter: str, value: int) -> List[AchievementRule]:
+        """Advance a counter and return the rules it newly unlocked"""
+        rules = self._rules.get(counter)
+        if not rules:
+            return []
+        start = self._cursor[counter]
+        end = bisect_right(self._thresholds[counter], value, lo=start)
+        if end == start:
+            return []
+        self._cursor[counter] = end
+        return [rule for rule in rules[start:end] if rule.name not in self.unlocked]
+
+def empty_scores() -> Dict:
+    """Initial state of a fresh tracker"""
+    return {
+        "total_xp": 0,
+        "missions_completed": 0,
+        "achievements": [],
+        "history": [],
+        "level": 1,
+        "journal_seq": 0
+    }
+
+def apply_event(scores: Dict, event: Dict):
+    """Apply one journal event to the score state (the only place state changes)"""
+    kind = event["type"]
+    if kind == "mission":
+        scores["total_xp"] += event["xp_earned"]
+        scores["missions_completed"] += 1
+        # Storage engines that query history on demand keep no "history" list
+        if "history" in scores:
+            scores["history"].append({
+                "timestamp": event["timestamp"],
+                "mission": event["mission"],
+                "xp_earned": event["xp_earned"],
+                "details": event["details"]
+            })
+    elif kind == "level":
+        scores["level"] = event["level"]
+    elif kind == "achievement":
+        scores["achievements"].append(event["name"])
+        scores["total_xp"] += event["xp"]
+    scores["journal_seq"] = event["seq"]
+
+class JournalStorage:
+    """Snapshot file plus an append-only JSONL event journal
+
+    Every change is appended to the journal as one line, so a write costs
+    O(1) regardless of history length. The snapshot (the classic
+    game-scores.json) is rewritten only when the journal grows past a
+    fraction of the history, which keeps the amortized write cost constant
+    and bounds how much journal a load has to replay.
+    """
+
+    def __init__(self, score_file: str, compact_min: int = 1000, compact_ratio: float = 0.25):
         self.score_file = score_file
-        self.scores = self.load_scores()
-    
-    def load_scores(self) -> Dict:
-        """Load existing scores from file"""
-        if os.path.exists(self.score_file):
+        self.journal_file = os.path.splitext(score_file)[0] + ".journal.jsonl"
+        self.compact_min = compact_min
+        self.compact_ratio = compact_ratio
+        self.journal_events = 0
+        self.scores: Optional[Dict] = None
+        # Where our view of the files ends, to pick up other writers' events
+        self._journal_offset = 0
+        self._snapshot_id = None
+
+    def _snapshot_signature(self):
+        try:
+            stat = os.stat(self.score_file)
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    def load(self) -> Dict:
+        """Rebuild state from snapshot plus journal tail"""
+        scores = empty_scores()
+        self._snapshot_id = self._snapshot_signature()
+        if self._snapshot_id is not None:
             try:
                 with open(self.score_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                pass
+                    scores.update(json.load(f))
+            except ValueError as e:
+                # Never fall back to zero scores: the next save would wipe the real ones
+                raise ValueError(f"Corrupt score file {self.score_file}: {e}") from e
+
+        self.journal_events = 0
+        self._journal_offset = 0
+        for event in self._read_journal():
+            if event["seq"] > scores["journal_seq"]:
+                apply_event(scores, event)
+        # The tracker mutates this same dict; queries below read from it
+        self.scores = scores
+        return scores
+
+    def _read_journal(self) -> List[Dict]:
+        """Read complete journal lines past the current offset"""
+        if not os.path.exists(self.journal_file):
+            return []
+        with open(self.journal_file, 'rb') as f:
+            f.seek(self._journal_offset)
+            data = f.read()
+        events = []
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            try:
+                events.append(json.loads(line))
+            except ValueError:
+                # Torn line from an interrupted write
+                continue
+        self._journal_offset += end
+        self.journal_events += len(events)
+        return events
+
+    def catch_up(self, scores: Dict) -> Optional[List[Dict]]:
+        """Events other processes added since our last read, or None to reload"""
+        if self._snapshot_signature() != self._snapshot_id:
+            return None
+        size = os.path.getsize(self.journal_file) if os.path.exists(self.journal_file) else 0
+        if size < self._journal_offset:
+            return None
+        return [event for event in self._read_journal() if event["seq"] > scores["journal_seq"]]
+
+    def append(self, events: List[Dict]):
+        """Append events to the journal"""
+        data = "".join(json.dumps(event, ensure_ascii=False, separators=(',', ':')) + "\n"
+                       for event in events).encode('utf-8')
+        with open(self.journal_file, 'ab') as f:
+            # Terminate a torn line left by a crashed writer so ours stays parseable
+            if f.tell() > self._journal_offset:
+                data = b"\n" + data
+            f.write(data)
+            self._journal_offset = f.tell()
+        self.journal_events += len(events)
+
+    def needs_compaction(self, scores: Dict) -> bool:
+        return self.journal_events >= max(self.compact_min,
+                                          len(scores["history"]) * self.compact_ratio)
+
+    def compact(self, scores: Dict):
+        """Atomically write a full snapshot, then drop the journal it covers"""
+        directory = os.path.dirname(os.path.abspath(self.score_file))
+        fd, tmp_file = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(scores, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.score_file)
+        except BaseException:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            raise
+        # A crash before this truncate is harmless: replay skips seq <= journal_seq
+        open(self.journal_file, 'w').close()
+        self.journal_events = 0
+        self._journal_offset = 0
+        self._snapshot_id = self._snapshot_signature()
+
+    def recent_missions(self, limit: int) -> List[Dict]:
+        return self.scores["history"][-limit:] if limit > 0 else []
+
+    def mission_xp_totals(self) -> Dict[str, int]:
+        totals: Dict[str, int] = {}
+        for entry in self.scores["history"]:
+            totals[entry["mission"]] = totals.get(entry["mission"], 0) + entry["xp_earned"]
+        return totals
+
+    def missions_between(self, start: str, end: str) -> List[Dict]:
+        return [entry for entry in self.scores["history"] if start <= entry["timestamp"] < end]
+
+    def mission_counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for entry in self.scores["history"]:
+            counts[entry["mission"]] = counts.get(entry["mission"], 0) + 1
+        return counts
+
+    def iter_timestamps_desc(self) -> Iterator[str]:
+        # History is in insertion order; backfilled missions land at the end
+        yield from sorted((entry["timestamp"] for entry in self.scores["history"]), reverse=True)
+
+class SQLiteStorage:
+    """SQLite storage engine with indexed mission history
+
+    Totals and achievements are loaded at startup; the mission history
+    stays on disk and is only touched through indexed queries. On first
+    open an existing JSON snapshot (and its journal) is migrated.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS missions (
+            id INTEGER PRIMARY KEY,
+            timestamp TEXT NOT NULL,
+            mission TEXT NOT NULL,
+            xp_earned INTEGER NOT NULL,
+            details TEXT NOT NULL DEFAULT ''
+        );
+        CREATE INDEX IF NOT EXISTS idx_missions_timestamp ON missions(timestamp);
+        CREATE INDEX IF NOT EXISTS idx_missions_mission ON missions(mission, xp_earned);
+        CREATE TABLE IF NOT EXISTS achievements (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE,
+            xp INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS totals (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            total_xp INTEGER NOT NULL,
+            missions_completed INTEGER NOT NULL,
+            level INTEGER NOT NULL,
+            journal_seq INTEGER NOT NULL
+        );
+    """
+
+    def __init__(self, db_file: str, migrate_from: Optional[str] = None):
+        self.db_file = db_file
+        self.migrate_from = migrate_from
+        self.conn = sqlite3.connect(db_file, timeout=60)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(self.SCHEMA)
+        self._last_mission_id = 0
+        self._last_achievement_id = 0
+
+    def load(self) -> Dict:
+        """Load totals and achievements (not the history)"""
+        row = self.conn.execute("SELECT * FROM totals WHERE id = 1").fetchone()
+        if row is None:
+            self._initialize()
+            row = self.conn.execute("SELECT * FROM totals WHERE id = 1").fetchone()
+        self._last_mission_id = self.conn.execute("SELECT COALESCE(MAX(id), 0) FROM missions").fetchone()[0]
+        self._last_achievement_id = self.conn.execute(
+            "SELECT COALESCE(MAX(id), 0) FROM achievements").fetchone()[0]
         return {
-            "total_xp": 0,
-            "missions_completed": 0,
-            "achievements": [],
-            "history": [],
-            "level": 1
+            "total_xp": row["total_xp"],
+            "missions_completed": row["missions_completed"],
+            "achievements": [r["name"] for r in
+                             self.conn.execute("SELECT name FROM achievements ORDER BY id")],
+            "level": row["level"],
+            "journal_seq": row["journal_seq"]
         }
+
+    def _initialize(self):
+        """Create the totals row, migrating a JSON score file if there is one"""
+        scores = empty_scores()
+        if self.migrate_from and os.path.exists(self.migrate_from):
+            scores = JournalStorage(self.migrate_from).load()
+            print(f"📦 Migrating {len(scores['history'])} missions from {self.migrate_from} to {self.db_file}")
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO missions (timestamp, mission, xp_earned, details) VALUES (?, ?, ?, ?)",
+                ((e["timestamp"], e["mission"], e["xp_earned"], e.get("details", ""))
+                 for e in scores["history"]))
+            # Achievement XP is already part of total_xp; per-row XP is informational
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO achievements (name, xp) VALUES (?, 0)",
+                ((name,) for name in scores["achievements"]))
+            self.conn.execute(
+                "INSERT INTO totals (id, total_xp, missions_completed, level, journal_seq) "
+                "VALUES (1, ?, ?, ?, ?)",
+                (scores["total_xp"], scores["missions_completed"], scores["level"], scores["journal_seq"]))
+
+    def catch_up(self, scores: Dict) -> Optional[List[Dict]]:
+        """Rows other processes added since our last read, as events"""
+        totals = self.conn.execute("SELECT level, journal_seq FROM totals WHERE id = 1").fetchone()
+        seq = totals["journal_seq"]
+        events = []
+        for row in self.conn.execute(
+                "SELECT id, timestamp, mission, xp_earned, details FROM missions WHERE id > ? ORDER BY id",
+                (self._last_mission_id,)):
+            events.append({"type": "mission", "timestamp": row["timestamp"], "mission": row["mission"],
+                           "xp_earned": row["xp_earned"], "details": row["details"], "seq": seq})
+            self._last_mission_id = row["id"]
+        for row in self.conn.execute(
+                "SELECT id, name, xp FROM achievements WHERE id > ? ORDER BY id",
+                (self._last_achievement_id,)):
+            events.append({"type": "achievement", "name": row["name"], "xp": row["xp"], "seq": seq})
+            self._last_achievement_id = row["id"]
+        if totals["level"] != scores["level"]:
+            events.append({"type": "level", "level": totals["level"], "seq": seq})
+        return events
+
+    def append(self, events: List[Dict]):
+        """Apply events in a single transaction"""
+        with self.conn:
+            for event in events:
+                kind = event["type"]
+                if kind == "mission":
+                    self._last_mission_id = self.conn.execute(
+                        "INSERT INTO missions (timestamp, mission, xp_earned, details) VALUES (?, ?, ?, ?)",
+                        (event["timestamp"], event["mission"], event["xp_earned"], event["details"])).lastrowid
+                    self.conn.execute(
+                        "UPDATE totals SET total_xp = total_xp + ?, missions_completed = missions_completed + 1 "
+                        "WHERE id = 1", (event["xp_earned"],))
+                elif kind == "level":
+                    self.conn.execute("UPDATE totals SET level = ? WHERE id = 1", (event["level"],))
+                elif kind == "achievement":
+                    self._last_achievement_id = self.conn.execute(
+                        "INSERT INTO achievements (name, xp) VALUES (?, ?)",
+                        (event["name"], event["xp"])).lastrowid
+                    self.conn.execute("UPDATE totals SET total_xp = total_xp + ? WHERE id = 1",
+                                      (event["xp"],))
+                self.conn.execute("UPDATE totals SET journal_seq = ? WHERE id = 1", (event["seq"],))
+
+    def needs_compaction(self, scores: Dict) -> bool:
+        return False
+
+    def compact(self, scores: Dict):
+        """Every append is already committed; nothing to snapshot"""
+
+    def recent_missions(self, limit: int) -> List[Dict]:
+        rows = self.conn.execute(
+            "SELECT timestamp, mission, xp_earned, details FROM missions ORDER BY id DESC LIMIT ?",
+            (limit,)).fetchall()
+        return [dict(row) for row in reversed(rows)]
+
+    def mission_xp_totals(self) -> Dict[str, int]:
+        return {row["mission"]: row["xp"] for row in self.conn.execute(
+            "SELECT mission, SUM(xp_earned) AS xp FROM missions GROUP BY mission")}
+
+    def missions_between(self, start: str, end: str) -> List[Dict]:
+        return [dict(row) for row in self.conn.execute(
+            "SELECT timestamp, mission, xp_earned, details FROM missions "
+            "WHERE timestamp >= ? AND timestamp < ? ORDER BY timestamp", (start, end))]
+
+    def mission_counts(self) -> Dict[str, int]:
+        return {row["mission"]: row["count"] for row in self.conn.execute(
+            "SELECT mission, COUNT(*) AS count FROM missions GROUP BY mission")}
+
+    def iter_timestamps_desc(self) -> Iterator[str]:
+        for row in self.conn.execute("SELECT timestamp FROM missions ORDER BY timestamp DESC"):
+            yield row["timestamp"]
+
+class GameScoreTracker:
+    def __init__(self, score_file: str = "game-scores.json", backend: str = "json",
+                 achievements: Optional[Iterable] = None):
+        self.score_file = score_file
+        if backend == "sqlite":
+            # game-scores.json -> game-scores.db, migrated on first use
+            self.storage = SQLiteStorage(os.path.splitext(score_file)[0] + ".db", migrate_from=score_file)
+        elif backend == "json":
+            self.storage = JournalStorage(score_file)
+        else:
+            raise ValueError(f"Unknown storage backend: {backend}")
+        # Serializes read-modify-write cycles across processes (CI jobs)
+        self._lock = FileLock(os.path.splitext(score_file)[0] + ".lock")
+        with self._lock:
+            self.scores = self.load_scores()
+        self._pending: List[Dict] = []
+        self._batch_depth = 0
+        self.achievements = AchievementEngine(DEFAULT_ACHIEVEMENTS if achievements is None else achievements)
+        self._load_counters()
     
-    def save_scores(self):
-        """Save scores to file"""
-        with open(self.score_file, 'w', encoding='utf-8') as f:
-            json.dump(self.scores, f, indent=2, ensure_ascii=False)
-    
-    def add_xp(self, xp: int, mission: str, details: str = ""):
-        """Add XP for completed mission"""
-        self.scores["total_xp"] += xp
-        self.scores["missions_completed"] += 1
-        
-        # Add to history
-        history_entry = {
-            "timestamp": datetime.now().isoformat(),
-            "mission": mission,
-            "xp_earned": xp,
-            "details": details
+    def _load_counters(self):
+        """Derive achievement counters from stored state (once per session)"""
+        self.achievements.unlocked = set(self.scores["achievements"])
+        self.counters: Dict[str, int] = {
+            "missions_completed": self.scores["missions_completed"],
+            "total_xp": self.scores["total_xp"],
         }
-        self.scores["history"].append(history_entry)
+        for mission, count in self.storage.mission_counts().items():
+            self.counters["mission:" + mission] = count
+        
+        # Walk mission days backwards until the first gap
+        self._last_day: Optional[date] = None
+        streak = 0
+        for timestamp in self.storage.iter_timestamps_desc():
+            day = datetime.fromisoformat(timestamp).date()
+            if self._last_day is None:
+                self._last_day = day
+                streak = 1
+                expected = day
+            if day == expected:
+                continue
+            if day != expected - timedelta(days=1):
+                break
+            streak += 1
+            expected = day
+        self.counters["daily_streak"] = streak
         
+        # Everything is evaluated once on the first update, as before
+        self._dirty: Set[str] = set(self.counters)
+    
+    def _bump_counters(self, event: Dict):
+        """Keep counters in step with an applied event"""
+        if event["type"] == "mission":
+            key = "mission:" + event["mission"]
+            self.counters[key] = self.counters.get(key, 0) + 1
+            self._dirty.update((key, "missions_completed", "total_xp"))
+            
+            day = datetime.fromisoformat(event["timestamp"]).date()
+            # Backfilled missions older than the last active day don't move the streak
+            if self._last_day is None or day > self._last_day:
+                if self._last_day is not None and day == self._last_day + timedelta(days=1):
+                    self.counters["daily_streak"] += 1
+                else:
+                    self.counters["daily_streak"] = 1
+                self._last_day = day
+                self._dirty.add("daily_streak")
+        elif event["type"] == "achievement":
+            self.achievements.unlocked.add(event["name"])
+            self._dirty.add("total_xp")
+        self.counters["missions_completed"] = self.scores["missions_completed"]
+        self.counters["total_xp"] = self.scores["total_xp"]
+    
+    def load_scores(self) -> Dict:
+        """Load existing scores from snapshot and journal"""
+        return self.storage.load()
+    
+    def save_scores(self):
+        """Save a full snapshot of the scores"""
+        with self._lock:
+            # Don't overwrite what other processes journaled since we last looked
+            self._sync()
+            self.storage.compact(self.scores)
+    
+    def _sync(self):
+        """Pick up changes other processes made since we last looked (lock held)"""
+        events = self.storage.catch_up(self.scores)
+        if events is None:
+            # Another process compacted the snapshot: rebuild from disk
+            self.scores = self.load_scores()
+            self._load_counters()
+            return
+        for event in events:
+            apply_event(self.scores, event)
+            self._bump_counters(event)
+    
+    def record(self, event: Dict):
+        """Apply an event in memory and queue it for the journal"""
+        event["seq"] = self.scores["journal_seq"] + 1
+        apply_event(self.scores, event)
+        self._bump_counters(event)
+        self._pending.append(event)
+    
+    def flush(self):
+        """Persist queued events, compacting the journal when it grew large"""
+        if self._pending:
+            self.storage.append(self._pending)
+            self._pending = []
+        if self.storage.needs_compaction(self.scores):
+            self.save_scores()
+    
+    def recent_missions(self, limit: int = 3) -> List[Dict]:
+        """Most recent missions, oldest first"""
+        return self.storage.recent_missions(limit)
+    
+    def mission_xp_totals(self) -> Dict[str, int]:
+        """Total XP earned per mission name"""
+        return self.storage.mission_xp_totals()
+    
+    def missions_between(self, start: str, end: str) -> List[Dict]:
+        """Missions with start <= timestamp < end (ISO 8601 strings)"""
+        return self.storage.missions_between(start, end)
+    
+    @contextmanager
+    def batch(self):
+        """Group missions: levels, achievements, persistence and output run once at the end
+
+        The outermost batch holds the score file lock and starts by catching
+        up with other writers, so concurrent processes never lose updates.
+        """
+        outermost = self._batch_depth == 0
+        if outermost:
+            self._lock.acquire()
+            try:
+                self._sync()
+            except BaseException:
+                self._lock.release()
+                raise
+        self._batch_depth += 1
+        start_xp = self.scores["total_xp"]
+        start_missions = self.scores["missions_completed"]
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if outermost:
+                missions = self.scores["missions_completed"] - start_missions
+                try:
+                    self._settle()
+                finally:
+                    self._lock.release()
+                if missions > 1:
+                    print(f"\n📦 Batch complete: {missions} missions, "
+                          f"+{self.scores['total_xp'] - start_xp} XP")
+                if missions:
+                    self.display_score()
+    
+    def _settle(self):
+        """Evaluate level and achievements, then persist everything queued"""
         # Check for level up
         new_level = (self.scores["total_xp"] // 1000) + 1
         if new_level > self.scores["level"]:
-            self.scores["level"] = new_level
+            self.record({"type": "level", "level": new_level})
             print(f"🎉 LEVEL UP! You are now level {new_level}!")
         
         # Check for achievements
         self.check_achievements()
         
-        self.save_scores()
-        self.display_score()
+        self.flush()
+    
+    def add_xp(self, xp: int, mission: str, details: str = "", timestamp: Optional[str] = None):
+        """Add XP for completed mission"""
+        with self.batch():
+            self.record({
+                "type": "mission",
+                "timestamp": timestamp or datetime.now().isoformat(),
+                "mission": mission,
+                "xp_earned": xp,
+                "details": details
+            })
+    
+    def add_many(self, events: Iterable[Dict]) -> int:
+        """Add a whole iterable of missions as one batch
+
+        Each event needs "xp" and "mission" (or "name"); "details" and an
+        ISO "timestamp" (for backfills) are optional.
+        """
+        count = 0
+        with self.batch():
+            for event in events:
+                self.add_xp(event["xp"], event.get("mission") or event["name"],
+                            event.get("details", ""), event.get("timestamp"))
+                count += 1
+        return count
     
     def check_achievements(self):
-        """Check for new achievements"""
-        achievements = [
-            {"name": "First Mission", "condition": lambda: self.scores["missions_completed"] >= 1, "xp": 50},
-            {"name": "Code Quality Master", "condition": lambda: self.scores["missions_completed"] >= 10, "xp": 200},
-            {"name": "Type Safety Expert", "condition": lambda: self.scores["missions_completed"] >= 20, "xp": 300},
-            {"name": "Build Master", "condition": lambda: self.scores["missions_completed"] >= 30, "xp": 400},
-            {"name": "AI Integration Expert", "condition": lambda: self.scores["missions_completed"] >= 50, "xp": 500},
-            {"name": "Deployment Hero", "condition": lambda: self.scores["missions_completed"] >= 100, "xp": 1000},
-        ]
-        
-        for achievement in achievements:
-            if (achievement["name"] not in self.scores["achievements"] and 
-                achievement["condition"]()):
-                self.scores["achievements"].append(achievement["name"])
-                self.scores["total_xp"] += achievement["xp"]
-                print(f"🏆 ACHIEVEMENT UNLOCKED: {achievement['name']} (+{achievement['xp']} XP)")
+        """Unlock achievements whose watched counters changed"""
+        while self._dirty:
+            changed, self._dirty = self._dirty, set()
+            for counter in changed:
+                for rule in self.achievements.update(counter, self.counters.get(counter, 0)):
+                    # Awarded XP marks total_xp dirty again, so chained unlocks follow
+                    self.record({"type": "achievement", "name": rule.name, "xp": rule.xp})
+                    print(f"🏆 ACHIEVEMENT UNLOCKED: {rule.name} (+{rule.xp} XP)")
     
     def display_score(self):
         """Display current score and stats"""
@@ -93,16 +660,32 @@ class GameScoreTracker:
             for achievement in self.scores["achievements"]:
                 print(f"  ✅ {achievement}")
         
-        if self.scores["history"]:
+        recent = self.recent_missions(3)
+        if recent:
             print(f"\n📜 Recent Missions:")
-            for entry in self.scores["history"][-3:]:
+            for entry in recent:
                 print(f"  🎯 {entry['mission']} (+{entry['xp_earned']} XP)")
         
         print("=" * 40)
 
 def main():
     """Main function for game score tracking"""
-    tracker = GameScoreTracker()
+    parser = argparse.ArgumentParser(description="AkılHane CI/CD Game Score Tracker")
+    parser.add_argument("--score-file", default="game-scores.json",
+                        help="Score file (the SQLite backend uses the same name with .db)")
+    parser.add_argument("--backend", choices=["json", "sqlite"], default="json",
+                        help="Storage engine; sqlite migrates the JSON score file on first use")
+    parser.add_argument("--ingest", metavar="FILE",
+                        help="Add missions from a JSON lines file ('-' for stdin) as one batch")
+    args = parser.parse_args()
+    
+    tracker = GameScoreTracker(args.score_file, backend=args.backend)
+    
+    if args.ingest:
+        source = sys.stdin if args.ingest == "-" else open(args.ingest, 'r', encoding='utf-8')
+        with source:
+            tracker.add_many(json.loads(line) for line in source if line.strip())
+        return
     
     # Example usage
     print("🎮 AkılHane CI/CD Game Score Tracker")